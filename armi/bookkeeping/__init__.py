@@ -80,6 +80,7 @@ class BookkeepingPlugin(plugins.ArmiPlugin):
         """
         from armi import mpiActions
         from armi.bookkeeping import memoryProfiler
+        from armi.bookkeeping.report import reportInterface
 
         if isinstance(cmd, mpiActions.MpiAction):
             for donotReset in (
@@ -87,6 +88,7 @@ class BookkeepingPlugin(plugins.ArmiPlugin):
                 mpiActions.DistributionAction,
                 memoryProfiler.PrintSystemMemoryUsageAction,
                 memoryProfiler.ProfileMemoryUsageAction,
+                reportInterface.GatherTimerTreesAction,
             ):
                 if isinstance(cmd, donotReset):
                     return False
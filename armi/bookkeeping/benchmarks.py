@@ -0,0 +1,446 @@
+# Copyright 2026 TerraPower, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+A suite of performance benchmarks over the test reactors that ship with ARMI.
+
+Each benchmark scenario times one of the expensive operations of a run (building the reactor,
+writing and loading the database, the uniform mesh conversion, and so on) on the ``armiRun`` test
+reactor. The reactor can be made bigger by adding rings of copies of its outer assemblies, to see
+how an operation scales with the size of the core.
+
+A scenario has an untimed setup, which builds whatever the operation needs, and a timed body. Each
+repetition gets a fresh setup, so scenarios are free to change the reactor. Every repetition
+records its wall-clock and CPU time, and how much it grew the peak resident memory of the process.
+With ``traceMemory``, one more repetition is run under :py:mod:`tracemalloc` to record the peak of
+the memory allocated by Python during the body. It is kept apart from the timed repetitions, since
+tracing slows the body down.
+
+Results are written as JSON or CSV, with the ARMI and Python versions and the platform, so they can
+be kept and compared across releases.
+
+Examples
+--------
+>>> results = runBenchmarks(["writeDatabase", "loadDatabase"], scale=2, repeat=3)
+>>> results.writeJSON("benchmarks.json")
+
+See Also
+--------
+armi.cli.benchmark : the ``benchmark`` entry point, which runs this suite.
+armi.bookkeeping.telemetry : the measurements of the interface interactions of a real run.
+"""
+
+import collections
+import copy
+import csv
+import datetime
+import json
+import os
+import pickle
+import platform
+import time
+import tracemalloc
+from typing import Callable, Dict, List
+
+import numpy as np
+
+from armi import runLog
+from armi.bookkeeping.telemetry import getPeakRssMB
+from armi.meta import __version__ as version
+
+COLUMNS = ("scenario", "scale", "repetition", "wallTime", "cpuTime", "peakRssDeltaMB")
+SUMMARY_COLUMNS = ("scenario", "scale", "repetitions", "minWallTime", "medianWallTime", "medianCpuTime", "peakAllocMB")
+
+MATERIAL_PROPERTIES = ("linearExpansionPercent", "density", "thermalConductivity", "heatCapacity")
+
+Scenario = collections.namedtuple("Scenario", ["name", "description", "setup"])
+"""A benchmark: ``setup(context)`` builds what the body needs, and returns the body to time."""
+
+SCENARIOS: Dict[str, Scenario] = {}
+
+
+def scenario(name: str, description: str):
+    """Register a function as the setup of a benchmark scenario."""
+
+    def register(setup):
+        SCENARIOS[name] = Scenario(name, description, setup)
+        return setup
+
+    return register
+
+
+class BenchmarkContext:
+    """
+    What the scenarios share: the scale, and a way to build a fresh, scaled test reactor.
+
+    Parameters
+    ----------
+    scale : int
+        The number of rings of assemblies to add around the core of the test reactor
+    workDir : str
+        A folder where scenarios can write files
+    """
+
+    def __init__(self, scale: int = 0, workDir: str = "."):
+        self.scale = scale
+        self.workDir = workDir
+        self._cs = None
+
+    @property
+    def cs(self):
+        """The settings of the test reactor."""
+        if self._cs is None:
+            from armi import settings
+            from armi.tests import ARMI_RUN_PATH
+
+            self._cs = settings.Settings(ARMI_RUN_PATH)
+        return self._cs
+
+    def buildReactor(self):
+        """Build the test reactor from its inputs, with the extra rings of this context."""
+        from armi.reactor import reactors
+
+        r = reactors.loadFromCs(self.cs)
+        addReplicatedRings(r, self.scale)
+        return r
+
+
+def addReplicatedRings(r, numRings: int):
+    """
+    Add rings of assemblies around the core, copied from the assemblies of its outermost ring.
+
+    The copies keep the symmetry of the core: only positions in the modeled part of the core get an
+    assembly.
+
+    Parameters
+    ----------
+    r : Reactor
+        The reactor to grow
+    numRings : int
+        The number of rings to add
+
+    Returns
+    -------
+    int
+        The number of assemblies added
+    """
+    if numRings <= 0:
+        return 0
+
+    core = r.core
+    grid = core.spatialGrid
+    outerRing = core.getNumRings()
+    templates = [a for a in core if grid.getRingPos(a.spatialLocator.getCompleteIndices())[0] == outerRing]
+
+    numAdded = 0
+    for ring in range(outerRing + 1, outerRing + numRings + 1):
+        for pos in range(1, grid.getPositionsInRing(ring) + 1):
+            i, j = grid.getIndicesFromRingAndPos(ring, pos)
+            loc = grid[i, j, 0]
+            if not grid.locatorInDomain(loc, symmetryOverlap=False):
+                continue
+            a = copy.deepcopy(templates[numAdded % len(templates)])
+            a.makeUnique()
+            core.add(a, loc)
+            numAdded += 1
+
+    return numAdded
+
+
+class BenchmarkResults:
+    """
+    The measurements of a benchmark run, one row per repetition of a scenario.
+
+    Attributes
+    ----------
+    rows : list of tuple
+        The measurements, in the order of :py:data:`COLUMNS`
+    peakAllocMB : dict
+        The peak memory allocated by Python during a scenario, in MB, by scenario name and scale.
+        Only set for scenarios run with ``traceMemory``.
+    metadata : dict
+        The versions and platform the benchmarks ran on
+    """
+
+    def __init__(self):
+        self.rows: List[tuple] = []
+        self.peakAllocMB: Dict[tuple, float] = {}
+        self.metadata = {
+            "armiVersion": version,
+            "pythonVersion": platform.python_version(),
+            "platform": platform.platform(),
+            "processor": platform.processor() or platform.machine(),
+            "timestamp": datetime.datetime.now().isoformat(timespec="seconds"),
+        }
+
+    def summarize(self) -> List[dict]:
+        """Summarize the repetitions of each scenario, in the order the scenarios ran."""
+        byScenario = collections.defaultdict(list)
+        for row in self.rows:
+            byScenario[row[0], row[1]].append(row)
+
+        summary = []
+        for (name, scale), rows in byScenario.items():
+            wallTimes = np.array([row[3] for row in rows])
+            cpuTimes = np.array([row[4] for row in rows])
+            values = (
+                name,
+                scale,
+                len(rows),
+                float(wallTimes.min()),
+                float(np.median(wallTimes)),
+                float(np.median(cpuTimes)),
+                self.peakAllocMB.get((name, scale)),
+            )
+            summary.append(dict(zip(SUMMARY_COLUMNS, values)))
+        return summary
+
+    def toDict(self) -> dict:
+        return {
+            "metadata": self.metadata,
+            "results": [dict(zip(COLUMNS, row)) for row in self.rows],
+            "summary": self.summarize(),
+        }
+
+    def writeJSON(self, path):
+        """Write the metadata, the measurements and their summary to a JSON file."""
+        with open(path, "w") as f:
+            json.dump(self.toDict(), f, indent=2)
+
+    def writeCSV(self, path):
+        """Write the measurements to a CSV file, one row per repetition."""
+        with open(path, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(COLUMNS)
+            writer.writerows(self.rows)
+
+
+def runBenchmarks(
+    names: List[str] = None,
+    scale: int = 0,
+    repeat: int = 3,
+    traceMemory: bool = False,
+    workDir: str = ".",
+    results: BenchmarkResults = None,
+) -> BenchmarkResults:
+    """
+    Run some benchmark scenarios.
+
+    Parameters
+    ----------
+    names : list of str, optional
+        The scenarios to run, all of them by default
+    scale : int, optional
+        The number of rings of assemblies to add around the core of the test reactor
+    repeat : int, optional
+        The number of timed repetitions of each scenario
+    traceMemory : bool, optional
+        Run each scenario once more under tracemalloc, to record its peak Python allocations
+    workDir : str, optional
+        A folder where scenarios can write files
+    results : BenchmarkResults, optional
+        Earlier results to add these to, e.g. those of the same scenarios at another scale
+
+    Returns
+    -------
+    BenchmarkResults
+    """
+    names = list(SCENARIOS) if names is None else names
+    unknown = [name for name in names if name not in SCENARIOS]
+    if unknown:
+        raise ValueError(f"Unknown benchmark scenarios {unknown}. The scenarios are: {list(SCENARIOS)}")
+
+    context = BenchmarkContext(scale, workDir)
+    if results is None:
+        results = BenchmarkResults()
+    for name in names:
+        setup = SCENARIOS[name].setup
+        for repetition in range(repeat):
+            body = setup(context)
+            peakRssStart = getPeakRssMB()
+            cpuStart = time.process_time()
+            wallStart = time.perf_counter()
+            body()
+            wallTime = time.perf_counter() - wallStart
+            cpuTime = time.process_time() - cpuStart
+            results.rows.append((name, scale, repetition, wallTime, cpuTime, getPeakRssMB() - peakRssStart))
+            runLog.info(f"Benchmark `{name}` at scale {scale}, repetition {repetition}: {wallTime:.3f} s")
+
+        if traceMemory:
+            body = setup(context)
+            tracemalloc.start()
+            try:
+                body()
+                results.peakAllocMB[name, scale] = tracemalloc.get_traced_memory()[1] / (1024.0**2)
+            finally:
+                tracemalloc.stop()
+
+    return results
+
+
+@scenario("constructReactor", "Build the test reactor from its settings and blueprints.")
+def _constructReactor(context: BenchmarkContext) -> Callable:
+    # read the settings outside of the timing; building the reactor reads the blueprints
+    context.cs
+    return context.buildReactor
+
+
+@scenario("writeDatabase", "Write one time node of the reactor to a database.")
+def _writeDatabase(context: BenchmarkContext) -> Callable:
+    from armi.bookkeeping.db.database import Database
+
+    r = context.buildReactor()
+    path = os.path.join(context.workDir, "benchmarkWrite.h5")
+
+    def body():
+        with Database(path, "w") as db:
+            db.writeToDB(r)
+
+    return body
+
+
+@scenario("loadDatabase", "Load the reactor from one time node of a database.")
+def _loadDatabase(context: BenchmarkContext) -> Callable:
+    from armi.bookkeeping.db.database import Database
+
+    r = context.buildReactor()
+    path = os.path.join(context.workDir, "benchmarkLoad.h5")
+    with Database(path, "w") as db:
+        db.writeToDB(r)
+    cs, bp = context.cs, r.blueprints
+
+    def body():
+        with Database(path, "r") as db:
+            db.load(0, 0, cs=cs, bp=bp)
+
+    return body
+
+
+@scenario("uniformMesh", "Convert the reactor to a uniform axial mesh for neutronics.")
+def _uniformMesh(context: BenchmarkContext) -> Callable:
+    from armi.reactor.converters import uniformMesh
+
+    r = context.buildReactor()
+    converter = uniformMesh.NeutronicsUniformMeshConverter(cs=context.cs)
+    return lambda: converter.convert(r)
+
+
+@scenario("macroXS", "Compute the macroscopic cross sections of every block from a microscopic library.")
+def _macroXS(context: BenchmarkContext) -> Callable:
+    from armi.nuclearDataIO import xsCollections
+    from armi.nuclearDataIO.cccc import isotxs
+    from armi.tests import ISOAA_PATH
+
+    r = context.buildReactor()
+    lib = isotxs.readBinary(ISOAA_PATH)
+    # the test library only has some of the nuclides of the reactor, so leave the others out
+    blockNucs = []
+    for b in r.core.iterBlocks():
+        suffix = b.getMicroSuffix()
+        nucNames = [nuc for nuc in b.getNuclides() if _inLibrary(lib, nuc, suffix)]
+        if nucNames:
+            blockNucs.append((b, nucNames))
+
+    def body():
+        creator = xsCollections.MacroscopicCrossSectionCreator()
+        for b, nucNames in blockNucs:
+            creator.createMacrosFromMicros(lib, b, nucNames)
+
+    return body
+
+
+def _inLibrary(lib, nucName, suffix):
+    try:
+        lib.getNuclide(nucName, suffix)
+    except KeyError:
+        return False
+    return True
+
+
+@scenario("axialExpansion", "Thermally expand every assembly of the core to a new temperature field.")
+def _axialExpansion(context: BenchmarkContext) -> Callable:
+    from armi.reactor.converters.axialExpansionChanger import AxialExpansionChanger
+
+    r = context.buildReactor()
+    assems = list(r.core)
+    height = max(a.getTotalHeight() for a in assems)
+    tempGrid = np.linspace(0.0, height, 11)
+    tempFields = [np.linspace(400.0, 500.0 + i % 7, len(tempGrid)) for i in range(len(assems))]
+    changer = AxialExpansionChanger()
+    return lambda: changer.performThermalAxialExpansionOnAssemblies(assems, tempGrid, tempFields)
+
+
+@scenario(
+    "distributeState",
+    "Serialize the reactor and rebuild it, as DistributeStateAction does, in both distribute modes.",
+)
+def _distributeState(context: BenchmarkContext) -> Callable:
+    from armi.bookkeeping.db import reactorImage
+
+    r = context.buildReactor()
+    cs = context.cs
+
+    def body():
+        # a single process has no one to send the reactor to, so this times what the broadcasts
+        # do on either side: pickling and unpickling, or writing and reading the reactor image
+        pickle.loads(pickle.dumps(r))
+        reactorImage.readReactorImage(reactorImage.writeReactorImage(r), cs, r.blueprints)
+
+    return body
+
+
+def getMaterialEvaluations(numTemps: int, properties=MATERIAL_PROPERTIES) -> List[tuple]:
+    """
+    Get the temperature-dependent properties of every material, over their valid temperatures.
+
+    Properties without a valid temperature range, and materials that cannot be evaluated, are left
+    out.
+
+    Returns
+    -------
+    list of tuple
+        ``(material, propName, kwargs)``, where ``kwargs`` are the temperatures to evaluate the
+        property at, as ``Tk`` or ``Tc``.
+    """
+    from armi import materials
+
+    evaluations = []
+    for matClass in materials.iterAllMaterialClassesInNamespace(materials):
+        mat = matClass()
+        for propName in properties:
+            validRange = mat.getValidTemperatureRange(propName)
+            if validRange is None or validRange[0][0] >= validRange[0][1]:
+                continue
+            (minT, maxT), units = validRange
+            temps = np.linspace(minT, maxT, numTemps)
+            tempKwarg = "Tk" if units == "K" else "Tc"
+            try:
+                mat.evaluate(propName, **{tempKwarg: temps[:1]})
+            except NotImplementedError:
+                # abstract materials, like Water, cannot be evaluated
+                continue
+            evaluations.append((mat, propName, {tempKwarg: temps}))
+
+    return evaluations
+
+
+@scenario("materials", "Evaluate the temperature-dependent properties of every material at many temperatures.")
+def _materials(context: BenchmarkContext) -> Callable:
+    evaluations = getMaterialEvaluations(10000 * (context.scale + 1))
+
+    def body():
+        for mat, propName, kwargs in evaluations:
+            mat.evaluate(propName, **kwargs)
+
+    return body
@@ -49,6 +49,7 @@ from typing import (
     List,
     Optional,
     Sequence,
+    Set,
     Tuple,
     Type,
     Union,
@@ -141,6 +142,9 @@ class Database:
         self._permission = permission
         self.h5db: Optional[h5py.File] = None
 
+        # names of the top-level groups already copied to the shared folder by an incremental sync
+        self._syncedGroups: Optional[Set[str]] = None
+
         # Allows context management on open files. If context management is used on a file that is
         # already open, it will not reopen and it will also not close after leaving that context.
         # This allows the treatment of all databases the same whether they are open or closed.
@@ -301,6 +305,7 @@ class Database:
             # move out of the FAST_PATH and into the working directory
             newPath = safeMove(self._fullPath, self._fileName)
             self._fullPath = os.path.abspath(newPath)
+            self._syncedGroups = None
 
     def splitDatabase(self, keepTimeSteps: Sequence[Tuple[int, int]], label: str) -> str:
         """
@@ -330,6 +335,7 @@ class Database:
             raise ValueError("There is no open database to split.")
 
         self.h5db.close()
+        self._syncedGroups = None
 
         backupDBPath = os.path.abspath(label.join(os.path.splitext(self._fileName)))
         runLog.info("Retaining full database history in {}".format(backupDBPath))
@@ -369,6 +375,11 @@ class Database:
     def fileName(self):
         return self._fileName
 
+    @property
+    def fullPath(self) -> Optional[str]:
+        """The absolute path of the file once it has been opened; after closing, where it was moved to."""
+        return self._fullPath
+
     @fileName.setter
     def fileName(self, fName):
         if self.h5db is not None:
@@ -625,18 +636,29 @@ class Database:
         for comps in groupedComps.values():
             self._writeParams(h5group, comps)
 
-    def syncToSharedFolder(self):
+    def syncToSharedFolder(self, mode: str = "copy"):
         """
         Copy DB to run working directory.
 
         Needed when multiple MPI processes need to read the same db, for example when a history is
         needed from independent runs (e.g. for fuel performance on a variety of assemblies).
 
+        Parameters
+        ----------
+        mode : str, optional
+            ``"copy"`` closes the file, copies the whole of it to the working directory, and reopens
+            it. ``"incremental"`` keeps the file open, and only copies the top-level groups that are
+            not in the working directory copy yet, e.g. the new time nodes.
+
         Notes
         -----
         At some future point, we may implement a client-server like DB system which would render
         this kind of operation unnecessary.
         """
+        if mode == "incremental":
+            self._syncNewGroups()
+            return
+
         runLog.extra("Copying DB to shared working directory.")
         self.h5db.flush()
 
@@ -651,6 +673,45 @@ class Database:
         # Reload the file in append mode and continue on our merry way
         self.h5db = h5py.File(self._fullPath, "r+")
 
+    def _syncNewGroups(self):
+        """
+        Copy the top-level groups that have not been synced yet to the working directory copy.
+
+        Notes
+        -----
+        A group is copied once, the first time it is synced. Data added later to a group that was
+        already synced only reaches the working directory copy at :py:meth:`close`, which moves the
+        complete file over it.
+
+        The new groups are appended to the working directory copy in place, so it is not safe to read
+        while a sync is running: a process that holds the file open across a sync may see an
+        inconsistent file. Readers, such as monitoring tools, should open the file, read, and close it
+        between syncs, or use the ``copy`` mode. Building each update in a temporary file and
+        swapping it in would make syncs safe to read across, but would copy the whole file every time,
+        which is what this mode avoids.
+
+        HDF5 single-writer/multiple-reader mode would avoid the copy altogether, but it does not
+        allow creating groups once it is on, and every time node is a new group.
+        """
+        self.h5db.flush()
+        sharedPath = os.path.abspath(self._fileName)
+        if sharedPath == self._fullPath:
+            # the fast path is the working directory, so there is nothing to copy
+            return
+
+        # the first sync starts a fresh copy, in case an old file with the same name is in the way
+        newCopy = self._syncedGroups is None
+        if newCopy:
+            self._syncedGroups = set()
+
+        newGroups = [name for name in self.h5db if name not in self._syncedGroups]
+        runLog.extra(f"Copying {len(newGroups)} new groups of the DB to shared working directory.")
+        with h5py.File(sharedPath, "w" if newCopy else "a") as sharedDB:
+            sharedDB.attrs.update(self.h5db.attrs)
+            for name in newGroups:
+                self.h5db.copy(self.h5db[name], sharedDB, name=name)
+                self._syncedGroups.add(name)
+
     def load(
         self,
         cycle,
@@ -28,6 +28,8 @@ from typing import (
     Tuple,
 )
 
+import h5py
+
 from armi import context, interfaces, runLog
 from armi.bookkeeping.db.database import Database, getH5GroupName
 from armi.bookkeeping.db.typedefs import Histories, History
@@ -36,6 +38,7 @@ from armi.reactor.parameters import parameterDefinitions
 from armi.settings.fwSettings.databaseSettings import (
     CONF_FORCE_DB_PARAMS,
     CONF_SYNC_AFTER_WRITE,
+    CONF_SYNC_MODE,
 )
 from armi.utils import getPreviousTimeNode, getStepLengths
 
@@ -138,7 +141,7 @@ class DatabaseInterface(interfaces.Interface):
         self.r.core.p.minutesSinceStart = (time.time() - self.r.core.timeOfStart) / 60.0
         self._db.writeToDB(self.r)
         if self.cs[CONF_SYNC_AFTER_WRITE]:
-            self._db.syncToSharedFolder()
+            self._db.syncToSharedFolder(self.cs[CONF_SYNC_MODE])
 
     def interactEOC(self, cycle=None):
         """
@@ -158,6 +161,30 @@ class DatabaseInterface(interfaces.Interface):
         self._db.writeToDB(self.r, "EOL")
         self.closeDB()
 
+    def writeTelemetry(self):
+        """
+        Write the interaction telemetry the operator has recorded so far to the database.
+
+        At EOL, the operator calls this once all the interfaces have interacted, so the database is
+        usually closed by then. It is reopened from the absolute path it was moved to when it was
+        closed, since the working directory may have changed since.
+
+        Notes
+        -----
+        This is written outside of the time node groups, so that comparing two databases does not
+        report timing differences as physics differences.
+        """
+        opTelemetry = getattr(self.o, "telemetry", None)
+        if opTelemetry is None or self._db is None or self._db.fullPath is None:
+            # there is no database file to write to
+            return
+
+        if self._db.isOpen():
+            opTelemetry.writeToH5(self._db.h5db)
+        else:
+            with h5py.File(self._db.fullPath, "a") as h5db:
+                opTelemetry.writeToH5(h5db)
+
     def closeDB(self):
         """Close the DB, writing to file."""
         self._db.close(True)
@@ -170,6 +197,7 @@ class DatabaseInterface(interfaces.Interface):
             # this can result in a double-error if the error occurred in the database
             # writing
             self._db.writeToDB(self.r, "error")
+            self.writeTelemetry()
             self._db.close(False)
         except Exception:  # we're already responding to an error
             pass
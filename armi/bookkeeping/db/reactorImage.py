@@ -0,0 +1,114 @@
+# Copyright 2026 TerraPower, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+In-memory database images of a reactor.
+
+A reactor image is an ARMI database file, holding a single time step, that only ever exists in
+memory. It stores the reactor the same way the database does: the ``Layout`` of the composite tree
+and one column per parameter and composite type. This is much more compact than a pickled reactor,
+and it is a flat byte buffer, so it can be sent between processes or placed in shared memory without
+any further serialization.
+
+Some state is not part of the database, and so not part of the image: the blueprints and settings,
+which are needed to rebuild the reactor, the cross section library of the core, and the parameters
+that are not saved to the database. Those parameters are gathered with
+:py:func:`getUnsavedParams` so they can be sent beside the image, and restored on the rebuilt
+reactor with :py:func:`applyUnsavedParams`. State that is not held in parameters, such as
+attributes set directly on composites, is not carried at all. Assemblies rebuilt from an image have
+``Assembly.DATABASE`` as their last location label.
+
+See Also
+--------
+armi.mpiActions.DistributeStateAction : uses these to distribute the reactor to MPI processes.
+"""
+
+import io
+
+import h5py
+import numpy as np
+
+from armi.bookkeeping.db.database import Database, getH5GroupName
+
+IMAGE_FILE_NAME = "reactorImage.h5"
+"""Name of the database of the image. The image is never written to this file."""
+
+
+def writeReactorImage(r) -> np.ndarray:
+    """Write the state of a reactor to an in-memory database, and return the bytes of its file."""
+    stream = io.BytesIO()
+    db = Database(IMAGE_FILE_NAME, "w")
+    with h5py.File(stream, "w") as h5db:
+        h5db.attrs["databaseVersion"] = db.version
+        db.h5db = h5db
+        try:
+            db.writeToDB(r)
+        finally:
+            db.h5db = None
+
+    return np.frombuffer(stream.getbuffer(), dtype=np.uint8)
+
+
+def readReactorImage(image, cs, bp):
+    """
+    Rebuild a reactor from the bytes of an image made by :py:func:`writeReactorImage`.
+
+    Parameters
+    ----------
+    image : buffer
+        Bytes of the image. They are copied, so the buffer can be released as soon as this returns.
+    cs : Settings
+        Settings of the case the reactor belongs to.
+    bp : Blueprints
+        Blueprints of the reactor.
+    """
+    db = Database(IMAGE_FILE_NAME, "r")
+    with h5py.File(io.BytesIO(image), "r") as h5db:
+        db.h5db = h5db
+        try:
+            db.version = h5db.attrs["databaseVersion"]
+            # an image has a single time step
+            (groupName,) = h5db.keys()
+            cycle, node = h5db[groupName].attrs["cycle"], h5db[groupName].attrs["timeNode"]
+            assert groupName == getH5GroupName(cycle, node)
+            return db.load(cycle, node, cs=cs, bp=bp)
+        finally:
+            db.h5db = None
+
+
+def getUnsavedParams(r) -> dict:
+    """
+    Return the values of the parameters of a reactor that are not saved to the database.
+
+    Only the values that have been set, i.e. that are not the default of their parameter, are
+    returned. They are keyed by the serial number of their composite, which the image keeps, then by
+    parameter name.
+    """
+    unsaved = {}
+    for c in [r] + r.getChildren(deep=True):
+        values = {
+            pDef.name: c.p[pDef.name]
+            for pDef in c.p.paramDefs
+            if not pDef.saveToDB and c.p.get(pDef.name, pDef.default) is not pDef.default
+        }
+        if values:
+            unsaved[c.p.serialNum] = values
+
+    return unsaved
+
+
+def applyUnsavedParams(r, unsaved: dict):
+    """Set the parameters returned by :py:func:`getUnsavedParams` on a reactor rebuilt from an image."""
+    for c in [r] + r.getChildren(deep=True):
+        for name, value in unsaved.get(c.p.serialNum, {}).items():
+            c.p[name] = value
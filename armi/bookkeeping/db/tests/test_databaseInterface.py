@@ -16,6 +16,7 @@
 import os
 import types
 import unittest
+from unittest import mock
 
 import h5py
 import numpy as np
@@ -23,7 +24,8 @@ from numpy.testing import assert_allclose, assert_equal
 
 from armi import __version__ as version
 from armi import interfaces, runLog, settings
-from armi.bookkeeping.db.database import Database
+from armi.bookkeeping import telemetry
+from armi.bookkeeping.db.database import Database, getH5GroupName
 from armi.bookkeeping.db.databaseInterface import DatabaseInterface
 from armi.cases import case
 from armi.context import PROJECT_ROOT
@@ -219,6 +221,35 @@ class TestDatabaseInterface(unittest.TestCase):
         self.dbi.interactEOL()
         self.assertTrue(os.path.exists(self.dbi.database.fileName))
 
+    def test_syncDbIncremental(self):
+        """Only the groups written since the last sync are copied in the incremental sync mode."""
+        r = self.r
+        self.o.cs["syncDbAfterWrite"] = True
+        self.o.cs["dbSyncMode"] = "incremental"
+
+        self.dbi.interactBOL()
+        h5db = self.dbi.database.h5db
+        for timeNode in range(2):
+            r.p.cycle = 0
+            r.p.timeNode = timeNode
+            with mock.patch.object(h5py.Group, "copy", autospec=True, side_effect=h5py.Group.copy) as copy:
+                self.dbi.interactEveryNode(r.p.cycle, r.p.timeNode)
+            copied = [call.kwargs["name"] for call in copy.call_args_list]
+            newGroups = ["inputs", getH5GroupName(0, 0)] if timeNode == 0 else [getH5GroupName(0, 1)]
+            self.assertEqual(sorted(copied), sorted(newGroups))
+
+            # the file is kept open, and the shared copy has all the time nodes so far
+            self.assertIs(self.dbi.database.h5db, h5db)
+            with Database(self.dbi.database.fileName, "r") as db:
+                for tn in range(timeNode + 1):
+                    self.assertTrue(db.hasTimeStep(r.p.cycle, tn))
+                self.assertFalse(db.h5db.attrs["successfulCompletion"])
+
+        self.dbi.interactEOL()
+        with Database(self.dbi.database.fileName, "r") as db:
+            self.assertTrue(db.hasTimeStep(r.p.cycle, r.p.timeNode, "EOL"))
+            self.assertTrue(db.h5db.attrs["successfulCompletion"])
+
     def test_noSyncDbAfterWrite(self):
         """
         Test to ensure that the fast-path database is NOT copied to working
@@ -233,6 +264,38 @@ class TestDatabaseInterface(unittest.TestCase):
         self.dbi.interactEOL()
         self.assertTrue(os.path.exists(self.dbi.database.fileName))
 
+    def test_writeTelemetry(self):
+        """The telemetry is written after all the EOL interactions, including the later ones."""
+        with self.o.telemetry.record("main", "BOL", 0, 0, 0):
+            self.dbi.interactBOL()
+        later = MockInterface(self.r, self.o.cs)
+        later.name = "later"
+        self.o.interfaces = [self.dbi, later]
+        self.o.interactAllEOL()
+
+        with h5py.File(self.dbi.database.fileName, "r") as h5file:
+            data = telemetry.Telemetry.readFromH5(h5file)
+        recorded = [row[:2] for row in data.rows]
+        for key in (("main", "BOL"), ("database", "EOL"), ("later", "EOL")):
+            self.assertIn(key, recorded)
+
+    def test_writeTelemetryFromOtherDirectory(self):
+        """The telemetry goes to the database file even if the working directory changed since it was closed."""
+        self.dbi.interactBOL()
+        self.dbi.interactEOL()
+        dbPath = self.dbi.database.fullPath
+        self.assertTrue(os.path.isabs(dbPath))
+
+        with self.o.telemetry.record("main", "EOL", 0, 0, 0):
+            pass
+        with directoryChangers.TemporaryDirectoryChanger():
+            self.dbi.writeTelemetry()
+            self.assertFalse(os.path.exists(self.dbi.database.fileName))
+
+        with h5py.File(dbPath, "r") as h5file:
+            data = telemetry.Telemetry.readFromH5(h5file)
+        self.assertIn(("main", "EOL"), [row[:2] for row in data.rows])
+
 
 class TestDatabaseWriter(unittest.TestCase):
     def setUp(self):
@@ -0,0 +1,78 @@
+# Copyright 2026 TerraPower, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for in-memory database images of a reactor."""
+
+import os
+import pickle
+import unittest
+
+import numpy as np
+
+from armi.bookkeeping.db import reactorImage
+from armi.reactor.flags import Flags
+from armi.reactor.tests import test_reactors
+
+
+class TestReactorImage(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.o, cls.r = test_reactors.loadTestReactor()
+
+    def test_roundTrip(self):
+        b = self.r.core.getFirstBlock(Flags.FUEL)
+        b.p.mgFlux = np.arange(33, dtype=float)
+        self.r.p.cycle = 1
+        self.r.p.timeNode = 2
+
+        image = reactorImage.writeReactorImage(self.r)
+        self.assertEqual(image.dtype, np.uint8)
+        # the image is much smaller than the pickled reactor
+        self.assertLess(image.nbytes, len(pickle.dumps(self.r)) / 2)
+        self.assertFalse(os.path.exists(reactorImage.IMAGE_FILE_NAME))
+
+        r = reactorImage.readReactorImage(image, self.o.cs, self.r.blueprints)
+        self.assertIsNot(r, self.r)
+        self.assertEqual((r.p.cycle, r.p.timeNode), (1, 2))
+        self.assertEqual(len(r.core), len(self.r.core))
+        self.assertEqual(len(r.excore["sfp"]), len(self.r.excore["sfp"]))
+        self.assertIs(r.blueprints, self.r.blueprints)
+
+        rebuilt = r.core.getBlockByName(b.getName())
+        np.testing.assert_array_equal(rebuilt.p.mgFlux, b.p.mgFlux)
+        self.assertEqual(rebuilt.getNumberDensities(), b.getNumberDensities())
+        self.assertEqual(rebuilt.parent.getLocation(), b.parent.getLocation())
+
+    def test_unsavedParams(self):
+        """The parameters that are not saved to the database are restored on the rebuilt reactor."""
+        b = self.r.core.getFirstBlock(Flags.FUEL)
+        b.p.lastMgFlux = np.arange(33, dtype=float)
+        b.p.pinLocation = [1, 2, 3]
+
+        unsaved = reactorImage.getUnsavedParams(self.r)
+        self.assertIs(unsaved[b.p.serialNum]["lastMgFlux"], b.p.lastMgFlux)
+        self.assertNotIn(self.r.p.serialNum, unsaved)
+
+        r = reactorImage.readReactorImage(reactorImage.writeReactorImage(self.r), self.o.cs, self.r.blueprints)
+        rebuilt = r.core.getBlockByName(b.getName())
+        self.assertIsNone(rebuilt.p.lastMgFlux)
+
+        reactorImage.applyUnsavedParams(r, unsaved)
+        comps = [self.r] + self.r.getChildren(deep=True)
+        rebuiltComps = [r] + r.getChildren(deep=True)
+        self.assertEqual(len(comps), len(rebuiltComps))
+        for c, rebuilt in zip(comps, rebuiltComps):
+            self.assertEqual(c.p.serialNum, rebuilt.p.serialNum)
+            for pDef in c.p.paramDefs:
+                if not pDef.saveToDB:
+                    np.testing.assert_equal(c.p.get(pDef.name), rebuilt.p.get(pDef.name), err_msg=pDef.name)
@@ -66,11 +66,24 @@ Specifying blocks and assemblies to track
 ^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^
 See :ref:`detail-assems`.
 
+Keeping the histories in memory
+^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^
+With the ``historyStore`` setting set to ``memory``, the tracked parameters of the detail assemblies
+are copied from the live reactor into a :py:class:`HistoryStore` at every time node, and again after
+each tight coupling iteration, so the store holds the same values as the database. Looking up a
+history is then array indexing, and the EOL reports do not read the database at all. Values that are
+not in the store, like untracked parameters, are still read from the database. The store only holds
+the time nodes run by this process, so the reports of a restarted run, whose database also holds the
+time nodes from before the restart, are written from the database.
+
 """
 
+import numbers
 import traceback
 from typing import TYPE_CHECKING
 
+import numpy as np
+
 from armi import interfaces, operators, runLog
 from armi.reactor import grids
 from armi.reactor.flags import Flags
@@ -143,6 +156,7 @@ class HistoryTrackerInterface(interfaces.Interface):
         self.fullCoreLocations = {}
         self.xsHistory = {}
         self._preloadedBlockHistory = None
+        self._historyStore = None
 
     def interactBOL(self):
         self.addDetailAssembliesBOL()
@@ -153,10 +167,36 @@ class HistoryTrackerInterface(interfaces.Interface):
         if self.cs["detailAllAssems"]:
             self.addAllDetailedAssems()
 
+    def interactEveryNode(self, cycle, node):
+        """Copy the tracked parameters of the detail assemblies into the history store, if there is one."""
+        self._recordTimeNode(cycle, node)
+
+    def interactCoupled(self, iteration):
+        """
+        Record the time node again after each tight coupling iteration.
+
+        The database is written after the last coupled iteration, so the store has to hold the values
+        of that iteration too, rather than the ones from before the coupling.
+        """
+        self._recordTimeNode(self.r.p.cycle, self.r.p.timeNode)
+
+    def _recordTimeNode(self, cycle, node):
+        if self.cs["historyStore"] != "memory":
+            return
+
+        if self._historyStore is None:
+            self._historyStore = HistoryStore(self.getTrackedParams())
+        self._historyStore.record((cycle, node), self.r.p.time, self.getDetailAssemblies())
+
     def interactEOL(self):
         """Generate the history reports."""
         self._writeDetailAssemblyHistories()
 
+    @property
+    def historyStore(self) -> "HistoryStore":
+        """The in-memory histories of the detail assemblies, or None if they are read from the database."""
+        return self._historyStore
+
     def addDetailAssembliesBOL(self):
         """Find and activate assemblies that the user requested detailed treatment of."""
         if self.cs["detailAssemLocationsBOL"]:
@@ -287,6 +327,17 @@ class HistoryTrackerInterface(interfaces.Interface):
         """Write the assembly history report to a text file."""
         fName = fName or self._getAssemHistoryFileName(a)
         dbi = self.getInterface("database")
+        if self._historyStore is not None and self._historyStore.hasAssembly(a.getName()):
+            # a restarted run only has the time nodes of this process in the store
+            missing = set(dbi.database.genTimeSteps()).difference(self._historyStore.timeSteps)
+            if not missing:
+                self._writeAssemHistoryFromStore(a, fName)
+                return
+            runLog.info(
+                f"The history store does not have {len(missing)} time nodes of the database, such as those "
+                f"from before a restart. Writing the history of {a} from the database."
+            )
+
         times = dbi.getHistory(self.r, ["time"])["time"]
 
         with open(fName, "w") as out:
@@ -330,6 +381,42 @@ class HistoryTrackerInterface(interfaces.Interface):
             for b in blocks:
                 out.write('"{}" {} {}\n'.format(b.getType(), b.p.xsType, b.p.envGroup))
 
+    def _writeAssemHistoryFromStore(self, a: "Assembly", fName: str):
+        """Write the assembly history report from the history store, formatting each table at once."""
+        store = self._historyStore
+        blocks = [b for b in a if not any(b.hasFlags(sbf) for sbf in self.r.core.stationaryBlockFlagsList)]
+        blockNames = [b.getName() for b in blocks]
+
+        with open(fName, "w") as out:
+            # ts is a tuple, remove the spaces from the string representation so it is easy to load
+            # into a spreadsheet or whatever
+            headers = [str(ts).replace(" ", "") for ts in store.timeSteps]
+            out.write(tabulate.tabulate(data=(store.times,), headers=headers, tableFmt="plain", floatFmt="11.5E"))
+            out.write("\n")
+
+            for param in store.params:
+                out.write("\n\nkey: {0}\n".format(param))
+                values = store.getHistories(blockNames, param).T
+                if values.dtype == object:
+                    out.write(tabulate.tabulate(values.tolist(), tableFmt="plain", floatFmt="11.5E"))
+                else:
+                    out.write(_formatTable(values, "11.5E"))
+                out.write("\n")
+
+            location = [str(tuple(loc)).replace(" ", "") for loc in store.getLocations(a.getName()).tolist()]
+            out.write("\n\nkey: location\n")
+            out.write(tabulate.tabulate((location,), tableFmt="plain"))
+            out.write("\n\n\n")
+
+            headers = "EOL bottom top center".split()
+            data = [("", b.p.zbottom, b.p.ztop, b.p.z) for b in blocks]
+            out.write(tabulate.tabulate(data, headers=headers, tableFmt="plain", floatFmt="10.3f"))
+
+            out.write("\n\n\nAssembly info\n")
+            out.write("{0} {1}\n".format(a.getName(), a.getType()))
+            for b in blocks:
+                out.write('"{}" {} {}\n'.format(b.getType(), b.p.xsType, b.p.envGroup))
+
     def preloadBlockHistoryVals(self, names, keys, timesteps):
         """
         Pre-load block data so it can be more quickly accessed in the future.
@@ -384,6 +471,12 @@ class HistoryTrackerInterface(interfaces.Interface):
         KeyError
             When param not found in database.
         """
+        if self._historyStore is not None:
+            try:
+                return self._historyStore.getValue(name, paramName, ts)
+            except KeyError:
+                pass
+
         block = self.r.core.getBlockByName(name)
 
         if self._isCurrentTimeStep(ts) and not self._databaseHasDataForTimeStep(ts):
@@ -456,3 +549,163 @@ class HistoryTrackerInterface(interfaces.Interface):
                 "A tracked assembly does not contain fuel and has caused this error, see the details in stdout."
             )
         return b
+
+
+class HistoryStore:
+    """
+    The histories of the tracked parameters of the detail assemblies, kept in memory.
+
+    Each parameter is kept as a ``(nTimeSteps, nBlocks)`` array, with one row per time node, which is
+    filled in place from the live reactor. Rows and columns are allocated in chunks that double in
+    size, so recording a time node does not copy the earlier ones. Parameters that have non-scalar
+    values, like ``mgFlux``, are kept in object arrays. Blocks that are tracked starting later in the
+    run have NaN in the rows from before they were tracked.
+
+    Parameters
+    ----------
+    params : list of str
+        The block parameters to track
+    """
+
+    def __init__(self, params):
+        self.params = list(params)
+        self.timeSteps = []
+        self.times = []
+        self.blockNames = []
+        self.assemNames = []
+        self._timeIndex = {}
+        self._blockIndex = {}
+        self._assemIndex = {}
+        self._values = {param: np.full((1, 1), np.nan) for param in self.params}
+        self._recorded = np.zeros((1, 1), dtype=bool)
+        self._locations = np.zeros((1, 1, 3), dtype=int)
+        self._assemRecorded = np.zeros((1, 1), dtype=bool)
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} {len(self.timeSteps)} time steps, {len(self.blockNames)} blocks>"
+
+    def hasAssembly(self, name: str) -> bool:
+        return name in self._assemIndex
+
+    def record(self, ts: tuple[int, int], time: float, assems: list["Assembly"]):
+        """
+        Copy the tracked parameters of some assemblies at a time step.
+
+        Recording the same time step again overwrites it.
+        """
+        for a in assems:
+            if a.getName() not in self._assemIndex:
+                self._addAssembly(a)
+
+        row = self._getRow(ts, time)
+        blocks = [b for a in assems for b in a]
+        cols = np.array([self._blockIndex[b.getName()] for b in blocks], dtype=int)
+        self._recorded[row, cols] = True
+        for param in self.params:
+            self._setValues(param, row, cols, [b.p[param] for b in blocks])
+
+        aCols = [self._assemIndex[a.getName()] for a in assems]
+        self._locations[row, aCols] = [a.spatialLocator.indices for a in assems]
+        self._assemRecorded[row, aCols] = True
+
+    def getValue(self, blockName: str, param: str, ts: tuple[int, int]):
+        """
+        Get the value of a parameter of a block at a time step.
+
+        Raises
+        ------
+        KeyError
+            If the block, parameter or time step was not recorded.
+        """
+        row = self._timeIndex[ts]
+        col = self._blockIndex[blockName]
+        if not self._recorded[row, col]:
+            raise KeyError(f"{blockName} was not tracked at time step {ts}")
+        return self._values[param][row, col]
+
+    def getHistories(self, blockNames: list[str], param: str) -> np.ndarray:
+        """Get the ``(nTimeSteps, nBlocks)`` history of a parameter of some blocks."""
+        cols = [self._blockIndex[name] for name in blockNames]
+        return self._values[param][: len(self.timeSteps), cols]
+
+    def getLocations(self, assemName: str) -> np.ndarray:
+        """Get the ``(i, j, k)`` indices of an assembly at the time steps where it was tracked."""
+        col = self._assemIndex[assemName]
+        numRows = len(self.timeSteps)
+        return self._locations[:numRows, col][self._assemRecorded[:numRows, col]]
+
+    def _addAssembly(self, a: "Assembly"):
+        self._assemIndex[a.getName()] = len(self.assemNames)
+        self.assemNames.append(a.getName())
+        for b in a:
+            self._blockIndex[b.getName()] = len(self.blockNames)
+            self.blockNames.append(b.getName())
+
+        self._reserve(self._recorded.shape[0], len(self.blockNames), len(self.assemNames))
+
+    def _getRow(self, ts, time):
+        if ts in self._timeIndex:
+            row = self._timeIndex[ts]
+            self.times[row] = time
+            return row
+
+        row = len(self.timeSteps)
+        self._timeIndex[ts] = row
+        self.timeSteps.append(ts)
+        self.times.append(time)
+        self._reserve(row + 1, self._recorded.shape[1], self._assemRecorded.shape[1])
+        return row
+
+    def _reserve(self, numRows, numBlocks, numAssems):
+        """Grow the arrays, doubling each dimension, until they hold the given numbers of rows and columns."""
+        rows, cols = self._recorded.shape
+        _rows, aCols = self._assemRecorded.shape
+        if numRows <= rows and numBlocks <= cols and numAssems <= aCols:
+            return
+
+        while rows < numRows:
+            rows *= 2
+        while cols < numBlocks:
+            cols *= 2
+        while aCols < numAssems:
+            aCols *= 2
+
+        for param, values in self._values.items():
+            self._values[param] = _grow(values, (rows, cols), np.nan)
+        self._recorded = _grow(self._recorded, (rows, cols), False)
+        self._locations = _grow(self._locations, (rows, aCols, 3), 0)
+        self._assemRecorded = _grow(self._assemRecorded, (rows, aCols), False)
+
+    def _setValues(self, param, row, cols, values):
+        array = self._values[param]
+        if array.dtype != object:
+            if all(val is None or (isinstance(val, numbers.Real) and not isinstance(val, bool)) for val in values):
+                # None is converted to NaN
+                array[row, cols] = np.array(values, dtype=float)
+                return
+            array = self._values[param] = array.astype(object)
+
+        for col, val in zip(cols, values):
+            array[row, col] = val
+
+
+def _grow(array, shape, fill):
+    """Copy an array into the top left corner of a bigger one."""
+    bigger = np.full(shape, fill, dtype=array.dtype)
+    bigger[tuple(slice(0, n) for n in array.shape)] = array
+    return bigger
+
+
+def _formatTable(values, floatFmt):
+    """
+    Format a 2-D array of floats like ``tabulate(values, tableFmt="plain", floatFmt=floatFmt)``.
+
+    All of the values are formatted in one call, which is much faster than tabulating them one by one.
+    """
+    if values.size == 0:
+        return ""
+
+    text = np.char.mod(f"%{floatFmt}", values)
+    widths = np.char.str_len(text).max(axis=0)
+    columns = [np.char.rjust(text[:, j], width) for j, width in enumerate(widths)]
+    return "\n".join("  ".join(row) for row in zip(*columns))
@@ -23,6 +23,12 @@ that show info from every process running. This is very fast.
 
 2. You can use ``gc.get_objects()`` to list all objects that the garbage collector is tracking. If you want, you
 can filter it down and get the counts and sizes of objects of interest (e.g. all armi objects).
+This is very slow on large models.
+
+3. You can trace memory allocations with ``tracemalloc``, and attribute them to the ARMI subsystems (composites,
+parameters, XS libraries, DB buffers) that made them. Comparing snapshots between time nodes shows which lines of
+code keep growing. This is cheap enough to leave on for a production run, especially with a shallow trace depth.
+It is turned on with the ``debugMemTraceDepth`` setting.
 
 This module has tools to do all of this. It should help you out.
 
@@ -35,12 +41,14 @@ See Also
 --------
 https://pythonhosted.org/psutil/
 https://docs.python.org/3/library/gc.html#gc.garbage
+https://docs.python.org/3/library/tracemalloc.html
 """
 
 import gc
 import sys
+import tracemalloc
 from os import cpu_count
-from typing import Optional
+from typing import Dict, List, Optional, Tuple
 
 from armi import context, interfaces, mpiActions, runLog
 from armi.reactor.composites import ArmiObject
@@ -59,6 +67,30 @@ except ImportError:
 
 ORDER = interfaces.STACK_ORDER.POSTPROCESSING
 REPORT_COUNT = 100000
+TRACE_REPORT_COUNT = 10
+
+# The first matching path fragment, going from the most recent frame of an allocation outwards, decides the subsystem
+# the allocation is attributed to. Order matters: parameters live inside the reactor package.
+SUBSYSTEMS = (
+    ("armi/reactor/parameters/", "parameters"),
+    ("armi/reactor/", "composites"),
+    ("armi/materials/", "composites"),
+    ("armi/nuclearDataIO/", "XS libraries"),
+    ("armi/bookkeeping/db/", "DB buffers"),
+    ("/h5py/", "DB buffers"),
+)
+OTHER_ARMI = "other ARMI"
+OTHER = "other"
+
+_SNAPSHOT_FILTERS = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+    tracemalloc.Filter(False, "<unknown>"),
+)
+
+_previousLineSizes: Optional[Dict[Tuple[str, int], int]] = None
+"""Traced memory by allocating line at the previous comparison on this process, see ``addTracedMemory``."""
 
 
 def describeInterfaces(cs):
@@ -85,6 +117,69 @@ def getCurrentMemoryUsage():
     return memoryUsageInMB
 
 
+def startTracing(depth: int):
+    """Start tracing memory allocations of this process, keeping ``depth`` frames for each of them."""
+    if tracemalloc.is_tracing():
+        if tracemalloc.get_traceback_limit() == depth:
+            return
+        tracemalloc.stop()
+    tracemalloc.start(depth)
+
+
+def stopTracing():
+    """Stop tracing memory allocations of this process, and forget the previous snapshot."""
+    global _previousLineSizes
+    _previousLineSizes = None
+    tracemalloc.stop()
+
+
+def getSubsystem(traceback: tracemalloc.Traceback) -> str:
+    """Return the name of the ARMI subsystem an allocation with the given traceback is attributed to."""
+    isArmi = False
+    # frames are ordered from the oldest to the most recent
+    for frame in reversed(traceback):
+        fileName = frame.filename.replace("\\", "/")
+        for fragment, subsystem in SUBSYSTEMS:
+            if fragment in fileName:
+                return subsystem
+        isArmi = isArmi or "/armi/" in fileName
+
+    return OTHER_ARMI if isArmi else OTHER
+
+
+def summarizeBySubsystem(snapshot: tracemalloc.Snapshot) -> Dict[str, float]:
+    """Total the memory of a snapshot by ARMI subsystem, in MB."""
+    sizes = dict.fromkeys([name for _, name in SUBSYSTEMS] + [OTHER_ARMI, OTHER], 0.0)
+    for stat in snapshot.statistics("traceback"):
+        sizes[getSubsystem(stat.traceback)] += stat.size / (1024.0**2)
+    return sizes
+
+
+def getLineSizes(snapshot: tracemalloc.Snapshot) -> Dict[Tuple[str, int], int]:
+    """Total the memory of a snapshot by the line that allocated it, in bytes."""
+    return {(stat.traceback[0].filename, stat.traceback[0].lineno): stat.size for stat in snapshot.statistics("lineno")}
+
+
+def compareLineSizes(
+    old: Dict[Tuple[str, int], int], new: Dict[Tuple[str, int], int], top: int = TRACE_REPORT_COUNT
+) -> List[Tuple[str, float]]:
+    """
+    Find the lines of code whose allocations grew the most between two calls to ``getLineSizes``.
+
+    Returns
+    -------
+    list
+        ``("fileName:lineNumber", growthInMB)`` for the ``top`` largest growths, largest first.
+    """
+    growths = []
+    for line, size in new.items():
+        growth = size - old.get(line, 0)
+        if growth > 0:
+            growths.append(("{}:{}".format(*line), growth / (1024.0**2)))
+
+    return sorted(growths, key=lambda g: g[1], reverse=True)[:top]
+
+
 class MemoryProfiler(interfaces.Interface):
     name = "memoryProfiler"
 
@@ -95,33 +190,40 @@ class MemoryProfiler(interfaces.Interface):
     def interactBOL(self):
         interfaces.Interface.interactBOL(self)
         self.printCurrentMemoryState()
-        mpiAction = PrintSystemMemoryUsageAction()
+        mpiAction = PrintSystemMemoryUsageAction(traceDepth=self.cs["debugMemTraceDepth"])
         mpiAction.broadcast().invoke(self.o, self.r, self.cs)
         mpiAction.printUsage("BOL SYS_MEM")
+        mpiAction.printTracedUsage("BOL")
 
         # so we can debug mem profiler quickly
-        if self.cs["debugMem"]:
+        if self.cs["debugMem"] and not self.cs["debugMemTraceDepth"]:
             mpiAction = ProfileMemoryUsageAction("EveryNode")
             mpiAction.broadcast().invoke(self.o, self.r, self.cs)
 
     def interactEveryNode(self, cycle, node):
         self.printCurrentMemoryState()
 
-        mp = PrintSystemMemoryUsageAction()
+        mp = PrintSystemMemoryUsageAction(traceDepth=self.cs["debugMemTraceDepth"])
         mp.broadcast()
         mp.invoke(self.o, self.r, self.cs)
         mp.printUsage("c{} n{} SYS_MEM".format(cycle, node))
+        mp.printTracedUsage("c{} n{}".format(cycle, node))
 
         self.r.core.p.minProcessMemoryInMB = round(mp.minProcessMemoryInMB * 10) / 10.0
         self.r.core.p.maxProcessMemoryInMB = round(mp.maxProcessMemoryInMB * 10) / 10.0
 
-        if self.cs["debugMem"]:
+        if self.cs["debugMem"] and not self.cs["debugMemTraceDepth"]:
             mpiAction = ProfileMemoryUsageAction("EveryNode")
             mpiAction.broadcast().invoke(self.o, self.r, self.cs)
 
     def interactEOL(self):
         """End of life hook. Good place to wrap up or print out summary outputs."""
-        if self.cs["debugMem"]:
+        if self.cs["debugMemTraceDepth"]:
+            mpiAction = PrintSystemMemoryUsageAction(traceDepth=self.cs["debugMemTraceDepth"])
+            mpiAction.broadcast().invoke(self.o, self.r, self.cs)
+            mpiAction.printTracedUsage("EOL")
+            stopTracing()
+        elif self.cs["debugMem"]:
             mpiAction = ProfileMemoryUsageAction("EOL")
             mpiAction.broadcast().invoke(self.o, self.r, self.cs)
 
@@ -364,6 +466,7 @@ class ProfileMemoryUsageAction(mpiActions.MpiAction):
 class SystemAndProcessMemoryUsage:
     def __init__(self):
         self.nodeName = context.MPI_NODENAME
+        self.rank = context.MPI_RANK
         self.percentNodeRamUsed: Optional[float] = None
         self.processMemoryInMB: Optional[float] = None
         self.processVirtualMemoryInMB: Optional[float] = None
@@ -373,6 +476,28 @@ class SystemAndProcessMemoryUsage:
             self.processMemoryInMB = psutil.Process().memory_info().rss / (1024.0**2)
             self.processVirtualMemoryInMB = psutil.Process().memory_info().vms / (1024.0**2)
 
+        # only filled in by ``addTracedMemory``
+        self.tracedMemoryInMB: Optional[float] = None
+        self.subsystemMemoryInMB: Dict[str, float] = {}
+        self.memoryGrowth: List[Tuple[str, float]] = []
+
+    def addTracedMemory(self):
+        """
+        Add the memory traced by ``tracemalloc`` on this process, by ARMI subsystem.
+
+        Also find the lines of code whose allocations grew the most since the previous call on this process. Only
+        the total by line is kept between calls, rather than the whole snapshot, to keep the cost of tracing down.
+        """
+        global _previousLineSizes
+        snapshot = tracemalloc.take_snapshot().filter_traces(_SNAPSHOT_FILTERS)
+        self.tracedMemoryInMB = tracemalloc.get_traced_memory()[0] / (1024.0**2)
+        self.subsystemMemoryInMB = summarizeBySubsystem(snapshot)
+
+        lineSizes = getLineSizes(snapshot)
+        if _previousLineSizes is not None:
+            self.memoryGrowth = compareLineSizes(_previousLineSizes, lineSizes)
+        _previousLineSizes = lineSizes
+
     def __isub__(self, other):
         if self.percentNodeRamUsed is not None and other.percentNodeRamUsed is not None:
             self.percentNodeRamUsed -= other.percentNodeRamUsed
@@ -382,10 +507,21 @@ class SystemAndProcessMemoryUsage:
 
 
 class PrintSystemMemoryUsageAction(mpiActions.MpiAction):
-    def __init__(self):
+    """
+    Gather the memory usage of every MPI rank.
+
+    Parameters
+    ----------
+    traceDepth : int, optional
+        If positive, each rank also traces its memory allocations with ``tracemalloc``, keeping this many frames per
+        allocation, and reports them by ARMI subsystem. Tracing starts the first time this action is invoked.
+    """
+
+    def __init__(self, traceDepth=0):
         mpiActions.MpiAction.__init__(self)
         self.usages = []
         self.percentNodeRamUsed: Optional[float] = None
+        self.traceDepth = traceDepth
 
     def __iter__(self):
         return iter(self.usages)
@@ -411,6 +547,9 @@ class PrintSystemMemoryUsageAction(mpiActions.MpiAction):
 
     def invokeHook(self):
         spmu = SystemAndProcessMemoryUsage()
+        if self.traceDepth:
+            startTracing(self.traceDepth)
+            spmu.addTracedMemory()
         self.percentNodeRamUsed = spmu.percentNodeRamUsed
         self.usages = self.gather(spmu)
 
@@ -455,3 +594,35 @@ class PrintSystemMemoryUsageAction(mpiActions.MpiAction):
                 tableFmt="armi",
             )
         )
+
+    def printTracedUsage(self, description):
+        """Print the traced memory of all MPI ranks by ARMI subsystem, and their largest growths, if any."""
+        tracedUsages = [mu for mu in self if mu.tracedMemoryInMB is not None]
+        if not tracedUsages:
+            return
+
+        subsystems = list(tracedUsages[0].subsystemMemoryInMB)
+        runLog.info(
+            "Traced memory (MB) by subsystem at `{}`:\n".format(description)
+            + tabulate.tabulate(
+                [
+                    [mu.nodeName, mu.rank, mu.tracedMemoryInMB] + [mu.subsystemMemoryInMB[s] for s in subsystems]
+                    for mu in tracedUsages
+                ],
+                headers=["Machine", "Rank", "Total"] + subsystems,
+                tableFmt="armi",
+                floatFmt=".1f",
+            )
+        )
+
+        growths = [(mu.rank, line, growth) for mu in tracedUsages for line, growth in mu.memoryGrowth]
+        if growths:
+            runLog.info(
+                "Largest traced memory growths since the previous report, at `{}`:\n".format(description)
+                + tabulate.tabulate(
+                    sorted(growths, key=lambda g: g[2], reverse=True)[:TRACE_REPORT_COUNT],
+                    headers=["Rank", "Allocated At", "Growth (MB)"],
+                    tableFmt="armi",
+                    floatFmt=".2f",
+                )
+            )
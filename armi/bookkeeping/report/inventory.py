@@ -0,0 +1,201 @@
+# Copyright 2026 TerraPower, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+A summary of the masses and parameters of many blocks, gathered in one pass, for reporting.
+
+Summaries like the assembly mass summary need several masses of every block: the total, heavy metal,
+fissile and coolant masses. Asking each block for them separately walks its components and
+nuclides once per mass. An :py:class:`InventorySummary` walks them once, and keeps the masses and any
+other block parameters as arrays, so that sums by assembly, assembly type, block type or flags are
+array operations.
+
+Examples
+--------
+>>> summary = InventorySummary(r.core, params=["power"])
+>>> dict(zip(summary.assemTypes, summary.sumByAssemblyType(summary.hmMass)))
+"""
+
+import numpy as np
+
+from armi.nucDirectory import nuclideBases
+from armi.reactor.flags import Flags
+from armi.utils import units
+
+_NUCLIDE_DATA = {}
+
+
+class InventorySummary:
+    """
+    The masses and parameters of the blocks of some assemblies, as arrays.
+
+    Parameters
+    ----------
+    assems : iterable of Assembly
+        The assemblies to summarize, e.g. a core
+    params : list of str, optional
+        Scalar block parameters to gather too. Missing values are NaN.
+    skipFlags : TypeSpec, optional
+        Blocks with these flags are left out of the summary
+
+    Attributes
+    ----------
+    assems : list of Assembly
+    blocks : list of Block
+    assemIndex : np.ndarray
+        The index of the assembly of each block
+    assemTypes, blockTypes : list of str
+        The distinct assembly and block types, in the order they are first found
+    assemTypeIndex, blockTypeIndex : np.ndarray
+        The index of the type of each assembly and of each block
+    mass, hmMass, fissileMass, coolantMass : np.ndarray
+        The total, heavy metal, fissile and coolant masses of each block, in grams. These are the
+        same as ``getMass``, ``getHMMass`` and ``getFissileMass`` of the block, and the mass of its
+        coolant and intercoolant components. They are computed together, the first time one of them
+        is used.
+    params : dict of np.ndarray
+        The requested parameters of each block
+    """
+
+    def __init__(self, assems, params=(), skipFlags=None):
+        self.assems = list(assems)
+        self.blocks = []
+        assemIndex = []
+        for i, a in enumerate(self.assems):
+            for b in a:
+                if skipFlags is not None and b.hasFlags(skipFlags):
+                    continue
+                self.blocks.append(b)
+                assemIndex.append(i)
+
+        self.assemIndex = np.array(assemIndex, dtype=int)
+        self.assemTypes, self.assemTypeIndex = _indexLabels([a.getType() for a in self.assems])
+        self.blockTypes, self.blockTypeIndex = _indexLabels([b.getType() for b in self.blocks])
+        # flags can be wider than 64 bits, so they are kept as python ints
+        self._flags = np.array([int(b.p.flags) for b in self.blocks], dtype=object)
+
+        self._masses = None
+        self.params = {param: np.array([b.p[param] for b in self.blocks], dtype=float) for param in params}
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} {len(self.assems)} assemblies, {len(self.blocks)} blocks>"
+
+    @property
+    def mass(self) -> np.ndarray:
+        return self._getMasses()[0]
+
+    @property
+    def hmMass(self) -> np.ndarray:
+        return self._getMasses()[1]
+
+    @property
+    def fissileMass(self) -> np.ndarray:
+        return self._getMasses()[2]
+
+    @property
+    def coolantMass(self) -> np.ndarray:
+        return self._getMasses()[3]
+
+    def _getMasses(self):
+        if self._masses is None:
+            self._masses = self._computeMasses()
+        return self._masses
+
+    def _computeMasses(self):
+        """Compute the masses of all blocks, with one pass over their components."""
+        masses = np.zeros((4, len(self.blocks)))
+        for i, b in enumerate(self.blocks):
+            symmetryFactor = b.getSymmetryFactor()
+            for c in b:
+                nDens = c.p.numberDensities
+                if c.p.nuclides is None or nDens is None or not len(nDens):
+                    continue
+
+                weights, isHeavyMetal, isFissile = _getNuclideData(c.p.nuclides)
+                volume = c.getVolume() / symmetryFactor
+                nucMasses = np.asarray(nDens) * weights * (volume / units.MOLES_PER_CC_TO_ATOMS_PER_BARN_CM)
+                mass = nucMasses.sum()
+                masses[0, i] += mass
+                masses[1, i] += nucMasses[isHeavyMetal].sum()
+                masses[2, i] += nucMasses[isFissile].sum()
+                if c.hasFlags([Flags.COOLANT, Flags.INTERCOOLANT], exact=True):
+                    masses[3, i] += mass
+
+        return masses
+
+    def hasFlags(self, typeSpec) -> np.ndarray:
+        """
+        Get a mask of the blocks that have some flags.
+
+        This has the same meaning as :py:meth:`Composite.hasFlags
+        <armi.reactor.composites.ArmiObject.hasFlags>`, with ``exact=False``.
+        """
+        if not typeSpec:
+            return np.ones(len(self.blocks), dtype=bool)
+
+        candidates = typeSpec if isinstance(typeSpec, (list, tuple, set)) else [typeSpec]
+        mask = np.zeros(len(self.blocks), dtype=bool)
+        for flags in candidates:
+            value = int(flags)
+            mask |= (self._flags & value == value).astype(bool)
+        return mask
+
+    def sumByAssembly(self, values, mask=None) -> np.ndarray:
+        """Sum some values of the blocks by assembly, optionally only over a mask of blocks."""
+        return self._sumBy(self.assemIndex, len(self.assems), values, mask)
+
+    def sumByAssemblyType(self, values, mask=None) -> np.ndarray:
+        """Sum some values of the blocks by assembly type, in the order of ``assemTypes``."""
+        return self._sumBy(self.assemTypeIndex[self.assemIndex], len(self.assemTypes), values, mask)
+
+    def sumByBlockType(self, values, mask=None) -> np.ndarray:
+        """Sum some values of the blocks by block type, in the order of ``blockTypes``."""
+        return self._sumBy(self.blockTypeIndex, len(self.blockTypes), values, mask)
+
+    @staticmethod
+    def _sumBy(index, length, values, mask):
+        values = np.asarray(values, dtype=float)
+        if mask is not None:
+            index = index[mask]
+            values = values[mask]
+        return np.bincount(index, weights=values, minlength=length)
+
+    def getBlockTypesByAssembly(self) -> list[list[str]]:
+        """Get the distinct block types of each assembly, in order from the bottom."""
+        blockTypes = [[] for _a in self.assems]
+        for i, typeIndex in zip(self.assemIndex.tolist(), self.blockTypeIndex.tolist()):
+            blockType = self.blockTypes[typeIndex]
+            if blockType not in blockTypes[i]:
+                blockTypes[i].append(blockType)
+        return blockTypes
+
+
+def _indexLabels(labels):
+    """Get the distinct labels in the order they are first found, and the index of each label."""
+    distinct = {}
+    index = np.array([distinct.setdefault(label, len(distinct)) for label in labels], dtype=int)
+    return list(distinct), index
+
+
+def _getNuclideData(byteNucs):
+    """Get the atomic weights and heavy metal and fissile masks of an array of nuclide names."""
+    byteNucs = np.asarray(byteNucs)
+    key = (byteNucs.dtype.str, byteNucs.tobytes())
+    if key not in _NUCLIDE_DATA:
+        nucs = [nuclideBases.byName[nuc.decode()] for nuc in byteNucs]
+        _NUCLIDE_DATA[key] = (
+            np.array([nuc.weight for nuc in nucs], dtype=float),
+            np.array([nuc.isHeavyMetal() for nuc in nucs], dtype=bool),
+            np.array([nuc.name in nuclideBases.NuclideBase.fissile for nuc in nucs], dtype=bool),
+        )
+    return _NUCLIDE_DATA[key]
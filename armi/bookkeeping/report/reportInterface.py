@@ -21,12 +21,14 @@ others this is the place to do it.
 
 import re
 
-from armi import interfaces, runLog
+from armi import interfaces, mpiActions, runLog
 from armi.bookkeeping import report
 from armi.bookkeeping.report import reportingUtils
+from armi.bookkeeping.report.inventory import InventorySummary
 from armi.physics import neutronics
 from armi.physics.neutronics.settings import CONF_NEUTRONICS_TYPE
 from armi.reactor.flags import Flags
+from armi.settings.fwSettings.globalSettings import CONF_PROFILE
 from armi.utils import reportPlotting, units
 
 ORDER = interfaces.STACK_ORDER.BEFORE + interfaces.STACK_ORDER.BOOKKEEPING
@@ -66,11 +68,12 @@ class ReportInterface(interfaces.Interface):
         runLog.info(report.ALL[report.RUN_META])
 
     def interactEveryNode(self, cycle, node):
+        summary = InventorySummary(self.r.core, params=["power"])
         if self.cs["assemPowSummary"]:
-            reportingUtils.summarizePower(self.r.core)
+            reportingUtils.summarizePower(self.r.core, summary)
 
         self.r.core.calcBlockMaxes()
-        reportingUtils.summarizePowerPeaking(self.r.core)
+        reportingUtils.summarizePowerPeaking(self.r.core, summary)
 
         runLog.important("Cycle {}, node {} Summary: ".format(cycle, node))
         runLog.important(
@@ -127,8 +130,22 @@ class ReportInterface(interfaces.Interface):
         self.o.timer.stopAll()  # consider the run done
         runLog.info(self.o.timer.report(inclusionCutoff=0.001, totalTime=True))
         _timelinePlot = self.o.timer.timeline(self.cs.caseTitle, self.cs["timelineInclusionCutoff"], totalTime=True)
+        self.writeTimerTrees()
         runLog.info(self.printReports())
 
+    def writeTimerTrees(self):
+        """
+        Gather the timer trees of all ranks and report them.
+
+        With the ``profile`` setting on, they are also written as a Chrome trace and a speedscope
+        file.
+        """
+        timerData = GatherTimerTreesAction().broadcast().invoke(self.o, self.r, self.cs)
+        runLog.info(self.o.timer.treeReport(inclusionCutoff=self.cs["timelineInclusionCutoff"], timerData=timerData))
+        if self.cs[CONF_PROFILE]:
+            self.o.timer.writeChromeTrace(f"{self.cs.caseTitle}.code-trace.json", timerData)
+            self.o.timer.writeSpeedscope(f"{self.cs.caseTitle}.speedscope.json", timerData)
+
     def printReports(self):
         """Report Interface Specific."""
         str_ = ""
@@ -194,3 +211,10 @@ class ReportInterface(interfaces.Interface):
                 thisTimeCount = 0
             totCount += 1  # noqa: SIM113
             thisTimeCount += 1
+
+
+class GatherTimerTreesAction(mpiActions.MpiAction):
+    """Gather the timer trees and trace events of all ranks, in rank order."""
+
+    def invokeHook(self):
+        return self.gather(self.o.timer.toDict())
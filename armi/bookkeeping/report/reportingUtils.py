@@ -31,6 +31,7 @@ import numpy as np
 
 from armi import context, interfaces, runLog
 from armi.bookkeeping import report
+from armi.bookkeeping.report.inventory import InventorySummary
 from armi.operators import RunTypes
 from armi.reactor.components import ComponentType
 from armi.reactor.flags import Flags
@@ -428,43 +429,29 @@ def writeAssemblyMassSummary(r):
     """
     massSum = []
 
-    for a in r.blueprints.assemblies.values():
-        mass = 0.0
-        hmMass = 0.0
-        fissileMass = 0.0
-        coolantMass = 0.0  # to calculate wet vs. dry weight.
-        types = []
-
-        for b in a:
-            # get masses in kg
-            # skip stationary blocks (grid plate doesn't count)
-            if b.hasFlags(Flags.GRID_PLATE):
-                continue
-            mass += b.getMass() / 1000.0
-            hmMass += b.getHMMass() / 1000.0
-            fissileMass += b.getFissileMass() / 1000.0
-            coolants = b.getComponents(Flags.COOLANT, exact=True) + b.getComponents(Flags.INTERCOOLANT, exact=True)
-            coolantMass += sum(coolant.getMass() for coolant in coolants) / 1000.0
-
-            blockType = b.getType()
-            if blockType not in types:
-                types.append(blockType)
-        # If the BOL fuel assem is in the center of the core, its area is 1/3 of the full area b/c
-        # its a sliced assem.
-
-        # count assemblies
-        core = r.core
-        thisTypeList = core.getChildrenOfType(a.getType())
-        count = 0
-        for t in thisTypeList:
-            ring, _pos = t.spatialLocator.getRingPos()
-            if ring == 1:
-                # only count center location once.
-                count += 1
-            else:
-                # add 3 if it's 1/3 core, etc.
-                count += core.powerMultiplier
+    # get masses in kg, skipping stationary blocks (grid plate doesn't count)
+    bpAssems = list(r.blueprints.assemblies.values())
+    summary = InventorySummary(bpAssems, skipFlags=Flags.GRID_PLATE)
+    wetMasses = summary.sumByAssembly(summary.mass) / 1000.0
+    hmMasses = summary.sumByAssembly(summary.hmMass) / 1000.0
+    fissileMasses = summary.sumByAssembly(summary.fissileMass) / 1000.0
+    coolantMasses = summary.sumByAssembly(summary.coolantMass) / 1000.0  # to calculate wet vs. dry weight.
+    blockTypes = summary.getBlockTypesByAssembly()
+
+    # count assemblies. If the BOL fuel assem is in the center of the core, its area is 1/3 of the
+    # full area b/c its a sliced assem.
+    core = r.core
+    counts = collections.Counter()
+    for t in core:
+        ring, _pos = t.spatialLocator.getRingPos()
+        if ring == 1:
+            # only count center location once.
+            counts[t.getType()] += 1
+        else:
+            # add 3 if it's 1/3 core, etc.
+            counts[t.getType()] += core.powerMultiplier
 
+    for i, a in enumerate(bpAssems):
         # Get the dominant materials
         pinMaterialKey = "pinMaterial"
         pinMaterialObj = a.getDominantMaterial([Flags.FUEL, Flags.CONTROL])
@@ -498,12 +485,12 @@ def writeAssemblyMassSummary(r):
         massSum.append(
             {
                 "type": a.getType(),
-                "wetMass": mass,
-                "hmMass": hmMass,
-                "fissileMass": fissileMass,
-                "dryMass": mass - coolantMass,
-                "count": count,
-                "components": types,
+                "wetMass": wetMasses[i],
+                "hmMass": hmMasses[i],
+                "fissileMass": fissileMasses[i],
+                "dryMass": wetMasses[i] - coolantMasses[i],
+                "count": counts[a.getType()],
+                "components": blockTypes[i],
                 pinMaterialKey: pinMaterial,
                 "structuralMaterial": structuralMaterial,
                 "coolantMaterial": coolantMaterial,
@@ -588,11 +575,10 @@ def setNeutronBalancesReport(core):
         )
         return
 
-    cap = core.calcAvgParam("rateCap", volumeAveraged=False, generationNum=2)
-    absorb = core.calcAvgParam("rateAbs", volumeAveraged=False, generationNum=2)
-    fis = core.calcAvgParam("rateFis", volumeAveraged=False, generationNum=2)
-    n2nProd = core.calcAvgParam("rateProdN2n", volumeAveraged=False, generationNum=2)
-    fisProd = core.calcAvgParam("rateProdFis", volumeAveraged=False, generationNum=2)
+    rates = core.summarizeParams(
+        ["rateCap", "rateAbs", "rateFis", "rateProdN2n", "rateProdFis"], volumeAveraged=False, generationNum=2
+    )
+    cap, absorb, fis, n2nProd, fisProd = (summary.average for summary in rates.values())
 
     leak = n2nProd + fisProd - absorb
 
@@ -706,15 +692,20 @@ def summarizePinDesign(core):
         runLog.warning(error)
 
 
-def summarizePowerPeaking(core):
+def summarizePowerPeaking(core, summary=None):
     """Prints reactor Fz, Fxy, Fq.
 
     Parameters
     ----------
     core : armi.reactor.reactors.Core
+    summary : InventorySummary, optional
+        A summary of the core with the ``power`` parameter, if one was already made
     """
+    summary = summary or InventorySummary(core, params=["power"])
+    power = summary.params["power"]
+
     # Fz is the axial peaking of the highest power assembly
-    _maxPow, maxPowBlock = core.getMaxParam("power", returnObj=True, generationNum=2)
+    maxPowBlock = summary.blocks[int(np.nanargmax(np.abs(power)))]
     maxPowAssem = maxPowBlock.parent
     avgPDens = maxPowAssem.calcAvgParam("pdens")
     peakPDens = maxPowAssem.getMaxParam("pdens")
@@ -724,29 +715,27 @@ def summarizePowerPeaking(core):
     axPeakF = peakPDens / avgPDens
 
     # Fxy is the radial peaking factor, looking at ALL assemblies with axially integrated powers.
-    power = 0.0
-    n = 0
-    for n, a in enumerate(core):
-        power += a.calcTotalParam("power", typeSpec=Flags.FUEL)
-    avgPow = power / (n + 1)
-    radPeakF = maxPowAssem.calcTotalParam("power", typeSpec=Flags.FUEL) / avgPow
+    assemPowers = summary.sumByAssembly(power, mask=summary.hasFlags(Flags.FUEL))
+    avgPow = assemPowers.sum() / len(summary.assems)
+    radPeakF = assemPowers[summary.assems.index(maxPowAssem)] / avgPow
 
     runLog.important(
         "Power Peaking: Fz= {0:.3f} Fxy= {1:.3f} Fq= {2:.3f}".format(axPeakF, radPeakF, axPeakF * radPeakF)
     )
 
 
-def summarizePower(core):
+def summarizePower(core, summary=None):
     """Provide an edit showing where the power is based on assembly types.
 
     Parameters
     ----------
     core : armi.reactor.reactors.Core
+    summary : InventorySummary, optional
+        A summary of the core with the ``power`` parameter, if one was already made
     """
-    sums = collections.defaultdict(lambda: 0.0)
-    pmult = core.powerMultiplier
-    for a in core:
-        sums[a.getType()] += a.calcTotalParam("power") * pmult
+    summary = summary or InventorySummary(core, params=["power"])
+    powers = summary.sumByAssemblyType(summary.params["power"]) * core.powerMultiplier
+    sums = dict(zip(summary.assemTypes, powers.tolist()))
 
     # calculate total power
     tot = sum(sums.values()) or float("inf")
@@ -0,0 +1,68 @@
+# Copyright 2026 TerraPower, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for the inventory summary."""
+
+import unittest
+
+import numpy as np
+
+from armi.bookkeeping.report.inventory import InventorySummary
+from armi.reactor.flags import Flags
+from armi.testing import loadTestReactor
+
+
+class TestInventorySummary(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        _o, cls.r = loadTestReactor(inputFileName="smallestTestReactor/armiRunSmallest.yaml")
+
+    def test_masses(self):
+        assems = list(self.r.blueprints.assemblies.values())
+        summary = InventorySummary(assems, skipFlags=Flags.GRID_PLATE)
+        self.assertFalse(any(b.hasFlags(Flags.GRID_PLATE) for b in summary.blocks))
+
+        for i, b in enumerate(summary.blocks):
+            coolants = b.getComponents(Flags.COOLANT, exact=True) + b.getComponents(Flags.INTERCOOLANT, exact=True)
+            self.assertAlmostEqual(summary.mass[i], b.getMass(), delta=1e-12 * b.getMass())
+            self.assertAlmostEqual(summary.hmMass[i], b.getHMMass(), delta=1e-12 * b.getMass())
+            self.assertAlmostEqual(summary.fissileMass[i], b.getFissileMass(), delta=1e-12 * b.getMass())
+            self.assertAlmostEqual(
+                summary.coolantMass[i], sum(c.getMass() for c in coolants), delta=1e-12 * b.getMass()
+            )
+
+        hmMasses = summary.sumByAssembly(summary.hmMass)
+        for a, hmMass in zip(assems, hmMasses):
+            expected = sum(b.getHMMass() for b in a if not b.hasFlags(Flags.GRID_PLATE))
+            self.assertAlmostEqual(hmMass, expected, delta=1e-9 * max(expected, 1.0))
+
+    def test_sumsAndFlags(self):
+        for i, b in enumerate(self.r.core.iterBlocks()):
+            b.p.power = float(i)
+        summary = InventorySummary(self.r.core, params=["power", "percentBu"])
+        power = summary.params["power"]
+
+        powerByType = dict(zip(summary.assemTypes, summary.sumByAssemblyType(power)))
+        for aType, typePower in powerByType.items():
+            expected = sum(a.calcTotalParam("power") for a in self.r.core if a.getType() == aType)
+            self.assertEqual(typePower, expected)
+
+        powerByBlockType = summary.sumByBlockType(power)
+        self.assertAlmostEqual(powerByBlockType.sum(), self.r.core.calcTotalParam("power", generationNum=2))
+
+        for typeSpec in (Flags.FUEL, [Flags.FUEL, Flags.PLENUM], Flags.FUEL | Flags.IGNITER, None):
+            np.testing.assert_array_equal(summary.hasFlags(typeSpec), [b.hasFlags(typeSpec) for b in summary.blocks])
+
+        fuelPower = summary.sumByAssembly(power, mask=summary.hasFlags(Flags.FUEL))
+        self.assertEqual(fuelPower.tolist(), [a.calcTotalParam("power", typeSpec=Flags.FUEL) for a in self.r.core])
+        self.assertEqual(summary.getBlockTypesByAssembly()[0], list(dict.fromkeys(b.getType() for b in self.r.core[0])))
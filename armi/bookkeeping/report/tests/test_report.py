@@ -326,3 +326,13 @@ class TestReportInterface(unittest.TestCase):
             repInt.interactEOL()
             self.assertIn("Comprehensive Core Report", mock.getStdout())
             self.assertIn("Assembly Area Fractions", mock.getStdout())
+            self.assertIn("TIMER TREE", mock.getStdout())
+
+        # the trace files are only written when profiling
+        self.assertFalse(os.path.exists(f"{o.cs.caseTitle}.code-trace.json"))
+        self.assertFalse(os.path.exists(f"{o.cs.caseTitle}.speedscope.json"))
+
+        repInt.cs = o.cs.modified(newSettings={"profile": True})
+        repInt.writeTimerTrees()
+        self.assertTrue(os.path.exists(f"{o.cs.caseTitle}.code-trace.json"))
+        self.assertTrue(os.path.exists(f"{o.cs.caseTitle}.speedscope.json"))
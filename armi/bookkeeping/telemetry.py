@@ -0,0 +1,247 @@
+# Copyright 2026 TerraPower, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Structured performance telemetry for the interface interactions of an ARMI run.
+
+The :py:class:`~armi.operators.operator.Operator` records one row of telemetry for every interface
+interaction it triggers, keyed by the interface, the interaction (``BOL``, ``EveryNode``,
+``Coupled``, ...), the cycle, the time node, and the coupled iteration. Each row holds:
+
+* ``wallTime``: the elapsed wall-clock time of the interaction, in seconds.
+* ``cpuTime``: the CPU time used by this process during the interaction, in seconds.
+* ``peakRssDeltaMB``: how much the peak resident memory of this process grew during the
+  interaction, in MB. This is zero for interactions that stay below a previous high-water mark.
+* ``mpiWaitTime``: time spent inside ``MpiAction`` broadcasts and gathers during the interaction,
+  in seconds. This is mostly time spent waiting on other ranks.
+
+Unlike the :py:class:`~armi.utils.codeTiming.MasterTimer` report, this data is kept as numbers. It
+is written to the output database, in a ``telemetry`` group next to the ``inputs`` group, so it
+does not show up as a difference when comparing the time nodes of two databases. It can be exported
+as CSV or JSON, and :py:func:`compareTelemetry` flags the interactions that slowed down between two
+runs, e.g. between two versions of ARMI or of a plugin.
+
+See Also
+--------
+armi.cli.telemetry : entry points to export and compare the telemetry of runs.
+"""
+
+import collections
+import contextlib
+import csv
+import json
+import sys
+import time
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+try:
+    # resource is only available on Unix-like platforms
+    import resource
+
+    _haveResource = True
+except ImportError:
+    _haveResource = False
+
+TELEMETRY_GROUP = "telemetry"
+
+KEY_COLUMNS = ("interface", "interaction", "cycle", "node", "iteration")
+VALUE_COLUMNS = ("wallTime", "cpuTime", "peakRssDeltaMB", "mpiWaitTime")
+COLUMNS = KEY_COLUMNS + VALUE_COLUMNS
+
+_mpiWaitTime = 0.0
+"""Total time this process has spent in MPI broadcasts and gathers (seconds)."""
+
+
+@contextlib.contextmanager
+def timeMpiWait():
+    """Count the time spent in the body as MPI wait time."""
+    global _mpiWaitTime
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        _mpiWaitTime += time.perf_counter() - start
+
+
+def getPeakRssMB() -> float:
+    """Return the peak resident set size of this process in MB, or NaN if it is not available."""
+    if not _haveResource:
+        return float("nan")
+
+    maxRss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS, but in kilobytes on Linux
+    return maxRss / (1024.0**2) if sys.platform == "darwin" else maxRss / 1024.0
+
+
+class Telemetry:
+    """
+    A table of performance measurements, one row per interface interaction.
+
+    Rows are kept as a list of tuples while recording, because appending to a list is the cheapest
+    thing to do in the middle of a run. They are converted to columns for output.
+    """
+
+    def __init__(self):
+        self.rows: List[Tuple] = []
+
+    def __len__(self):
+        return len(self.rows)
+
+    @contextlib.contextmanager
+    def record(self, interface: str, interaction: str, cycle: int, node: int, iteration: int):
+        """Measure the body of this context and add it to the table as one row."""
+        mpiWaitStart = _mpiWaitTime
+        peakRssStart = getPeakRssMB()
+        cpuStart = time.process_time()
+        wallStart = time.perf_counter()
+        try:
+            yield
+        finally:
+            wallTime = time.perf_counter() - wallStart
+            cpuTime = time.process_time() - cpuStart
+            self.rows.append(
+                (
+                    interface,
+                    interaction,
+                    cycle,
+                    node,
+                    iteration,
+                    wallTime,
+                    cpuTime,
+                    getPeakRssMB() - peakRssStart,
+                    _mpiWaitTime - mpiWaitStart,
+                )
+            )
+
+    def toColumns(self) -> Dict[str, np.ndarray]:
+        """Return the table as a dictionary of column arrays."""
+        columns = list(zip(*self.rows)) if self.rows else [()] * len(COLUMNS)
+        data = {}
+        for name, values in zip(COLUMNS, columns):
+            if name in ("interface", "interaction"):
+                data[name] = np.array(values, dtype=str)
+            elif name in KEY_COLUMNS:
+                data[name] = np.array(values, dtype=int)
+            else:
+                data[name] = np.array(values, dtype=float)
+        return data
+
+    @classmethod
+    def fromColumns(cls, data: Dict[str, np.ndarray]) -> "Telemetry":
+        """Build a table from a dictionary of column arrays, like the one from ``toColumns``."""
+        telemetry = cls()
+        columns = [np.asarray(data[name]).tolist() for name in COLUMNS]
+        telemetry.rows = [tuple(row) for row in zip(*columns)]
+        return telemetry
+
+    def writeToH5(self, h5file):
+        """Write the table into a ``telemetry`` group of an open HDF5 file, replacing any old one."""
+        if TELEMETRY_GROUP in h5file:
+            del h5file[TELEMETRY_GROUP]
+
+        group = h5file.create_group(TELEMETRY_GROUP)
+        for name, values in self.toColumns().items():
+            if values.dtype.kind == "U":
+                values = values.astype("S")
+            group.create_dataset(name, data=values)
+
+    @classmethod
+    def readFromH5(cls, h5file) -> "Telemetry":
+        """Read the table from the ``telemetry`` group of an open HDF5 file."""
+        if TELEMETRY_GROUP not in h5file:
+            raise KeyError(f"There is no {TELEMETRY_GROUP} data in {h5file.filename}")
+
+        group = h5file[TELEMETRY_GROUP]
+        data = {}
+        for name in COLUMNS:
+            values = group[name][()]
+            if values.dtype.kind == "S":
+                values = values.astype(str)
+            data[name] = values
+        return cls.fromColumns(data)
+
+    def writeCSV(self, fileName: str):
+        """Write the table to a CSV file, with a header row."""
+        with open(fileName, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(COLUMNS)
+            writer.writerows(self.rows)
+
+    def writeJSON(self, fileName: str):
+        """Write the table to a JSON file, as a list of one object per row."""
+        with open(fileName, "w") as f:
+            json.dump([dict(zip(COLUMNS, row)) for row in self.rows], f, indent=1)
+
+    def summarize(self) -> Dict[Tuple[str, str], Dict[str, float]]:
+        """
+        Total the value columns for each (interface, interaction) pair.
+
+        Totals are more robust to compare between two runs than individual rows, because the number
+        of time nodes or coupled iterations may differ.
+        """
+        totals = collections.defaultdict(lambda: dict.fromkeys(VALUE_COLUMNS + ("count",), 0.0))
+        for row in self.rows:
+            total = totals[row[0], row[1]]
+            for name, value in zip(VALUE_COLUMNS, row[len(KEY_COLUMNS) :]):
+                total[name] += value
+            total["count"] += 1
+        return dict(totals)
+
+
+def compareTelemetry(
+    ref: Telemetry, src: Telemetry, column: str = "wallTime", tolerance: float = 0.1, minimum: float = 0.1
+) -> List[Tuple[str, str, float, float, float]]:
+    """
+    Find the interactions that got more expensive between two runs.
+
+    Parameters
+    ----------
+    ref : Telemetry
+        Telemetry of the reference, or baseline, run.
+    src : Telemetry
+        Telemetry of the run being evaluated.
+    column : str, optional
+        Which value column to compare the per-interaction totals of.
+    tolerance : float, optional
+        Relative increase above which an interaction is reported as a regression.
+    minimum : float, optional
+        Interactions whose totals are below this in both runs are ignored, since their relative
+        changes are mostly noise.
+
+    Returns
+    -------
+    list
+        One ``(interface, interaction, refTotal, srcTotal, relativeChange)`` tuple per regression,
+        sorted from the largest relative change down. Interactions that are missing from the
+        reference run are reported with a relative change of infinity.
+    """
+    if column not in VALUE_COLUMNS:
+        raise ValueError(f"Cannot compare telemetry column `{column}`, choose one of {VALUE_COLUMNS}")
+
+    refTotals = ref.summarize()
+    srcTotals = src.summarize()
+    regressions = []
+    for key, srcTotal in srcTotals.items():
+        srcValue = srcTotal[column]
+        refValue = refTotals[key][column] if key in refTotals else 0.0
+        if max(srcValue, refValue) < minimum:
+            continue
+
+        change = (srcValue - refValue) / refValue if refValue > 0.0 else float("inf")
+        if change > tolerance:
+            regressions.append((key[0], key[1], refValue, srcValue, change))
+
+    return sorted(regressions, key=lambda r: r[-1], reverse=True)
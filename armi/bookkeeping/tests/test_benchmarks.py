@@ -0,0 +1,79 @@
+# Copyright 2026 TerraPower, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the performance benchmark suite."""
+
+import csv
+import json
+import unittest
+
+from armi.bookkeeping import benchmarks
+from armi.testing import loadTestReactor
+from armi.utils.directoryChangers import TemporaryDirectoryChanger
+
+
+class TestBenchmarks(unittest.TestCase):
+    def test_runBenchmarks(self):
+        results = benchmarks.runBenchmarks(["materials"], scale=0, repeat=2, traceMemory=True)
+        results = benchmarks.runBenchmarks(["materials"], scale=1, repeat=1, results=results)
+        self.assertEqual(
+            [row[:3] for row in results.rows], [("materials", 0, 0), ("materials", 0, 1), ("materials", 1, 0)]
+        )
+        for row in results.rows:
+            self.assertGreater(row[3], 0.0)
+
+        summary = results.summarize()
+        self.assertEqual(
+            [(s["scenario"], s["scale"], s["repetitions"]) for s in summary], [("materials", 0, 2), ("materials", 1, 1)]
+        )
+        self.assertGreater(summary[0]["peakAllocMB"], 0.0)
+        self.assertIsNone(summary[1]["peakAllocMB"])
+
+        with TemporaryDirectoryChanger():
+            results.writeJSON("bench.json")
+            results.writeCSV("bench.csv")
+            with open("bench.json") as f:
+                data = json.load(f)
+            with open("bench.csv", newline="") as f:
+                rows = list(csv.reader(f))
+
+        self.assertEqual(data["metadata"]["armiVersion"], results.metadata["armiVersion"])
+        self.assertEqual(len(data["results"]), 3)
+        self.assertEqual(data["summary"], summary)
+        self.assertEqual(tuple(rows[0]), benchmarks.COLUMNS)
+        self.assertEqual(len(rows), 4)
+
+        with self.assertRaises(ValueError):
+            benchmarks.runBenchmarks(["notAScenario"])
+
+    def test_materialsInValidRange(self):
+        """The materials scenario evaluates the correlations over their valid temperatures."""
+        evaluations = benchmarks.getMaterialEvaluations(5, properties=("linearExpansionPercent", "pseudoDensity"))
+        evaluations = {(mat.name, propName): kwargs for mat, propName, kwargs in evaluations}
+        temps = evaluations["Inconel600", "linearExpansionPercent"]["Tc"]
+        self.assertEqual((temps[0], temps[-1]), (21.0, 900.0))
+        self.assertEqual(len(temps), 5)
+        self.assertNotIn(("UraniumOxide", "pseudoDensity"), evaluations)
+
+    def test_addReplicatedRings(self):
+        _o, r = loadTestReactor(inputFileName="smallestTestReactor/armiRunSmallest.yaml")
+        numAssems = len(r.core)
+        numRings = r.core.getNumRings()
+
+        self.assertEqual(benchmarks.addReplicatedRings(r, 0), 0)
+        numAdded = benchmarks.addReplicatedRings(r, 2)
+        self.assertGreater(numAdded, 0)
+        self.assertEqual(len(r.core), numAssems + numAdded)
+        self.assertEqual(r.core.getNumRings(), numRings + 2)
+        self.assertEqual(len({a.getName() for a in r.core}), len(r.core))
@@ -25,6 +25,8 @@ import pathlib
 import shutil
 import unittest
 
+import numpy as np
+
 from armi import settings, utils
 from armi.bookkeeping import historyTracker
 from armi.bookkeeping.tests._constants import TUTORIAL_FILES
@@ -32,7 +34,9 @@ from armi.cases import case
 from armi.context import ROOT
 from armi.reactor import blocks, grids
 from armi.reactor.flags import Flags
+from armi.reactor.tests.test_assemblies import makeTestAssembly
 from armi.tests import ArmiTestHelper
+from armi.utils import tabulate
 from armi.utils.directoryChangers import TemporaryDirectoryChanger
 
 CASE_TITLE = "anl-afci-177"
@@ -219,6 +223,49 @@ class TestHistoryTracker(ArmiTestHelper):
         history.addAllDetailedAssems()
         self.assertEqual(len(history.detailAssemblyNames), 54)
 
+    def test_historyStore(self):
+        history = self.o.getInterface("history")
+        history.cs = history.cs.modified(newSettings={"historyStore": "memory"})
+        history.interactBOL()
+        testAssem = self.o.r.core.childrenByLocator[self.o.r.core.spatialGrid[0, 0, 0]]
+        b = testAssem.getFirstBlock(Flags.FUEL)
+        ztop = b.p.ztop
+
+        history.interactEveryNode(0, 1)
+        b.p.ztop = 2 * ztop
+        history.interactEveryNode(1, 0)
+        self.assertEqual(history.historyStore.timeSteps, [(0, 1), (1, 0)])
+        self.assertEqual(history.getBlockHistoryVal(b.getName(), "ztop", (0, 1)), ztop)
+        self.assertEqual(history.getBlockHistoryVal(b.getName(), "ztop", (1, 0)), 2 * ztop)
+
+        # untracked parameters are still read from the database
+        self.assertGreater(history.getBlockHistoryVal(b.getName(), "height", (0, 0)), 0)
+
+        # with tight coupling, the time node is recorded again after each coupled iteration
+        self.o.r.p.cycle, self.o.r.p.timeNode = 1, 0
+        b.p.ztop = 3 * ztop
+        history.interactCoupled(0)
+        self.assertEqual(history.historyStore.timeSteps, [(0, 1), (1, 0)])
+        self.assertEqual(history.getBlockHistoryVal(b.getName(), "ztop", (1, 0)), 3 * ztop)
+
+        # the store does not have the time node of the database from before the restart, so the
+        # report is written from the database
+        history.writeAssemHistory(testAssem, "history.txt")
+        with open("history.txt") as f:
+            report = f.read()
+        self.assertIn("key: ztop\n", report)
+        self.assertNotIn("(0,1)", report.splitlines()[0])
+
+        # once the store has every time node of the database, the report is written from the store
+        b.p.ztop = ztop
+        history.interactEveryNode(0, 0)
+        history.writeAssemHistory(testAssem, "history.txt")
+        with open("history.txt") as f:
+            report = f.read()
+        self.assertIn("(0,1)", report.splitlines()[0])
+        self.assertIn("key: location\n(0,0,0)  (0,0,0)  (0,0,0)\n", report)
+        self.assertIn(f"{ztop:11.5E}  {3 * ztop:11.5E}  {ztop:11.5E}", report)
+
     def test_getBlockInAssembly(self):
         history = self.o.getInterface("history")
         aFuel = self.o.r.core.getFirstAssembly(Flags.FUEL)
@@ -278,3 +325,41 @@ class TestHistoryTrackerNoModel(unittest.TestCase):
             self.history._getBlockHistoryFileName(block),
             "{}-blockName7-bHist.txt".format(self.history.cs.caseTitle),
         )
+
+    def test_historyStore(self):
+        assems = []
+        for num in range(2):
+            a = makeTestAssembly(2, num)
+            for k in range(2):
+                b = blocks.HexBlock(f"B{num}{k}")
+                b.p.power = 10.0 * num + k
+                a.add(b)
+            assems.append(a)
+
+        store = historyTracker.HistoryStore(["power", "mgFlux"])
+        store.record((0, 0), 0.0, assems[:1])
+        for b in assems[0]:
+            b.p.power *= 2
+            b.p.mgFlux = np.array([1.0, 2.0])
+        for node in range(1, 6):
+            store.record((0, node), float(node), assems)
+        store.record((0, 1), 1.5, assems)
+
+        (b00, b01), (b10, _b11) = [[b.getName() for b in a] for a in assems]
+        self.assertEqual(store.timeSteps, [(0, node) for node in range(6)])
+        self.assertEqual(store.times, [0.0, 1.5, 2.0, 3.0, 4.0, 5.0])
+        self.assertEqual(store.getValue(b01, "power", (0, 0)), 1.0)
+        self.assertEqual(store.getValue(b01, "power", (0, 1)), 2.0)
+        np.testing.assert_array_equal(store.getValue(b00, "mgFlux", (0, 5)), [1.0, 2.0])
+        with self.assertRaises(KeyError):
+            store.getValue(b10, "power", (0, 0))
+
+        np.testing.assert_array_equal(store.getHistories([b10], "power")[:2], [[np.nan], [10.0]])
+        self.assertEqual(store.getLocations(assems[1].getName()).tolist(), 5 * [[2, 2, 0]])
+
+    def test_formatTable(self):
+        values = np.random.default_rng(2).normal(0.0, 1e3, (4, 3))
+        self.assertEqual(
+            historyTracker._formatTable(values, "11.5E"),
+            tabulate.tabulate(values.tolist(), tableFmt="plain", floatFmt="11.5E"),
+        )
@@ -15,6 +15,7 @@
 """Tests for memoryProfiler."""
 
 import logging
+import tracemalloc
 import unittest
 from unittest.mock import MagicMock, patch
 
@@ -206,6 +207,84 @@ class TestMemoryProfiler(unittest.TestCase):
         ]
 
 
+class TestTracedMemoryProfiler(unittest.TestCase):
+    def setUp(self):
+        self.o, self.r = test_reactors.loadTestReactor(
+            TEST_ROOT,
+            {"debugMem": True, "debugMemTraceDepth": 4},
+            inputFileName="smallestTestReactor/armiRunSmallest.yaml",
+        )
+        self.memPro: memoryProfiler.MemoryProfiler = self.o.getInterface("memoryProfiler")
+
+    def tearDown(self):
+        memoryProfiler.stopTracing()
+        self.o.removeInterface(self.memPro)
+
+    def test_getSubsystem(self):
+        def traceback(*fileNames):
+            # like tracemalloc, this takes the frames from the most recent one outwards
+            return tracemalloc.Traceback(tuple((fileName, 1) for fileName in fileNames))
+
+        self.assertEqual(
+            memoryProfiler.getSubsystem(traceback("/src/numpy/core/numeric.py", "/src/armi/reactor/blocks.py")),
+            "composites",
+        )
+        self.assertEqual(
+            memoryProfiler.getSubsystem(
+                traceback("/src/armi/reactor/parameters/parameterCollections.py", "/src/armi/reactor/blocks.py")
+            ),
+            "parameters",
+        )
+        self.assertEqual(memoryProfiler.getSubsystem(traceback("/src/armi/utils/units.py")), memoryProfiler.OTHER_ARMI)
+        self.assertEqual(memoryProfiler.getSubsystem(traceback("/src/numpy/core/numeric.py")), memoryProfiler.OTHER)
+
+    def test_compareLineSizes(self):
+        old = {("a.py", 1): 1024**2, ("a.py", 2): 2 * 1024**2}
+        new = {("a.py", 1): 3 * 1024**2, ("a.py", 2): 1024**2, ("b.py", 5): 1024**2}
+        self.assertEqual(memoryProfiler.compareLineSizes(old, new), [("a.py:1", 2.0), ("b.py:5", 1.0)])
+        self.assertEqual(memoryProfiler.compareLineSizes(old, new, top=1), [("a.py:1", 2.0)])
+
+    def test_tracedMemoryBetweenNodes(self):
+        with mockRunLogs.BufferLog() as mock:
+            runLog.LOG.startLog("test_tracedMemoryBetweenNodes")
+            runLog.LOG.setVerbosity(logging.INFO)
+
+            self.memPro.interactBOL()
+            self.assertTrue(tracemalloc.is_tracing())
+            self.assertEqual(tracemalloc.get_traceback_limit(), 4)
+            self.assertIn("Traced memory (MB) by subsystem at `BOL`", mock.getStdout())
+            # the tracing replaces the walk through all of the objects
+            self.assertNotIn("UNIQUE_INSTANCE_COUNT", mock.getStdout())
+
+            mock.emptyStdout()
+            self._growingList = [[i] for i in range(10000)]
+            self.memPro.interactEveryNode(0, 1)
+            self.assertIn("Largest traced memory growths since the previous report, at `c0 n1`", mock.getStdout())
+            self.assertIn("test_memoryProfiler.py", mock.getStdout())
+
+            self.memPro.interactEOL()
+            self.assertFalse(tracemalloc.is_tracing())
+
+    def test_tracingCoversReactor(self):
+        """The tracing starts with the operator, so the allocations of the reactor are traced too."""
+        self.assertTrue(tracemalloc.is_tracing())
+        usage = memoryProfiler.SystemAndProcessMemoryUsage()
+        usage.addTracedMemory()
+        sizes = usage.subsystemMemoryInMB
+        self.assertGreater(sizes["composites"], 0.1)
+        self.assertEqual(max(sizes, key=sizes.get), "composites")
+
+    def test_addTracedMemory(self):
+        memoryProfiler.startTracing(1)
+        usage = memoryProfiler.SystemAndProcessMemoryUsage()
+        self.assertIsNone(usage.tracedMemoryInMB)
+
+        usage.addTracedMemory()
+        self.assertGreaterEqual(usage.tracedMemoryInMB, 0.0)
+        self.assertIn("DB buffers", usage.subsystemMemoryInMB)
+        self.assertEqual(usage.memoryGrowth, [])
+
+
 class KlassCounterTests(unittest.TestCase):
     def get_containers(self):
         container1 = [1, 2, 3, 4, 5, 6, 7, 2.0]
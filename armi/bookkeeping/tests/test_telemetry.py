@@ -0,0 +1,116 @@
+# Copyright 2026 TerraPower, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the interaction telemetry."""
+
+import csv
+import json
+import math
+import time
+import unittest
+
+import h5py
+
+from armi.bookkeeping import telemetry
+from armi.utils.directoryChangers import TemporaryDirectoryChanger
+
+
+def _buildTelemetry(wallTimes):
+    data = telemetry.Telemetry()
+    for (interface, interaction, node), wallTime in wallTimes.items():
+        data.rows.append((interface, interaction, 0, node, 0, wallTime, wallTime, 0.0, 0.0))
+    return data
+
+
+class TestTelemetry(unittest.TestCase):
+    def test_record(self):
+        data = telemetry.Telemetry()
+        with data.record("main", "BOL", 0, 0, 0):
+            with telemetry.timeMpiWait():
+                time.sleep(0.01)
+
+        self.assertEqual(len(data), 1)
+        row = dict(zip(telemetry.COLUMNS, data.rows[0]))
+        self.assertEqual(row["interface"], "main")
+        self.assertEqual(row["interaction"], "BOL")
+        self.assertGreaterEqual(row["wallTime"], 0.01)
+        self.assertGreaterEqual(row["mpiWaitTime"], 0.01)
+        self.assertLessEqual(row["mpiWaitTime"], row["wallTime"])
+        self.assertFalse(math.isnan(row["peakRssDeltaMB"]))
+
+    def test_recordOnError(self):
+        data = telemetry.Telemetry()
+        with self.assertRaises(RuntimeError):
+            with data.record("main", "EveryNode", 1, 2, 0):
+                raise RuntimeError("interaction failed")
+
+        self.assertEqual(len(data), 1)
+        self.assertEqual(data.rows[0][:5], ("main", "EveryNode", 1, 2, 0))
+
+    def test_summarize(self):
+        data = _buildTelemetry({("main", "EveryNode", 0): 1.0, ("main", "EveryNode", 1): 2.0, ("db", "BOL", 0): 0.5})
+        summary = data.summarize()
+        self.assertEqual(summary["main", "EveryNode"]["wallTime"], 3.0)
+        self.assertEqual(summary["main", "EveryNode"]["count"], 2)
+        self.assertEqual(summary["db", "BOL"]["wallTime"], 0.5)
+
+    def test_writeFiles(self):
+        data = _buildTelemetry({("main", "EveryNode", 0): 1.0, ("db", "BOL", 0): 0.5})
+        with TemporaryDirectoryChanger():
+            data.writeCSV("telemetry.csv")
+            with open("telemetry.csv") as f:
+                rows = list(csv.reader(f))
+            self.assertEqual(tuple(rows[0]), telemetry.COLUMNS)
+            self.assertEqual(len(rows), 3)
+
+            data.writeJSON("telemetry.json")
+            with open("telemetry.json") as f:
+                rows = json.load(f)
+            self.assertEqual(rows[0]["interface"], "main")
+            self.assertEqual(rows[1]["wallTime"], 0.5)
+
+    def test_h5RoundTrip(self):
+        data = _buildTelemetry({("main", "EveryNode", 0): 1.0, ("db", "BOL", 0): 0.5})
+        with TemporaryDirectoryChanger():
+            with h5py.File("test.h5", "w") as h5file:
+                with self.assertRaises(KeyError):
+                    telemetry.Telemetry.readFromH5(h5file)
+
+                telemetry.Telemetry().writeToH5(h5file)
+                self.assertEqual(len(telemetry.Telemetry.readFromH5(h5file)), 0)
+
+                # writing again replaces the old table
+                data.writeToH5(h5file)
+
+            with h5py.File("test.h5", "r") as h5file:
+                loaded = telemetry.Telemetry.readFromH5(h5file)
+
+        self.assertEqual(loaded.rows, data.rows)
+
+    def test_compareTelemetry(self):
+        ref = _buildTelemetry({("main", "EveryNode", 0): 1.0, ("db", "BOL", 0): 0.5, ("fast", "BOL", 0): 0.01})
+        src = _buildTelemetry(
+            {
+                ("main", "EveryNode", 0): 1.05,
+                ("db", "BOL", 0): 1.0,
+                ("fast", "BOL", 0): 0.05,
+                ("new", "EOL", 0): 0.2,
+            }
+        )
+        regressions = telemetry.compareTelemetry(ref, src, tolerance=0.1, minimum=0.1)
+        self.assertEqual([r[:2] for r in regressions], [("new", "EOL"), ("db", "BOL")])
+        self.assertAlmostEqual(regressions[1][-1], 1.0)
+
+        with self.assertRaises(ValueError):
+            telemetry.compareTelemetry(ref, src, column="interface")
@@ -46,7 +46,10 @@ Create a case suite from existing files, and run the suite::
     suite.discover('my-cases*.yaml', recursive=True)
     suite.run()
 
-.. warning:: Suite running may not work yet if the cases have interdependencies.
+Independent cases in a suite can also be run concurrently in a local process pool, with cases
+waiting for the cases they depend on::
+
+    suite.run(nProcesses=8)
 
 Create a ``burnStep`` sensitivity study from some base CS::
 
@@ -28,14 +28,31 @@ See Also
 armi.cases.case : An individual item of a case suite.
 """
 
+import copy
+import multiprocessing
 import os
+import sys
+import time
 import traceback
-from typing import Optional, Sequence
+from concurrent import futures
+from typing import Dict, List, Optional, Sequence, Tuple
 
 from armi import runLog, settings
 from armi.cases import case as armicase
 from armi.utils import directoryChangers, tabulate
 
+try:
+    # psutil is an optional requirement, only needed to cap parallel suite runs by memory
+    import psutil
+
+    _havePsutil = True
+except ImportError:
+    _havePsutil = False
+
+CASE_SUCCEEDED = "Succeeded"
+CASE_FAILED = "Failed"
+CASE_SKIPPED = "Skipped"
+
 
 class CaseSuite:
     """
@@ -195,24 +212,146 @@ class CaseSuite:
                 clone.add(case.clone(modifiedSettings=modifiedSettings, writeStyle=writeStyle))
         return clone
 
-    def run(self):
+    def run(self, nProcesses: int = 1, memoryPerCaseGB: Optional[float] = None):
         """
-        Run each case, one after the other.
+        Run the cases in this suite on the local machine.
+
+        With the default ``nProcesses=1``, each case is run one after the other, in the order they
+        were added to the suite. With more processes, independent cases are run concurrently in a
+        local process pool, and a case is only started once all of the cases it depends on (see
+        :py:attr:`Case.dependencies <armi.cases.case.Case.dependencies>`) have finished
+        successfully. A case whose dependency failed is skipped.
+
+        When running in parallel, the output of each case is written to a ``<title>.stdout`` file
+        in that case's directory, so that the logs of concurrently-running cases do not interleave.
+        Either way, a table of the outcome and wall time of each case is logged at the end.
+
+        Parameters
+        ----------
+        nProcesses : int, optional
+            The maximum number of cases to run at once. This is also capped at the number of CPUs on
+            this machine.
+        memoryPerCaseGB : float, optional
+            The expected peak memory use of a single case, in GB. If provided, the number of
+            concurrent cases is also capped so that they fit in the memory currently available on
+            this machine. This requires ``psutil``.
+
+        Returns
+        -------
+        dict
+            The outcome (one of ``CASE_SUCCEEDED``, ``CASE_FAILED`` or ``CASE_SKIPPED``) and wall
+            time in seconds of each case, keyed by case title.
 
         Warning
         -------
-        Suite running may not work yet if the cases have interdependencies. We typically run on a
-        HPC but are still working on a platform independent way of handling HPCs.
+        This runs each case as a serial process. Cases that need MPI parallelism should be run
+        one-by-one under ``mpiexec``, or submitted to an HPC.
         """
+        maxConcurrent = _getMaxConcurrentCases(nProcesses, memoryPerCaseGB)
+        if maxConcurrent > 1 and len(self) > 1:
+            results = self._runInProcessPool(maxConcurrent)
+        else:
+            results = self._runSerially()
+
+        self.writeRunTimeTable(results)
+        return results
+
+    def _runSerially(self) -> Dict[str, Tuple[str, float]]:
+        """Run each case, one after the other, in this process."""
+        results = {}
         for ci, case in enumerate(self):
             runLog.important(f"Running case {ci + 1}/{len(self)}: {case}")
+            start = time.time()
             with directoryChangers.DirectoryChanger(case.directory):
                 try:
                     case.run()
+                    status = CASE_SUCCEEDED
                 except Exception:
                     # allow all errors and continue to next run
                     runLog.error(f"{case} failed during execution.")
                     traceback.print_exc()
+                    status = CASE_FAILED
+            results[case.title] = (status, time.time() - start)
+
+        return results
+
+    def _runInProcessPool(self, maxConcurrent: int) -> Dict[str, Tuple[str, float]]:
+        """
+        Run the cases in a pool of worker processes, respecting the dependencies between them.
+
+        Notes
+        -----
+        ``Case.dependencies`` is evaluated on demand from the settings and plugin hooks, so the
+        dependency graph is built once up front. Only dependencies on cases within this suite are
+        considered; anything else is assumed to already exist on disk.
+        """
+        dependencies = {case: {dep for dep in case.dependencies if dep in self._cases} for case in self}
+        waiting: List[armicase.Case] = list(self)
+        results = {}
+
+        runLog.important(f"Running {len(self)} cases with up to {maxConcurrent} at a time")
+        # Forking keeps the App and plugins configured in the workers. Without fork, the workers
+        # re-import ARMI and are configured in _initSuiteWorker.
+        if "fork" in multiprocessing.get_all_start_methods():
+            mpContext = multiprocessing.get_context("fork")
+        else:
+            mpContext = multiprocessing.get_context("spawn")
+
+        with futures.ProcessPoolExecutor(
+            max_workers=maxConcurrent, mp_context=mpContext, initializer=_initSuiteWorker
+        ) as pool:
+            running = {}
+            while waiting or running:
+                # keep scanning until nothing changes, so skips propagate down chains of dependencies
+                scanAgain = True
+                while scanAgain:
+                    scanAgain = False
+                    for case in list(waiting):
+                        depStatuses = [results.get(dep.title, (None, 0.0))[0] for dep in dependencies[case]]
+                        if any(status in (CASE_FAILED, CASE_SKIPPED) for status in depStatuses):
+                            runLog.warning(f"Skipping {case}, because one of its dependencies did not succeed.")
+                            results[case.title] = (CASE_SKIPPED, 0.0)
+                            waiting.remove(case)
+                            scanAgain = True
+                        elif all(status == CASE_SUCCEEDED for status in depStatuses) and len(running) < maxConcurrent:
+                            runLog.important(f"Starting case {len(self) - len(waiting) + 1}/{len(self)}: {case}")
+                            running[pool.submit(_runCaseInWorker, _detachFromSuite(case))] = case
+                            waiting.remove(case)
+
+                if not running:
+                    # nothing can make progress, so whatever remains has circular dependencies
+                    for case in waiting:
+                        runLog.error(f"Skipping {case}, because it has circular dependencies within the suite.")
+                        results[case.title] = (CASE_SKIPPED, 0.0)
+                    break
+
+                done, _notDone = futures.wait(running, return_when=futures.FIRST_COMPLETED)
+                for future in done:
+                    case = running.pop(future)
+                    try:
+                        results[case.title] = future.result()
+                    except Exception:
+                        # the worker itself died, rather than the case raising an error
+                        runLog.error(f"The worker process running {case} failed.")
+                        traceback.print_exc()
+                        results[case.title] = (CASE_FAILED, 0.0)
+
+                    if results[case.title][0] == CASE_FAILED:
+                        runLog.error(f"{case} failed during execution. See the case log in {case.directory}")
+
+        return results
+
+    @staticmethod
+    def writeRunTimeTable(results: Dict[str, Tuple[str, float]]):
+        """Write a table of the outcome and wall time of each case that was run."""
+        data = [(title, status, f"{seconds:.1f}") for title, (status, seconds) in results.items()]
+        runLog.important(
+            tabulate.tabulate(
+                data,
+                headers=["Case", "Status", "Wall Time (s)"],
+                tableFmt="armi",
+            )
+        )
 
     def compare(
         self,
@@ -313,6 +452,72 @@ class CaseSuite:
         print(tabulate.tabulate([["Total number of differences: {}".format(totalDiffs)]], tableFmt=fmt))
 
 
+def _getMaxConcurrentCases(nProcesses: int, memoryPerCaseGB: Optional[float] = None) -> int:
+    """Determine how many cases can run at once, limited by the CPUs and memory on this machine."""
+    maxConcurrent = max(1, min(nProcesses, os.cpu_count() or 1))
+    if memoryPerCaseGB:
+        if _havePsutil:
+            availableGB = psutil.virtual_memory().available / (1024.0**3)
+            maxConcurrent = max(1, min(maxConcurrent, int(availableGB // memoryPerCaseGB)))
+        else:
+            runLog.warning("Cannot limit concurrent cases by memory without psutil; limiting by CPU count only.")
+
+    return maxConcurrent
+
+
+def _detachFromSuite(case: armicase.Case) -> armicase.Case:
+    """Make a shallow copy of a case that can be pickled without dragging its whole suite along."""
+    detached = copy.copy(case)
+    detached._caseSuite = None
+    detached._dependencies = set()
+    detached._tasks = []
+    return detached
+
+
+def _initSuiteWorker():
+    """Make sure ARMI is configured in a worker process that was not forked from a configured one."""
+    import armi
+
+    if not armi.isConfigured():
+        armi.configure(permissive=True)
+
+
+def _runCaseInWorker(case: armicase.Case) -> Tuple[str, float]:
+    """
+    Run a single case in a suite worker process.
+
+    All output of the case, including output from any compiled code it calls, is redirected to a
+    ``<title>.stdout`` file in the case directory so that concurrent cases do not interleave.
+    """
+    start = time.time()
+    sys.stdout.flush()
+    sys.stderr.flush()
+    origStdout, origStderr = sys.stdout, sys.stderr
+    # keep the worker's own descriptors, so they can be put back for the next case the pool runs
+    savedFds = (os.dup(1), os.dup(2))
+    with directoryChangers.DirectoryChanger(case.directory, dumpOnException=False):
+        with open(f"{case.title}.stdout", "w") as logFile:
+            # redirect the file descriptors, not just the Python streams, so that existing logging
+            # handlers and compiled code write to the case log too
+            os.dup2(logFile.fileno(), 1)
+            os.dup2(logFile.fileno(), 2)
+            sys.stdout = sys.stderr = logFile
+            try:
+                case.run()
+                status = CASE_SUCCEEDED
+            except Exception:
+                traceback.print_exc()
+                status = CASE_FAILED
+            finally:
+                logFile.flush()
+                sys.stdout, sys.stderr = origStdout, origStderr
+                for fd, savedFd in zip((1, 2), savedFds):
+                    os.dup2(savedFd, fd)
+                    os.close(savedFd)
+
+    return status, time.time() - start
+
+
 UNMISSABLE_FAILURE = '''
 !! THESE TESTS HAVE UNEXPECTED ABSENT RESULTS !!
 
@@ -24,6 +24,7 @@ import h5py
 
 from armi import cases, context, getApp, interfaces, plugins, runLog, settings
 from armi.bookkeeping.db.databaseInterface import DatabaseInterface
+from armi.cases import suite
 from armi.physics.fuelCycle.settings import CONF_SHUFFLE_LOGIC
 from armi.reactor import blueprints
 from armi.reactor.tests import test_reactors
@@ -472,6 +473,106 @@ class TestCaseSuiteComparison(unittest.TestCase):
         self.assertEqual(diff, 0)
 
 
+class _MarkerCase(cases.Case):
+    """A Case that only checks its dependencies have finished, then leaves a marker file behind."""
+
+    def run(self):
+        for dep in self.dependencies:
+            if not os.path.exists(os.path.join(dep.directory, f"{dep.title}.done")):
+                raise RuntimeError(f"{self} started before its dependency {dep} finished.")
+        if self.title.startswith("fail"):
+            raise RuntimeError(f"{self} failed on purpose.")
+        print(f"Running {self.title}")
+        with open(f"{self.title}.done", "w") as f:
+            f.write(self.title)
+
+
+class TestCaseSuiteRun(unittest.TestCase):
+    """CaseSuite.run() tests."""
+
+    def setUp(self):
+        self.td = directoryChangers.TemporaryDirectoryChanger()
+        self.td.__enter__()
+        self.suite = cases.CaseSuite(settings.Settings())
+
+    def tearDown(self):
+        self.td.__exit__(None, None, None)
+
+    def _addCase(self, title):
+        cs = settings.Settings()
+        cs.path = os.path.join(os.getcwd(), f"{title}.yaml")
+        case = _MarkerCase(cs=cs)
+        self.suite.add(case)
+        return case
+
+    def test_runSerially(self):
+        c1 = self._addCase("c1")
+        c2 = self._addCase("fail2")
+
+        results = self.suite.run()
+
+        self.assertEqual(results[c1.title][0], suite.CASE_SUCCEEDED)
+        self.assertEqual(results[c2.title][0], suite.CASE_FAILED)
+        self.assertTrue(os.path.exists("c1.done"))
+
+    def test_runInProcessPool(self):
+        """Cases run concurrently wait for their dependencies, and are skipped if those fail."""
+        c1 = self._addCase("c1")
+        c2 = self._addCase("c2")
+        c3 = self._addCase("c3")
+        c3.addExplicitDependency(c1)
+        c3.addExplicitDependency(c2)
+        f4 = self._addCase("fail4")
+        c5 = self._addCase("c5")
+        c5.addExplicitDependency(f4)
+        c6 = self._addCase("c6")
+        c6.addExplicitDependency(c5)
+
+        results = self.suite._runInProcessPool(2)
+
+        for case in (c1, c2, c3):
+            self.assertEqual(results[case.title][0], suite.CASE_SUCCEEDED)
+            self.assertTrue(os.path.exists(f"{case.title}.done"))
+            with open(f"{case.title}.stdout") as f:
+                self.assertIn(f"Running {case.title}", f.read())
+
+        self.assertEqual(results[f4.title][0], suite.CASE_FAILED)
+        with open(f"{f4.title}.stdout") as f:
+            self.assertIn("failed on purpose", f.read())
+        self.assertEqual(results[c5.title][0], suite.CASE_SKIPPED)
+        self.assertEqual(results[c6.title][0], suite.CASE_SKIPPED)
+        self.assertFalse(os.path.exists("c5.done"))
+
+    def test_runCaseInWorkerRestoresFds(self):
+        """The worker's stdout and stderr descriptors are put back after a case, for the next one."""
+        c1 = self._addCase("c1")
+        before = [os.fstat(fd)[1:3] for fd in (1, 2)]
+
+        status, _wallTime = suite._runCaseInWorker(c1)
+
+        self.assertEqual(status, suite.CASE_SUCCEEDED)
+        self.assertEqual([os.fstat(fd)[1:3] for fd in (1, 2)], before)
+        with open("c1.stdout") as f:
+            self.assertIn("Running c1", f.read())
+
+    def test_circularDependenciesAreSkipped(self):
+        c1 = self._addCase("c1")
+        c2 = self._addCase("c2")
+        c1.addExplicitDependency(c2)
+        c2.addExplicitDependency(c1)
+
+        results = self.suite._runInProcessPool(2)
+
+        self.assertEqual(results[c1.title][0], suite.CASE_SKIPPED)
+        self.assertEqual(results[c2.title][0], suite.CASE_SKIPPED)
+
+    def test_getMaxConcurrentCases(self):
+        self.assertEqual(suite._getMaxConcurrentCases(1), 1)
+        self.assertEqual(suite._getMaxConcurrentCases(0), 1)
+        self.assertLessEqual(suite._getMaxConcurrentCases(10000), os.cpu_count())
+        self.assertEqual(suite._getMaxConcurrentCases(10000, memoryPerCaseGB=1e9), 1)
+
+
 class TestExtraInputWriting(unittest.TestCase):
     """Make sure extra inputs from interfaces are written."""
 
@@ -53,6 +53,7 @@ class EntryPointsPlugin(plugins.ArmiPlugin):
     @plugins.HOOKIMPL
     def defineEntryPoints():
         from armi.cli import (
+            benchmark,
             checkInputs,
             # testing
             cleanTemps,
@@ -64,9 +65,11 @@ class EntryPointsPlugin(plugins.ArmiPlugin):
             reportsEntryPoint,
             run,
             runSuite,
+            telemetry,
         )
 
         entryPoints = []
+        entryPoints.append(benchmark.RunBenchmarks)
         entryPoints.append(checkInputs.CheckInputEntryPoint)
         entryPoints.append(checkInputs.ExpandBlueprints)
         entryPoints.append(clone.CloneArmiRunCommandBatch)
@@ -79,6 +82,8 @@ class EntryPointsPlugin(plugins.ArmiPlugin):
         entryPoints.append(run.RunEntryPoint)
         entryPoints.append(runSuite.RunSuiteCommand)
         entryPoints.append(gridGui.GridGuiEntryPoint)
+        entryPoints.append(telemetry.ExportTelemetry)
+        entryPoints.append(telemetry.CompareTelemetry)
 
         # testing
         entryPoints.append(cleanTemps.CleanTemps)
@@ -0,0 +1,102 @@
+# Copyright 2026 TerraPower, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Entry point into ARMI for running the performance benchmarks over the test reactors."""
+
+from armi import context, runLog
+from armi.cli.entryPoint import EntryPoint
+
+
+class RunBenchmarks(EntryPoint):
+    """Time the expensive operations of a run on the test reactor, optionally made bigger."""
+
+    name = "benchmark"
+    mode = context.Mode.BATCH
+
+    def addOptions(self):
+        self.parser.add_argument(
+            "scenarios",
+            nargs="*",
+            help="The benchmark scenarios to run. All of them are run if none are given.",
+        )
+        self.parser.add_argument(
+            "--scale",
+            type=int,
+            nargs="+",
+            default=[0],
+            help="The numbers of rings of assemblies to add around the core of the test reactor. The scenarios are "
+            "run once for each.",
+        )
+        self.parser.add_argument(
+            "--repeat",
+            type=int,
+            default=3,
+            help="The number of timed repetitions of each scenario.",
+        )
+        self.parser.add_argument(
+            "--memory",
+            action="store_true",
+            default=False,
+            help="Run each scenario once more under tracemalloc, to record the peak of its Python allocations.",
+        )
+        self.parser.add_argument("--csv", help="Path of a CSV file to write", type=str, default=None)
+        self.parser.add_argument("--json", help="Path of a JSON file to write", type=str, default=None)
+        self.parser.add_argument(
+            "--list",
+            "-l",
+            action="store_true",
+            default=False,
+            help="List the benchmark scenarios and exit.",
+        )
+
+    def invoke(self):
+        from armi.bookkeeping import benchmarks
+        from armi.utils import directoryChangers, tabulate
+
+        if self.args.list:
+            rows = [(s.name, s.description) for s in benchmarks.SCENARIOS.values()]
+            runLog.info("Benchmark scenarios:\n{}".format(tabulate.tabulate(rows, headers=("Scenario", "Description"))))
+            return
+
+        names = self.args.scenarios or None
+        results = None
+        with directoryChangers.TemporaryDirectoryChanger() as td:
+            for scale in self.args.scale:
+                results = benchmarks.runBenchmarks(
+                    names,
+                    scale=scale,
+                    repeat=self.args.repeat,
+                    traceMemory=self.args.memory,
+                    workDir=td.destination,
+                    results=results,
+                )
+
+        if self.args.csv:
+            runLog.info(f"Writing benchmark results to `{self.args.csv}`")
+            results.writeCSV(self.args.csv)
+        if self.args.json:
+            runLog.info(f"Writing benchmark results to `{self.args.json}`")
+            results.writeJSON(self.args.json)
+
+        rows = [tuple(row.values()) for row in results.summarize()]
+        headers = (
+            "Scenario",
+            "Scale",
+            "Repetitions",
+            "Min Wall (s)",
+            "Median Wall (s)",
+            "Median CPU (s)",
+            "Peak Alloc (MB)",
+        )
+        runLog.important("Benchmark results:\n{}".format(tabulate.tabulate(rows, headers=headers)))
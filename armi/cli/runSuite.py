@@ -12,7 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-"""Run multiple ARMI cases one after the other on the local machine."""
+"""Run multiple ARMI cases on the local machine, either one after the other or in parallel."""
 
 import os
 
@@ -23,9 +23,11 @@ from armi.utils import directoryChangers
 
 class RunSuiteCommand(RunEntryPoint):
     """
-    Recursively run all the cases in a suite one after the other on the local machine.
+    Recursively run all the cases in a suite on the local machine.
 
-    Invoke with ``mpirun`` or ``mpiexec`` to activate parallelism within each individual case.
+    By default, the cases are run one after the other. Invoke with ``mpirun`` or ``mpiexec`` to
+    activate parallelism within each individual case, or use ``--jobs`` to run several serial cases
+    at once.
     """
 
     name = "run-suite"
@@ -60,6 +62,19 @@ class RunSuiteCommand(RunEntryPoint):
             default=os.getcwd(),
             help=("The path containing the case suite to run. Default current working directory."),
         )
+        self.parser.add_argument(
+            "--jobs",
+            "-j",
+            type=int,
+            default=1,
+            help="The maximum number of cases to run at once, respecting dependencies between cases.",
+        )
+        self.parser.add_argument(
+            "--memoryPerCase",
+            type=float,
+            default=None,
+            help="Expected peak memory of one case in GB, used to limit how many cases run at once.",
+        )
 
     def invoke(self):
         with directoryChangers.DirectoryChanger(self.args.suiteDir, dumpOnException=False):
@@ -68,4 +83,4 @@ class RunSuiteCommand(RunEntryPoint):
             if self.args.list:
                 suite.echoConfiguration()
             else:
-                suite.run()
+                suite.run(nProcesses=self.args.jobs, memoryPerCaseGB=self.args.memoryPerCase)
@@ -0,0 +1,115 @@
+# Copyright 2026 TerraPower, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Entry points into ARMI for exporting and comparing the performance telemetry of runs."""
+
+from armi import context, runLog
+from armi.cli.entryPoint import EntryPoint
+
+
+def _readTelemetry(h5db):
+    import h5py
+
+    from armi.bookkeeping import telemetry
+
+    with h5py.File(h5db, "r") as h5file:
+        return telemetry.Telemetry.readFromH5(h5file)
+
+
+class ExportTelemetry(EntryPoint):
+    """Export the per-interaction performance telemetry of a run from its database."""
+
+    name = "export-telemetry"
+    mode = context.Mode.BATCH
+
+    def addOptions(self):
+        self.parser.add_argument("h5db", help="Path to the database of the run", type=str)
+        self.parser.add_argument("--csv", help="Path of a CSV file to write", type=str, default=None)
+        self.parser.add_argument("--json", help="Path of a JSON file to write", type=str, default=None)
+
+    def invoke(self):
+        from armi.utils import tabulate
+
+        data = _readTelemetry(self.args.h5db)
+        if self.args.csv:
+            runLog.info(f"Writing telemetry to `{self.args.csv}`")
+            data.writeCSV(self.args.csv)
+        if self.args.json:
+            runLog.info(f"Writing telemetry to `{self.args.json}`")
+            data.writeJSON(self.args.json)
+
+        summary = sorted(data.summarize().items(), key=lambda item: item[1]["wallTime"], reverse=True)
+        rows = [(interface, interaction, *totals.values()) for (interface, interaction), totals in summary]
+        headers = ("Interface", "Interaction", "Wall (s)", "CPU (s)", "Peak RSS Delta (MB)", "MPI Wait (s)", "Count")
+        runLog.info("Telemetry totals of `{}`:\n{}".format(self.args.h5db, tabulate.tabulate(rows, headers=headers)))
+
+
+class CompareTelemetry(EntryPoint):
+    """Report the interactions that got more expensive between two runs."""
+
+    name = "compare-telemetry"
+    mode = context.Mode.BATCH
+
+    def addOptions(self):
+        self.parser.add_argument(
+            "refDB",
+            type=str,
+            help="The database to be used as the reference, baseline case.",
+        )
+        self.parser.add_argument(
+            "cmpDB",
+            type=str,
+            help="The database to be used as the comparison, evaluated case.",
+        )
+        self.parser.add_argument(
+            "--column",
+            type=str,
+            default="wallTime",
+            help="The telemetry column to compare, e.g. wallTime, cpuTime, peakRssDeltaMB, or mpiWaitTime.",
+        )
+        self.parser.add_argument(
+            "--tolerance",
+            type=float,
+            default=0.1,
+            help="Relative increase of an interaction total above which it is reported as a regression.",
+        )
+        self.parser.add_argument(
+            "--minimum",
+            type=float,
+            default=0.1,
+            help="Interactions whose totals are below this in both runs are not compared.",
+        )
+
+    def invoke(self):
+        from armi.bookkeeping import telemetry
+        from armi.utils import tabulate
+
+        regressions = telemetry.compareTelemetry(
+            _readTelemetry(self.args.refDB),
+            _readTelemetry(self.args.cmpDB),
+            column=self.args.column,
+            tolerance=self.args.tolerance,
+            minimum=self.args.minimum,
+        )
+        if regressions:
+            headers = ("Interface", "Interaction", "Reference", "Comparison", "Relative Change")
+            runLog.warning(
+                "{} interactions regressed in `{}`:\n{}".format(
+                    len(regressions), self.args.column, tabulate.tabulate(regressions, headers=headers)
+                )
+            )
+        else:
+            runLog.info(f"No interactions regressed in `{self.args.column}`")
+
+        return len(regressions)
@@ -13,6 +13,7 @@
 # limitations under the License.
 """Test for run cli entry point."""
 
+import json
 import logging
 import os
 import sys
@@ -23,6 +24,7 @@ from armi import runLog
 from armi.__main__ import main
 from armi.bookkeeping.db.databaseInterface import DatabaseInterface
 from armi.bookkeeping.visualization.entryPoint import VisFileEntryPoint
+from armi.cli.benchmark import RunBenchmarks
 from armi.cli.checkInputs import CheckInputEntryPoint, ExpandBlueprints
 from armi.cli.clone import CloneArmiRunCommandBatch, CloneSuiteCommand
 from armi.cli.compareCases import CompareCases, CompareSuites
@@ -33,6 +35,7 @@ from armi.cli.modify import ModifyCaseSettingsCommand
 from armi.cli.reportsEntryPoint import ReportsEntryPoint
 from armi.cli.run import RunEntryPoint
 from armi.cli.runSuite import RunSuiteCommand
+from armi.cli.telemetry import CompareTelemetry, ExportTelemetry
 from armi.physics.neutronics.diffIsotxs import CompareIsotxsLibraries
 from armi.testing import loadTestReactor, reduceTestReactorRings
 from armi.tests import ARMI_RUN_PATH, TEST_ROOT, mockRunLogs
@@ -432,6 +435,52 @@ class TestRunEntryPoint(unittest.TestCase):
         self.assertEqual(excinfo.exception.code, 1)
 
 
+class TestTelemetryEntryPoints(unittest.TestCase):
+    def test_exportAndCompareTelemetry(self):
+        import h5py
+
+        from armi.bookkeeping import telemetry
+
+        data = telemetry.Telemetry()
+        data.rows.append(("main", "EveryNode", 0, 0, 0, 1.0, 1.0, 0.0, 0.0))
+        with TemporaryDirectoryChanger():
+            for fileName in ("ref.h5", "cmp.h5"):
+                with h5py.File(fileName, "w") as h5file:
+                    data.writeToH5(h5file)
+
+            export = ExportTelemetry()
+            export.addOptions()
+            export.parse_args(["ref.h5", "--csv", "ref.csv"])
+            self.assertEqual(export.name, "export-telemetry")
+            export.invoke()
+            self.assertTrue(os.path.exists("ref.csv"))
+
+            compare = CompareTelemetry()
+            compare.addOptions()
+            compare.parse_args(["ref.h5", "cmp.h5", "--tolerance", "0.05"])
+            self.assertEqual(compare.name, "compare-telemetry")
+            self.assertEqual(compare.invoke(), 0)
+
+
+class TestRunBenchmarks(unittest.TestCase):
+    def test_runBenchmarks(self):
+        with TemporaryDirectoryChanger():
+            bench = RunBenchmarks()
+            bench.addOptions()
+            bench.parse_args(["materials", "--repeat", "1", "--scale", "0", "1", "--json", "bench.json"])
+            self.assertEqual(bench.name, "benchmark")
+            bench.invoke()
+            with open("bench.json") as f:
+                data = json.load(f)
+
+        self.assertEqual([s["scale"] for s in data["summary"]], [0, 1])
+
+        with mockRunLogs.BufferLog() as mock:
+            bench.parse_args(["--list"])
+            bench.invoke()
+            self.assertIn("writeDatabase", mock.getStdout())
+
+
 class TestRunSuiteCommand(unittest.TestCase):
     def test_runSuiteCommandBasics(self):
         rs = RunSuiteCommand()
@@ -14,6 +14,8 @@
 
 """Cesium."""
 
+import numpy as np
+
 from armi.materials.material import Fluid
 from armi.utils.units import getTk
 
@@ -34,10 +36,8 @@ class Cs(Fluid):
         In ARMI, we define pseudoDensity() and density() as the same for Fluids.
         """
         Tk = getTk(Tc, Tk)
-        if Tk < self.meltingPoint():
-            return 1.93  # g/cm3
-        else:
-            return 1.843  # g/cm3
+        # solid below the melting point, liquid above
+        return np.where(Tk < self.meltingPoint(), 1.93, 1.843)[()]  # g/cm3
 
     def meltingPoint(self):
         return 301.7  # K
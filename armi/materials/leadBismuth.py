@@ -18,7 +18,7 @@ Lead-Bismuth eutectic.
 This is a great coolant for superfast neutron reactors. It's heavy though.
 """
 
-import math
+import numpy as np
 
 from armi.materials import material
 from armi.utils.units import getTk
@@ -56,7 +56,7 @@ class LeadBismuth(material.Fluid):
         Tk = getTk(Tc, Tk)
         self.checkPropertyTempRange("dynamic visc", Tk)
 
-        return 4.94e-4 * math.exp(754.1 / Tk)
+        return 4.94e-4 * np.exp(754.1 / Tk)
 
     def heatCapacity(self, Tk=None, Tc=None):
         r"""Heat ccapacity in J/kg/K from Sobolev. Expected accuracy 5%."""
@@ -18,7 +18,9 @@ Base Material classes.
 Most temperatures may be specified in either K or C and the functions will convert for you.
 """
 
+import copy
 import functools
+import re
 import traceback
 import warnings
 
@@ -26,6 +28,7 @@ import numpy as np
 from scipy.optimize import fsolve
 
 from armi import runLog
+from armi.materials.propertyTable import DEFAULT_TOLERANCE, PropertyTable
 from armi.nucDirectory import nuclideBases
 from armi.reactor.flags import TypeSpec
 from armi.utils import densityTools
@@ -103,6 +106,10 @@ class Material:
     -----
     Specific material classes may have many more attributes specific to the implementation
     for that material.
+
+    The temperature-dependent properties accept a numpy array of temperatures as well as a single
+    temperature, and return an array of values for an array of temperatures. See
+    :py:meth:`evaluate`.
     """
 
     def __init_subclass__(cls) -> None:
@@ -137,6 +144,7 @@ class Material:
         self.theoreticalDensityFrac = 1.0
         self.cached = {}
         self._backupCache = None
+        self._propertyTables = {}
         self._name = self.__class__.__name__
 
         # call subclass implementations
@@ -145,6 +153,20 @@ class Material:
     def __repr__(self):
         return f"<Material: {self._name}>"
 
+    def __deepcopy__(self, memo):
+        """
+        Copy a material, copying the mass fractions directly.
+
+        ``massFrac`` maps nuclide names to floats, so a shallow dictionary copy is a complete copy
+        and avoids visiting every entry through the generic deepcopy machinery.
+        """
+        memo[id(self)] = newMat = self.__class__.__new__(self.__class__)
+        state = self.__dict__.copy()
+        massFrac = state.pop("massFrac")
+        newMat.__dict__.update(copy.deepcopy(state, memo))
+        newMat.massFrac = dict(massFrac)
+        return newMat
+
     @property
     def name(self):
         """Getter for the private name attribute of this Material."""
@@ -189,6 +211,14 @@ class Material:
     def clearCache(self):
         """Clear the cache so all new values are recomputed."""
         self.cached = {}
+        self._clearPropertyTables()
+
+    def _clearPropertyTables(self):
+        """Drop the tabulated properties, which may depend on the composition, theoretical density, etc."""
+        # the cached values of those properties came from the tables
+        for propName in self._propertyTables:
+            self.cached.pop(propName, None)
+        self._propertyTables = {}
 
     def _getCached(self, name):
         """Obtain a value from the cache."""
@@ -314,10 +344,11 @@ class Material:
             raise ValueError(f"Mass fraction of {massFrac} for {nucName} is not between 0 and 1.")
 
         self.massFrac[nucName] = massFrac
+        self._clearPropertyTables()
 
     def applyInputParams(self):
         """Apply material-specific material input parameters."""
-        pass
+        self._clearPropertyTables()
 
     def adjustMassEnrichment(self, massEnrichment: float) -> None:
         """
@@ -415,12 +446,23 @@ class Material:
         self.massFrac = {nuc: weight for nuc, weight in zip(nucsNames, massFracs)}
         if self.refDens != 0.0:  # don't update density if not assigned
             self.refDens = updatedDensity
+        self._clearPropertyTables()
 
     def volumetricExpansion(self, Tk=None, Tc=None):
         pass
 
     def getTemperatureAtDensity(self, targetDensity: float, tempGuessInC: float) -> float:
-        """Get the temperature at which the perturbed density occurs (in Celsius)."""
+        """Get the temperature at which the perturbed density occurs (in Celsius).
+
+        If the density is tabulated (see :py:meth:`tabulateProperty`) and monotone, and the target
+        density is in the table, this is an inverse lookup in the table rather than a root find.
+        """
+        table = self.getPropertyTable("density")
+        if table is not None and table.isMonotone:
+            low, high = sorted((table.values[0], table.values[-1]))
+            if low <= targetDensity <= high:
+                return float(getTc(Tk=table.inverse(targetDensity)))
+
         # 0 at tempertature of targetDensity
         densFunc = lambda temp: self.density(Tc=temp) - targetDensity
         # is a numpy array if fsolve is called
@@ -528,7 +570,11 @@ class Material:
         pass
 
     def getProperty(self, propName: str, Tk: float = None, Tc: float = None, **kwargs) -> float:
-        """Gets properties in a way that caches them."""
+        """Gets properties in a way that caches them.
+
+        Properties that are tabulated (see :py:meth:`tabulateProperty`) are interpolated in their
+        table, unless other arguments are passed to the property.
+        """
         Tk = getTk(Tc, Tk)
 
         cached = self._getCached(propName)
@@ -536,12 +582,131 @@ class Material:
             # only use cached value if the temperature at which it is cached is the same.
             return cached[1]
         else:
-            # go look it up from material properties.
-            val = getattr(self, propName)(Tk=Tk, **kwargs)
+            table = None if kwargs else self.getPropertyTable(propName)
+            if table is not None:
+                val = table(Tk=Tk)
+            else:
+                # go look it up from material properties.
+                val = getattr(self, propName)(Tk=Tk, **kwargs)
             # cache only one value for each property. Prevents unbounded cache explosion.
             self._setCache(propName, (Tk, val))
             return val
 
+    def evaluate(self, propName: str, Tk=None, Tc=None, **kwargs) -> np.ndarray:
+        """
+        Evaluate a temperature-dependent property at many temperatures in one call.
+
+        Parameters
+        ----------
+        propName : str
+            The name of the property method, e.g. ``"density"`` or ``"thermalConductivity"``
+        Tk : array-like, optional
+            Temperatures in (K)
+        Tc : array-like, optional
+            Temperatures in (C)
+        kwargs
+            Any other arguments of the property method
+
+        Returns
+        -------
+        numpy array
+            The property value at each temperature, with the shape of the temperatures. Properties
+            that are constant are broadcast to that shape, and properties that are not defined are
+            NaN.
+
+        Notes
+        -----
+        The property method is called once, with the whole array, so the range check of the
+        property reports the indices of all the temperatures out of range at once.
+        """
+        if not ((Tc is not None) ^ (Tk is not None)):
+            raise ValueError(
+                f"Cannot evaluate {propName} from Tc={Tc} and Tk={Tk}. Please supply a single temperature."
+            )
+
+        temps = np.asarray(Tk if Tk is not None else Tc, dtype=float)
+        tempKwarg = {"Tk": temps} if Tk is not None else {"Tc": temps}
+        values = getattr(self, propName)(**tempKwarg, **kwargs)
+        return np.broadcast_to(np.asarray(values, dtype=float), temps.shape).copy()
+
+    def tabulateProperty(
+        self,
+        propName: str,
+        Tk: tuple = None,
+        Tc: tuple = None,
+        tolerance: float = DEFAULT_TOLERANCE,
+        numPoints: int = 65,
+    ) -> PropertyTable:
+        """
+        Tabulate a property over a range of temperatures, to speed up its later evaluations.
+
+        This is opt-in, for properties that are expensive to evaluate or to invert and that are
+        evaluated many times, e.g. in a tightly coupled thermal-hydraulics loop. Once tabulated,
+        :py:meth:`getProperty` interpolates the property in the table, and
+        :py:meth:`getTemperatureAtDensity` inverts the density table instead of root-finding.
+
+        Parameters
+        ----------
+        propName : str
+            The name of the property method, e.g. ``"density"``
+        Tk : tuple of float, optional
+            The (min, max) range of temperatures of the table in (K)
+        Tc : tuple of float, optional
+            The (min, max) range of temperatures of the table in (C). If neither range is given,
+            the valid range of the property from ``propertyValidTemperature`` is used.
+        tolerance : float, optional
+            The largest relative error of interpolation in the table, checked against the exact
+            correlation.
+        numPoints : int, optional
+            The number of temperatures to start from. The table is refined until it meets the
+            tolerance.
+
+        Returns
+        -------
+        PropertyTable
+            The table, which is also kept on this material until :py:meth:`clearCache`. It is also
+            dropped when the composition or the input parameters of the material change through
+            :py:meth:`setMassFrac`, :py:meth:`adjustMassFrac`, :py:meth:`clearMassFrac`,
+            :py:meth:`applyInputParams` or :py:meth:`adjustTD`. Other changes to the attributes the
+            property depends on need a call to :py:meth:`clearCache`.
+        """
+        if Tk is None and Tc is None:
+            validRange = self.getValidTemperatureRange(propName)
+            if validRange is None:
+                raise ValueError(f"There is no valid temperature range for {propName} of {self}, please provide one.")
+            (minT, maxT), units = validRange
+            Tk = (minT, maxT) if units == "K" else None
+            Tc = (minT, maxT) if units == "C" else None
+
+        minTk, maxTk = (getTk(Tc=T) for T in Tc) if Tc is not None else (getTk(Tk=T) for T in Tk)
+        table = PropertyTable(self, propName, minTk, maxTk, tolerance=tolerance, numPoints=numPoints)
+        self._propertyTables[propName] = table
+        # the cached value may be from the exact correlation
+        self.cached.pop(propName, None)
+        return table
+
+    def getValidTemperatureRange(self, propName: str):
+        """
+        Return the valid temperature range of a property, from ``propertyValidTemperature``.
+
+        Parameters
+        ----------
+        propName : str
+            The name of the property method, e.g. ``"thermalConductivity"``. It is looked up by its
+            label, e.g. ``"thermal conductivity"``.
+
+        Returns
+        -------
+        tuple or None
+            ``((minT, maxT), units)``, with units of ``"K"`` or ``"C"``, or None if the property has
+            no valid range.
+        """
+        return self.propertyValidTemperature.get(re.sub("([A-Z])", r" \1", propName).lower())
+
+    def getPropertyTable(self, propName: str):
+        """Return the table of a property from :py:meth:`tabulateProperty`, or None if it is not tabulated."""
+        return self._propertyTables.get(propName)
+
     def getMassFrac(
         self,
         nucName=None,
@@ -580,6 +745,7 @@ class Material:
     def clearMassFrac(self) -> None:
         """Zero out all nuclide mass fractions."""
         self.massFrac.clear()
+        self._clearPropertyTables()
 
     def removeNucMassFrac(self, nuc: str) -> None:
         self.setMassFrac(nuc, 0)
@@ -598,8 +764,8 @@ class Material:
         label : str
             The name of the function or property that is being checked.
 
-        val : float
-            The value to check whether it is between minT and maxT.
+        val : float or numpy array
+            The value(s) to check whether it is between minT and maxT.
 
         Notes
         -----
@@ -620,12 +786,17 @@ class Material:
         minT, maxT : float
             The minimum and maximum values that val is allowed to have.
 
-        val : float
-            The value to check whether it is between minT and maxT.
+        val : float or numpy array
+            The value to check whether it is between minT and maxT. If this is an array, every value
+            is checked, and the indices of the values out of range are reported.
 
         label : str
             The name of the function or property that is being checked.
         """
+        if np.ndim(val) > 0:
+            self._checkTempRangeArray(minT, maxT, np.asarray(val), label)
+            return
+
         if not minT <= val <= maxT:
             msg = "Temperature {0} out of range ({1} to {2}) for {3} {4}".format(val, minT, maxT, self.name, label)
             if FAIL_ON_RANGE or np.isnan(val):
@@ -638,6 +809,27 @@ class Material:
                     label="T out of bounds for {} {}".format(self.name, label),
                 )
 
+    def _checkTempRangeArray(self, minT, maxT, vals, label):
+        """Check an array of temperatures at once, and report the indices of the ones out of range."""
+        # NaN fails both comparisons, so it is out of range too
+        outOfRange = np.flatnonzero(~((minT <= vals) & (vals <= maxT)))
+        if not outOfRange.size:
+            return
+
+        offending = ", ".join(f"[{i}] {vals.flat[i]}" for i in outOfRange[:10])
+        if outOfRange.size > 10:
+            offending += f", ... ({outOfRange.size} in total)"
+        msg = f"Temperatures out of range ({minT} to {maxT}) for {self.name} {label} at indices {offending}"
+        if FAIL_ON_RANGE or np.isnan(vals.flat[outOfRange]).any():
+            runLog.error(msg)
+            raise ValueError(msg)
+        else:
+            runLog.warning(
+                msg,
+                single=True,
+                label="T out of bounds for {} {}".format(self.name, label),
+            )
+
     def densityTimesHeatCapacity(self, Tk: float = None, Tc: float = None) -> float:
         """
         Return heat capacity * density at a temperature.
@@ -806,7 +998,7 @@ class SimpleSolid(Material):
         density1 = self.density(Tk=self.refTempK)
         density2 = self.density(Tk=Tk, Tc=Tc)
 
-        if density1 == density2:
+        if np.all(density1 == density2):
             return 0
         else:
             return 100 * ((density1 / density2) ** (1.0 / 3.0) - 1)
@@ -856,6 +1048,7 @@ class FuelMaterial(Material):
         parameters to coolants and structural material, which are often not parameterized with any
         kind of enrichment.
         """
+        self._clearPropertyTables()
         if class1_wt_frac:
             if not 0 <= class1_wt_frac <= 1:
                 raise ValueError(
@@ -0,0 +1,146 @@
+# Copyright 2026 TerraPower, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Tabulated material properties, for fast repeated evaluations of expensive correlations.
+
+Some material correlations, like the steam tables of :py:mod:`armi.materials.water`, have many
+terms, and inverting them, e.g. to find the temperature at a given density, takes a root finder.
+When a tightly coupled calculation evaluates them many times, it can be much cheaper to tabulate
+the property once on a fine temperature grid and interpolate in that table.
+
+A :py:class:`PropertyTable` is built by :py:meth:`Material.tabulateProperty
+<armi.materials.material.Material.tabulateProperty>`, which is opt-in. The grid is refined until
+linear interpolation is within a relative tolerance of the exact correlation, checked at the
+midpoint of every interval. Temperatures outside the table are evaluated with the exact
+correlation.
+"""
+
+import numpy as np
+
+from armi.utils.units import getTk
+
+DEFAULT_TOLERANCE = 1e-6
+"""Default relative error bound of the interpolated values."""
+
+MAX_POINTS = 2**16 + 1
+"""Largest number of temperatures in a table, before giving up on the tolerance."""
+
+
+class PropertyTable:
+    """
+    A property of a material, tabulated over a range of temperatures.
+
+    Parameters
+    ----------
+    material : Material
+        The material whose property is tabulated
+    propName : str
+        The name of the property method, e.g. ``"density"``
+    minTk, maxTk : float
+        The range of temperatures of the table, in (K)
+    tolerance : float, optional
+        The largest relative error of linear interpolation in the table, compared to the exact
+        correlation.
+    numPoints : int, optional
+        The number of temperatures to start from. The grid is refined until it meets the tolerance.
+
+    Raises
+    ------
+    ValueError
+        If the property is not finite over the range, or the tolerance cannot be met with
+        ``MAX_POINTS`` temperatures.
+    """
+
+    def __init__(self, material, propName, minTk, maxTk, tolerance=DEFAULT_TOLERANCE, numPoints=65):
+        self.material = material
+        self.propName = propName
+        self.tolerance = tolerance
+        self.minTk = minTk
+        self.maxTk = maxTk
+        self.temperatures, self.values, self.maxError = self._tabulate(numPoints)
+
+        # the inverse lookup needs a strictly monotone property
+        steps = np.diff(self.values)
+        self.isIncreasing = bool((steps > 0.0).all())
+        self.isMonotone = self.isIncreasing or bool((steps < 0.0).all())
+
+    def __repr__(self):
+        return (
+            f"<PropertyTable {self.material.getName()} {self.propName} {self.minTk}-{self.maxTk} K, "
+            f"{len(self.temperatures)} points>"
+        )
+
+    def _exact(self, temps):
+        return self.material.evaluate(self.propName, Tk=temps)
+
+    def _tabulate(self, numPoints):
+        """Refine the grid until interpolation at the midpoints is within the tolerance."""
+        while True:
+            temps = np.linspace(self.minTk, self.maxTk, numPoints)
+            values = self._exact(temps)
+            midpoints = 0.5 * (temps[1:] + temps[:-1])
+            exact = self._exact(midpoints)
+            if not (np.isfinite(values).all() and np.isfinite(exact).all()):
+                raise ValueError(
+                    f"Cannot tabulate {self.propName} of {self.material}, it is not finite everywhere "
+                    f"from {self.minTk} to {self.maxTk} K."
+                )
+            interpolated = 0.5 * (values[1:] + values[:-1])
+            with np.errstate(divide="ignore", invalid="ignore"):
+                errors = np.abs(interpolated - exact) / np.abs(exact)
+            errors[exact == interpolated] = 0.0
+            maxError = float(np.max(errors))
+            if maxError <= self.tolerance:
+                return temps, values, maxError
+
+            numPoints = 2 * numPoints - 1
+            if numPoints > MAX_POINTS:
+                raise ValueError(
+                    f"Cannot tabulate {self.propName} of {self.material} within a relative error of "
+                    f"{self.tolerance} with {MAX_POINTS} points; the error is {maxError}."
+                )
+
+    def __call__(self, Tk=None, Tc=None):
+        """Interpolate the property at one or many temperatures."""
+        Tk = getTk(Tc, Tk)
+        temps = np.asarray(Tk, dtype=float)
+        values = np.interp(temps, self.temperatures, self.values)
+        outside = (temps < self.minTk) | (temps > self.maxTk)
+        if outside.any():
+            values = np.where(outside, self._exact(np.where(outside, temps, self.minTk)), values)
+        return values[()]
+
+    def inverse(self, values):
+        """
+        Return the temperatures (in K) at which the property has the given values.
+
+        Raises
+        ------
+        ValueError
+            If the property is not strictly monotone over the table, or a value is outside of the
+            table.
+        """
+        if not self.isMonotone:
+            raise ValueError(f"Cannot invert {self}, it is not monotone.")
+
+        values = np.asarray(values, dtype=float)
+        low, high = sorted((self.values[0], self.values[-1]))
+        if ((values < low) | (values > high)).any():
+            raise ValueError(f"Cannot invert {self} at {values}, outside of the tabulated values ({low} to {high}).")
+
+        if self.isIncreasing:
+            temps = np.interp(values, self.values, self.temperatures)
+        else:
+            temps = np.interp(values, self.values[::-1], self.temperatures[::-1])
+        return temps[()]
@@ -14,7 +14,7 @@
 
 """Silicon Carbide."""
 
-import math
+import numpy as np
 
 from armi.materials.material import Material
 from armi.nucDirectory import nuclideBases as nb
@@ -76,12 +76,12 @@ class SiC(Material):
     def heatCapacity(self, Tc=None, Tk=None):
         Tc = getTc(Tc, Tk)
         self.checkPropertyTempRange("heat capacity", Tc)
-        return 1110 + 0.15 * Tc - 425 * math.exp(-0.003 * Tc)
+        return 1110 + 0.15 * Tc - 425 * np.exp(-0.003 * Tc)
 
     def cumulativeLinearExpansion(self, Tk=None, Tc=None):
         Tc = getTc(Tc, Tk)
         self.checkPropertyTempRange("cumulative linear expansion", Tc)
-        return (4.22 + 8.33e-4 * Tc - 3.51 * math.exp(-0.00527 * Tc)) * 1.0e-6
+        return (4.22 + 8.33e-4 * Tc - 3.51 * np.exp(-0.00527 * Tc)) * 1.0e-6
 
     def pseudoDensity(self, Tc=None, Tk=None):
         Tc = getTc(Tc, Tk)
@@ -94,4 +94,4 @@ class SiC(Material):
     def thermalConductivity(self, Tc=None, Tk=None):
         Tc = getTc(Tc, Tk)
         self.checkPropertyTempRange("thermal conductivity", Tc)
-        return (52000 * math.exp(-1.24e-5 * Tc)) / (Tc + 437)
+        return (52000 * np.exp(-1.24e-5 * Tc)) / (Tc + 437)
@@ -14,6 +14,8 @@
 
 """Simple sodium material."""
 
+import numpy as np
+
 from armi import runLog
 from armi.materials import material
 from armi.utils.units import getTc, getTk
@@ -65,10 +67,11 @@ class Sodium(material.Fluid):
         Tc = getTc(Tc, Tk)
         self.checkPropertyTempRange("density", Tc)
 
-        if (Tc is not None) and (Tc <= 97.72):
+        if np.any(Tc <= 97.72):
+            minTc = np.min(Tc)
             runLog.warning(
-                "Sodium frozen at Tc: {0}".format(Tc),
-                label="Sodium frozen at Tc={0}".format(Tc),
+                "Sodium frozen at Tc: {0}".format(minTc),
+                label="Sodium frozen at Tc={0}".format(minTc),
                 single=True,
             )
 
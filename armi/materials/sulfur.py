@@ -44,6 +44,7 @@ class Sulfur(material.Fluid):
 
     def updateTD(self, TD):
         self.fullDensFrac = float(TD)
+        self.clearCache()
 
     def setDefaultMassFracs(self):
         """Mass fractions."""
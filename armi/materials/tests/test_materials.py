@@ -18,6 +18,7 @@ import pickle
 import unittest
 from copy import deepcopy
 
+import numpy as np
 from numpy import testing
 
 from armi import context, materials, settings
@@ -110,6 +111,54 @@ class MaterialConstructionTests(unittest.TestCase):
             matClass()
 
 
+class MaterialEvaluateTests(unittest.TestCase):
+    """Make sure material properties can be evaluated at many temperatures at once."""
+
+    PROPERTIES = ["linearExpansionPercent", "density", "pseudoDensity", "thermalConductivity", "heatCapacity"]
+
+    def test_evaluateAllMaterials(self):
+        """Evaluating a property with an array matches evaluating it one temperature at a time."""
+        numChecked = 0
+        for matClass in materials.iterAllMaterialClassesInNamespace(materials):
+            mat = matClass()
+            for propName in self.PROPERTIES:
+                # use a bit less than the valid range, to stay clear of the boundaries
+                (minT, maxT), units = mat.propertyValidTemperature.get(propName, ((400.0, 800.0), "K"))
+                temps = np.linspace(minT, maxT, 7)[1:-1]
+                tempKwarg = "Tk" if units == "K" else "Tc"
+                try:
+                    expected = [getattr(mat, propName)(**{tempKwarg: float(t)}) for t in temps]
+                except (NotImplementedError, ValueError):
+                    # not defined for this material
+                    continue
+
+                values = mat.evaluate(propName, **{tempKwarg: temps})
+                self.assertEqual(values.shape, temps.shape)
+                testing.assert_allclose(
+                    values, np.array(expected, dtype=float), rtol=1e-12, err_msg=f"{mat} {propName}"
+                )
+                numChecked += 1
+
+        self.assertGreater(numChecked, 100)
+
+    def test_evaluateReportsIndices(self):
+        mat = materials.UraniumOxide()
+        temps = np.array([500.0, 200.0, 1000.0, 5000.0])
+        with mockRunLogs.BufferLog() as mock:
+            values = mat.evaluate("thermalConductivity", Tk=temps)
+            self.assertIn("at indices [1] 200.0, [3] 5000.0", mock.getStdout())
+        self.assertAlmostEqual(values[0], mat.thermalConductivity(Tk=500.0))
+
+        with self.assertRaisesRegex(ValueError, "Please supply a single temperature"):
+            mat.evaluate("density")
+
+    def test_evaluateFailOnRange(self):
+        mat = materials.UraniumOxide()
+        temps = np.array([500.0, np.nan])
+        with self.assertRaisesRegex(ValueError, "at indices \\[1\\] nan"):
+            mat.evaluate("density", Tk=temps)
+
+
 class MaterialFindingTests(unittest.TestCase):
     """Make sure materials are discoverable as designed."""
 
@@ -0,0 +1,93 @@
+# Copyright 2026 TerraPower, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for tabulated material properties."""
+
+import unittest
+
+import numpy as np
+
+from armi import materials
+from armi.materials.water import SaturatedWater
+
+
+class TestPropertyTable(unittest.TestCase):
+    def setUp(self):
+        self.mat = SaturatedWater()
+        self.table = self.mat.tabulateProperty("density", Tk=(300.0, 600.0), tolerance=1e-7)
+
+    def test_tolerance(self):
+        self.assertLessEqual(self.table.maxError, 1e-7)
+        temps = np.random.default_rng(1).uniform(300.0, 600.0, 500)
+        exact = self.mat.evaluate("density", Tk=temps)
+        np.testing.assert_allclose(self.table(Tk=temps), exact, rtol=1e-7)
+
+    def test_outsideTable(self):
+        """Temperatures outside of the table are evaluated with the exact correlation."""
+        self.assertEqual(self.table(Tk=620.0), self.mat.density(Tk=620.0))
+        values = self.table(Tc=np.array([100.0, 400.0]))
+        self.assertAlmostEqual(values[1], self.mat.density(Tc=400.0), places=15)
+
+    def test_getProperty(self):
+        self.assertIs(self.mat.getPropertyTable("density"), self.table)
+        self.assertEqual(self.mat.getProperty("density", Tk=450.0), self.table(Tk=450.0))
+
+        self.mat.clearCache()
+        self.assertIsNone(self.mat.getPropertyTable("density"))
+
+    def test_getTemperatureAtDensity(self):
+        self.assertTrue(self.table.isMonotone)
+        self.assertFalse(self.table.isIncreasing)
+        density = self.mat.density(Tc=150.0)
+        self.assertAlmostEqual(self.mat.getTemperatureAtDensity(density, 100.0), 150.0, places=3)
+
+        # outside of the table, this is still a root find
+        density = self.mat.density(Tc=20.0)
+        self.assertAlmostEqual(self.mat.getTemperatureAtDensity(density, 25.0), 20.0, places=6)
+        with self.assertRaisesRegex(ValueError, "outside of the tabulated values"):
+            self.table.inverse(density)
+
+    def test_defaultRange(self):
+        mat = materials.UraniumOxide()
+        table = mat.tabulateProperty("heatCapacity")
+        self.assertEqual((table.minTk, table.maxTk), (298.15, 3120.0))
+        self.assertEqual(mat.getValidTemperatureRange("heatCapacity"), ((298.15, 3120.0), "K"))
+        self.assertIsNone(mat.getValidTemperatureRange("pseudoDensity"))
+
+        with self.assertRaisesRegex(ValueError, "There is no valid temperature range"):
+            mat.tabulateProperty("pseudoDensity")
+
+    def test_notFinite(self):
+        # the correlation is not real above the critical temperature of sodium
+        with self.assertRaisesRegex(ValueError, "it is not finite everywhere"):
+            materials.Sodium().tabulateProperty("density", Tc=(100.0, 2300.0))
+
+    def test_compositionChanges(self):
+        """The tables are dropped when the composition of the material changes."""
+        mat = materials.UZr()
+        mat.applyInputParams(ZR_wt_frac=0.1)
+        mat.tabulateProperty("density", Tc=(300.0, 600.0))
+        density = mat.getProperty("density", Tc=400.0)
+
+        mat.applyInputParams(ZR_wt_frac=0.2)
+        self.assertIsNone(mat.getPropertyTable("density"))
+        self.assertEqual(mat.getProperty("density", Tc=400.0), mat.density(Tc=400.0))
+        self.assertNotAlmostEqual(mat.getProperty("density", Tc=400.0), density)
+
+        mat.tabulateProperty("density", Tc=(300.0, 600.0))
+        mat.setMassFrac("ZR", 0.3)
+        self.assertIsNone(mat.getPropertyTable("density"))
+
+        mat.tabulateProperty("density", Tc=(300.0, 600.0))
+        mat.adjustMassEnrichment(0.2)
+        self.assertIsNone(mat.getPropertyTable("density"))
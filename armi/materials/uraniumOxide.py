@@ -23,8 +23,8 @@ uses data from [#ornltm2000]_.
 """
 
 import collections
-import math
 
+import numpy as np
 from numpy import interp
 
 from armi import runLog
@@ -168,9 +168,9 @@ class UraniumOxide(material.FuelMaterial, material.SimpleSolid):
         hcc = self.heatCapacityConstants
         # eq 4.2
         specificHeatCapacity = (
-            hcc.c1 * (hcc.theta / Tk) ** 2 * math.exp(hcc.theta / Tk) / (math.exp(hcc.theta / Tk) - 1.0) ** 2
+            hcc.c1 * (hcc.theta / Tk) ** 2 * np.exp(hcc.theta / Tk) / (np.exp(hcc.theta / Tk) - 1.0) ** 2
             + 2 * hcc.c2 * Tk
-            + hcc.c3 * hcc.Ea * math.exp(-hcc.Ea / Tk) / Tk**2
+            + hcc.c3 * hcc.Ea * np.exp(-hcc.Ea / Tk) / Tk**2
         )
         return specificHeatCapacity
 
@@ -194,10 +194,11 @@ class UraniumOxide(material.FuelMaterial, material.SimpleSolid):
         Tk = getTk(Tc, Tk)
         self.checkPropertyTempRange("linear expansion percent", Tk)
 
-        if Tk >= 273.0 and Tk < 923.0:
-            return (-2.66e-03 + 9.802e-06 * Tk - 2.705e-10 * Tk**2 + 4.391e-13 * Tk**3) * 100.0
-        else:
-            return (-3.28e-03 + 1.179e-05 * Tk - 2.429e-09 * Tk**2 + 1.219e-12 * Tk**3) * 100.0
+        return np.where(
+            (Tk >= 273.0) & (Tk < 923.0),
+            (-2.66e-03 + 9.802e-06 * Tk - 2.705e-10 * Tk**2 + 4.391e-13 * Tk**3) * 100.0,
+            (-3.28e-03 + 1.179e-05 * Tk - 2.429e-09 * Tk**2 + 1.219e-12 * Tk**3) * 100.0,
+        )[()]
 
     def thermalConductivity(self, Tk: float = None, Tc: float = None) -> float:
         """
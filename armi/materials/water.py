@@ -15,6 +15,8 @@
 
 import math
 
+import numpy as np
+
 from armi.materials.material import Fluid
 from armi.nucDirectory import elements
 from armi.nucDirectory import nuclideBases as nb
@@ -25,6 +27,14 @@ from armi.utils.units import getTk
 _REF_SR1_86 = "IAPWS SR1-86 Revised Supplementary Release on Saturation Properties of Ordinary Water and Steam"
 
 
+def _asComplex(tau):
+    """
+    Make an array of tau complex, so that its fractional powers past the supercritical point are
+    complex numbers, as they are for a Python float, rather than NaN.
+    """
+    return tau.astype(complex) if isinstance(tau, np.ndarray) else tau
+
+
 class Water(Fluid):
     """
     Water.
@@ -119,7 +129,7 @@ class Water(Fluid):
         IAPWS-IF97 is now the international standard for calculations in the
         steam power industry
         """
-        tau = self.tau(Tc=Tc, Tk=Tk)
+        tau = _asComplex(self.tau(Tc=Tc, Tk=Tk))
         T_ratio = self.TEMPERATURE_CRITICAL_K / getTk(Tc=Tc, Tk=Tk)
 
         a1 = -7.85951783
@@ -227,7 +237,7 @@ class Water(Fluid):
         normalized_phi = (
             self.d["phi"]
             + 19.0 / 20.0 * self.d[1] * theta**-20.0
-            + self.d[2] * math.log(theta)
+            + self.d[2] * np.log(theta)
             + 9.0 / 7.0 * self.d[3] * theta**3.5
             + 5.0 / 4.0 * self.d[4] * theta**4.0
             + 109.0 / 107.0 * self.d[5] * theta**53.5
@@ -341,7 +351,7 @@ class SaturatedWater(Water):
         http://www.iapws.org/relguide/supsat.pdf
         IAPWS-IF97 is now the international standard for calculations in the steam power industry
         """
-        tau = self.tau(Tc=Tc, Tk=Tk)
+        tau = _asComplex(self.tau(Tc=Tc, Tk=Tk))
 
         b1 = 1.99274064
         b2 = 1.09965342
@@ -399,7 +409,7 @@ class SaturatedSteam(Water):
         http://www.iapws.org/relguide/supsat.pdf
         IAPWS-IF97 is now the international standard for calculations in the steam power industry
         """
-        tau = self.tau(Tc=Tc, Tk=Tk)
+        tau = _asComplex(self.tau(Tc=Tc, Tk=Tk))
 
         c1 = -2.03150240
         c2 = -2.68302940
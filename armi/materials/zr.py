@@ -14,7 +14,7 @@
 
 """Zirconium metal."""
 
-from numpy import interp
+from numpy import interp, where
 
 from armi.materials.material import Material
 from armi.utils.units import getTk
@@ -89,10 +89,11 @@ class Zr(Material):
         Tk = getTk(Tc, Tk)
         self.checkPropertyTempRange("density", Tk)
 
-        if Tk < 1135:
-            return -3.29256e-8 * Tk**2 - 9.67145e-5 * Tk + 6.60176
-        else:
-            return -2.61683e-8 * Tk**2 - 1.11331e-4 * Tk + 6.63616
+        return where(
+            Tk < 1135,
+            -3.29256e-8 * Tk**2 - 9.67145e-5 * Tk + 6.60176,
+            -2.61683e-8 * Tk**2 - 1.11331e-4 * Tk + 6.63616,
+        )[()]
 
     def thermalConductivity(self, Tk=None, Tc=None):
         """
@@ -128,7 +129,8 @@ class Zr(Material):
         self.checkPropertyTempRange("linear expansion percent", Tk)
 
         # NOTE: checkPropertyTempRange takes care of lower/upper limits
-        if Tk < 1137:
-            return -0.111 + (2.325e-4 * Tk) + (5.595e-7 * Tk**2) - (1.768e-10 * Tk**3)
-        else:
-            return -0.759 + (1.474e-3 * Tk) - (5.140e-7 * Tk**2) + (1.559e-10 * Tk**3)
+        return where(
+            Tk < 1137,
+            -0.111 + (2.325e-4 * Tk) + (5.595e-7 * Tk**2) - (1.768e-10 * Tk**3),
+            -0.759 + (1.474e-3 * Tk) - (5.140e-7 * Tk**2) + (1.559e-10 * Tk**3),
+        )[()]
@@ -60,9 +60,14 @@ import math
 import pickle
 import timeit
 
+import numpy as np
+
 from armi import context, interfaces, runLog, settings, utils
+from armi.bookkeeping import telemetry
+from armi.bookkeeping.db import reactorImage
 from armi.reactor import reactors
 from armi.reactor.parameters import parameterDefinitions
+from armi.settings.fwSettings.globalSettings import CONF_DISTRIBUTE_STATE_MODE
 from armi.utils import iterables, tabulate
 
 
@@ -132,7 +137,8 @@ class MpiAction:
             o, r, cs = self.o, self.r, self.cs
             self.o = self.r = self.cs = None
         try:
-            return mpiFunction(obj, root=0)
+            with telemetry.timeMpiWait():
+                return mpiFunction(obj, root=0)
         except pickle.PicklingError as error:
             runLog.error("Failed to {} {}.".format(mpiFunction.__name__, obj))
             runLog.error(error)
@@ -563,7 +569,10 @@ class DistributeStateAction(MpiAction):
 
     def _distributeReactor(self, cs):
         runLog.debug("Sending the Reactor object")
-        r = self.broadcast(self.r)
+        if cs[CONF_DISTRIBUTE_STATE_MODE] == "structured":
+            r = self._broadcastReactorImage(cs)
+        else:
+            r = self.broadcast(self.r)
 
         if isinstance(r, reactors.Reactor):
             runLog.debug("Received reactor")
@@ -584,6 +593,53 @@ class DistributeStateAction(MpiAction):
         # attach here so any interface actions use a properly-setup reactor.
         self.o.reattach(self.r, cs)  # sets r and cs
 
+    def _broadcastReactorImage(self, cs):
+        """
+        Send the reactor as a database image, and rebuild it from the image on the workers.
+
+        The image is a flat byte buffer, a fraction of the size of the pickled reactor, so this sends
+        much less data than broadcasting the pickle. It is sent once to each node, into memory shared
+        by the processes of the node, and freed as soon as they have rebuilt their reactors. What the
+        database does not store (the blueprints, the cross section library, and the parameters that
+        are not saved to the database) is broadcast beside it, with the arrays sent as raw buffers
+        rather than pickled.
+
+        Returns the reactor on the primary, and the rebuilt reactor on the workers.
+
+        Notes
+        -----
+        Only the transient image is shared. The rebuilt reactor, its number densities and fluxes,
+        and the library belong to each process, which is free to modify them, so the memory of each
+        process after distribution is the same as with the pickle. What this mode saves is the
+        volume of the broadcast, at the cost of slower serialization: on the ``armiRun`` test
+        reactor the image is about 0.8 MB against 5 MB pickled, but takes about 2.4 s to write and
+        rebuild, against 0.9 s to pickle and unpickle.
+
+        State that is not held in parameters, such as attributes set directly on composites, is not
+        sent. Use the ``pickle`` mode if the workers need it.
+        """
+        if context.MPI_RANK == 0:
+            image = reactorImage.writeReactorImage(self.r)
+            bp, lib = self.r.blueprints, self.r.core.lib
+            unsaved = reactorImage.getUnsavedParams(self.r)
+        else:
+            image = bp = lib = unsaved = None
+
+        bp, lib, unsaved = _broadcastWithBuffers((bp, lib, unsaved))
+        image, window, nodeComm = _broadcastNodeSharedBuffer(image)
+        try:
+            if context.MPI_RANK == 0:
+                return self.r
+            r = reactorImage.readReactorImage(image, cs, bp)
+            reactorImage.applyUnsavedParams(r, unsaved)
+            r.core.lib = lib
+            return r
+        finally:
+            # the image is copied when it is read, so it can be released right away
+            del image
+            window.Free()
+            nodeComm.Free()
+
     @staticmethod
     def _distributeParamAssignments():
         data = dict()
@@ -682,6 +738,75 @@ class DistributeStateAction(MpiAction):
                         iOld.interactDistributeState()
 
 
+def _broadcastWithBuffers(obj):
+    """
+    Broadcast an object from the primary, sending its arrays as raw buffers.
+
+    The object is pickled with protocol 5, which hands contiguous NumPy arrays to the caller instead
+    of copying them into the pickle. Those are broadcast with the buffer interface of MPI, which
+    avoids pickling and unpickling large arrays, such as the ones of cross section libraries.
+    """
+    buffers = []
+    if context.MPI_RANK == 0:
+        data = pickle.dumps(obj, protocol=5, buffer_callback=buffers.append)
+        buffers = [np.frombuffer(buffer.raw(), dtype=np.uint8) for buffer in buffers]
+        header = (data, [buffer.nbytes for buffer in buffers])
+    else:
+        header = None
+
+    with telemetry.timeMpiWait():
+        data, sizes = context.MPI_COMM.bcast(header, root=0)
+        if context.MPI_RANK != 0:
+            buffers = [np.empty(size, dtype=np.uint8) for size in sizes]
+        for buffer in buffers:
+            context.MPI_COMM.Bcast(buffer, root=0)
+
+    if context.MPI_RANK == 0:
+        return obj
+    return pickle.loads(data, buffers=buffers)
+
+
+def _broadcastNodeSharedBuffer(buffer):
+    """
+    Broadcast a byte buffer from the primary, keeping a single copy of it on each node.
+
+    The buffer is placed in an MPI-3 shared memory window on each node. It is only sent to the first
+    process of each node; the other processes of the node read the copy in the window.
+
+    Returns
+    -------
+    shared : np.ndarray
+        The buffer, in shared memory. It must not be modified.
+    window : MPI.Win
+        The window of shared memory holding the buffer.
+    nodeComm : MPI.Comm
+        The communicator of the processes of this node. Both it and the window must be freed
+        (collectively) once the buffer is not needed anymore.
+    """
+    from mpi4py import MPI
+
+    comm = context.MPI_COMM
+    with telemetry.timeMpiWait():
+        nbytes = comm.bcast(buffer.nbytes if context.MPI_RANK == 0 else None, root=0)
+        # ordering by rank makes the primary the first process of its node, and the root of the
+        # communicator between nodes.
+        nodeComm = comm.Split_type(MPI.COMM_TYPE_SHARED, key=context.MPI_RANK)
+        isNodeLeader = nodeComm.Get_rank() == 0
+        leaderComm = comm.Split(0 if isNodeLeader else MPI.UNDEFINED, key=context.MPI_RANK)
+
+        window = MPI.Win.Allocate_shared(nbytes if isNodeLeader else 0, 1, comm=nodeComm)
+        memory, _itemSize = window.Shared_query(0)
+        shared = np.ndarray((nbytes,), dtype=np.uint8, buffer=memory)
+        if isNodeLeader:
+            if context.MPI_RANK == 0:
+                shared[:] = buffer
+            leaderComm.Bcast(shared, root=0)
+            leaderComm.Free()
+        nodeComm.Barrier()
+
+    return shared, window, nodeComm
+
+
 def _diagnosePickleError(o):
     r"""
     Scans through various parts of the reactor to identify which part cannot be pickled.
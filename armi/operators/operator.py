@@ -30,7 +30,7 @@ import time
 from typing import Tuple
 
 from armi import context, interfaces, runLog
-from armi.bookkeeping import memoryProfiler
+from armi.bookkeeping import memoryProfiler, telemetry
 from armi.bookkeeping.report import reportingUtils
 from armi.operators.runTypes import RunTypes
 from armi.physics.fuelCycle.settings import CONF_SHUFFLE_LOGIC
@@ -40,6 +40,7 @@ from armi.physics.neutronics.globalFlux.globalFluxInterface import (
 from armi.settings import settingsValidation
 from armi.settings.fwSettings.globalSettings import (
     CONF_CYCLES_SKIP_TIGHT_COUPLING_INTERACTION,
+    CONF_DEBUG_MEM_TRACE_DEPTH,
     CONF_DEFERRED_INTERFACE_NAMES,
     CONF_DEFERRED_INTERFACES_CYCLE,
     CONF_TIGHT_COUPLING,
@@ -158,6 +159,10 @@ class Operator:
         self.cs = cs
         runLog.LOG.startLog(self.cs.caseTitle)
         self.timer = codeTiming.MasterTimer.getMasterTimer()
+        self.telemetry = telemetry.Telemetry()
+        if cs[CONF_DEBUG_MEM_TRACE_DEPTH] > 0:
+            # start before the reactor is built, so that its allocations are traced too
+            memoryProfiler.startTracing(cs[CONF_DEBUG_MEM_TRACE_DEPTH])
         self.interfaces = []
         self.restartData = []
         self.loadedRestartData = []
@@ -470,6 +475,7 @@ class Operator:
 
         cycleNodeTag = self._expandCycleAndTimeNodeArgs(interactionName)
         runLog.header("===========  Triggering {} Event ===========".format(interactionName + cycleNodeTag))
+        telemetryKey = self._getTelemetryKey(interactionName)
 
         for statePointIndex, interface in enumerate(activeInterfaces, start=1):
             self.printInterfaceSummary(interface, interactionName, statePointIndex)
@@ -482,8 +488,9 @@ class Operator:
 
             interactionMessage = f"{interface.name}.{interactionName}"
             with self.timer.getTimer(interactionMessage):
-                interactMethod = getattr(interface, interactMethodName)
-                halt = halt or interactMethod(*args)
+                with self.telemetry.record(interface.name, interactionName, *telemetryKey):
+                    interactMethod = getattr(interface, interactMethodName)
+                    halt = halt or interactMethod(*args)
 
             if self.cs["debugDB"]:
                 self._debugDB(interactionName, interface.name, statePointIndex)
@@ -550,6 +557,14 @@ class Operator:
 
         return cycleNodeInfo
 
+    def _getTelemetryKey(self, interactionName) -> Tuple[int, int, int]:
+        """Return the (cycle, node, coupled iteration) to file the telemetry of an interaction under."""
+        if self.r is None:
+            return -1, -1, -1
+
+        iteration = self.r.core.p.coupledIteration if interactionName == "Coupled" and self.r.core else 0
+        return self.r.p.cycle, self.r.p.timeNode, iteration
+
     def _debugDB(self, interactionName, interfaceName, statePointIndex=0):
         """
         Write state to DB with a unique "statePointName", or label.
@@ -638,6 +653,11 @@ class Operator:
         activeInterfaces = self.getActiveInterfaces("EOL", excludedInterfaceNames)
         self._interactAll("EOL", activeInterfaces)
 
+        # now that every interface has interacted, the telemetry is complete
+        dbi = self.getInterface("database")
+        if dbi is not None:
+            dbi.writeTelemetry()
+
     def interactAllCoupled(self, coupledIteration):
         """
         Run all interfaces that are involved in tight physics coupling.
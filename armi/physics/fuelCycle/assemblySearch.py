@@ -0,0 +1,148 @@
+# Copyright 2026 TerraPower, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+A snapshot table of the core assemblies, to speed up the searches of the fuel handler.
+
+Custom shuffle logic calls :py:meth:`~armi.physics.fuelCycle.fuelHandlers.FuelHandler.findAssembly`
+many times per outage. Each search used to look up the ring of every assembly in the core, and the
+block-level maximum of every parameter it filters or ranks on, again. The
+:py:class:`AssemblySearchTable` keeps one row per core location, with the ring, the location label,
+and the assembly currently there, so the ring and location filters are array operations. Parameter
+values are not cached: they are read from the assemblies on every search, since shuffle logic may
+change them in the middle of an outage.
+
+The rows are keyed by location, so when assemblies are swapped, only the assemblies in the rows
+change. The fuel handler reports its moves to the table with :py:meth:`AssemblySearchTable.update`;
+other changes to the core are detected and trigger a rebuild of the rows.
+"""
+
+import numpy as np
+
+from armi.reactor.parameters import ParamLocation
+
+
+def getParamMax(a, paramName, blockLevelMax=True):
+    """Get assembly/block-level maximum parameter value in assembly."""
+    multiplier = a.getSymmetryFactor()
+    if multiplier != 1:
+        # handle special case: volume-integrated parameters where symmetry factor is not 1
+        if blockLevelMax:
+            paramCollection = a[0].p
+        else:
+            paramCollection = a.p
+        isVolumeIntegrated = paramCollection.paramDefs[paramName].location == ParamLocation.VOLUME_INTEGRATED
+        multiplier = a.getSymmetryFactor() if isVolumeIntegrated else 1.0
+
+    if blockLevelMax:
+        return a.getChildParamValues(paramName).max() * multiplier
+    else:
+        return a.p[paramName] * multiplier
+
+
+class AssemblySearchTable:
+    """
+    One row per assembly location in the core, in the order of ``Core.getAssemblies()``.
+
+    Parameters
+    ----------
+    core : Core
+        The core to take a snapshot of.
+    """
+
+    def __init__(self, core):
+        self.core = core
+        # the rows are built the first time they are needed, since some searches do not use them
+        self.assemblies = None
+        self.locators = None
+        self.rings = None
+        self.locations = None
+        self._rowOfLocator = None
+
+    def _buildRows(self):
+        self.assemblies = self.core.getAssemblies()
+        self.locators = [a.spatialLocator for a in self.assemblies]
+        self.rings = np.array([loc.getRingPos()[0] for loc in self.locators], dtype=int)
+        self.locations = np.array([a.getLocation() for a in self.assemblies], dtype=object)
+        self._rowOfLocator = {loc: row for row, loc in enumerate(self.locators)}
+
+    def isCurrent(self):
+        """Check that every row still holds the assembly at its location, and nothing was added."""
+        if len(self.core) != len(self.assemblies):
+            return False
+        core = self.core
+        for a, loc in zip(self.assemblies, self.locators):
+            if a.parent is not core or a.spatialLocator is not loc:
+                return False
+        return True
+
+    def refresh(self):
+        """Build the rows, or rebuild them if the core changed in ways that were not reported with ``update``."""
+        if self.assemblies is None or not self.isCurrent():
+            self._buildRows()
+
+    def update(self, *assems):
+        """
+        Record that these assemblies moved.
+
+        Each assembly that is now in the core takes over the row of its new location.
+        """
+        for a in assems:
+            if self.assemblies is None or a.parent is not self.core:
+                continue
+            row = self._rowOfLocator.get(a.spatialLocator)
+            if row is None:
+                # a location that was not in the core before; start over
+                self._buildRows()
+                continue
+            self.assemblies[row] = a
+            self.locators[row] = a.spatialLocator
+
+    def findRows(self, candidateRings, typeSpec, exactType=False, exclusions=None):
+        """
+        Find the rows of the assemblies of the given types in the candidate rings.
+
+        Returns
+        -------
+        rows : np.ndarray
+            Row indices, grouped by candidate ring in the order of ``candidateRings``, and in the
+            order of the table within each ring.
+        ringIndices : np.ndarray
+            The index in ``candidateRings`` of the ring of each row.
+        """
+        self.refresh()
+        ringIndexOf = {}
+        for ringI, ring in enumerate(candidateRings):
+            ringIndexOf.setdefault(ring, ringI)
+
+        exclusions = set(exclusions or [])
+        rows = np.flatnonzero(np.isin(self.rings, list(ringIndexOf)))
+        rows = np.array(
+            [
+                row
+                for row in rows
+                if self.assemblies[row] not in exclusions and self.assemblies[row].hasFlags(typeSpec, exact=exactType)
+            ],
+            dtype=int,
+        )
+        ringIndices = np.array([ringIndexOf[ring] for ring in self.rings[rows]], dtype=int)
+        order = np.argsort(ringIndices, kind="stable")
+        return rows[order], ringIndices[order]
+
+    def getParamValues(self, assems, paramName, blockLevelMax):
+        """Return the assembly/block-level maximum values of a parameter for some assemblies."""
+        return np.array([getParamMax(a, paramName, blockLevelMax) for a in assems], dtype=float)
+
+    def getParamValue(self, a, paramName, blockLevelMax):
+        """Return the assembly/block-level maximum value of a parameter for one assembly."""
+        return self.getParamValues([a], paramName, blockLevelMax)[0]
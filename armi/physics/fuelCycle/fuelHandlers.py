@@ -35,11 +35,11 @@ import numpy as np
 
 from armi import runLog
 from armi.physics.fuelCycle import assemblyRotationAlgorithms as rotAlgos
+from armi.physics.fuelCycle import assemblySearch
 from armi.physics.fuelCycle.fuelHandlerFactory import fuelHandlerFactory
 from armi.physics.fuelCycle.fuelHandlerInterface import FuelHandlerInterface
 from armi.physics.fuelCycle.settings import CONF_ASSEMBLY_ROTATION_ALG
 from armi.reactor.flags import Flags
-from armi.reactor.parameters import ParamLocation
 from armi.utils.customExceptions import InputError
 
 
@@ -61,6 +61,8 @@ class FuelHandler:
         self.o = operator
         self.moved = []
         self.pendingRotations = []
+        # a snapshot of the core for findAssembly, kept for the duration of an outage
+        self._searchTable = None
 
     @property
     def cycle(self):
@@ -92,20 +94,25 @@ class FuelHandler:
         if self.moved:
             raise ValueError("Cannot perform two outages with same FuelHandler instance.")
 
-        # determine if a repeat shuffle is occurring or a new shuffle pattern
-        if self.cs["explicitRepeatShuffles"]:
-            # repeated shuffle
-            if not os.path.exists(self.cs["explicitRepeatShuffles"]):
-                raise RuntimeError(
-                    "Requested repeat shuffle file {0} does not exist. Cannot perform shuffling. ".format(
-                        self.cs["explicitRepeatShuffles"]
+        # the searches of the shuffle logic share one table of the core locations for the outage
+        self._searchTable = assemblySearch.AssemblySearchTable(self.r.core)
+        try:
+            # determine if a repeat shuffle is occurring or a new shuffle pattern
+            if self.cs["explicitRepeatShuffles"]:
+                # repeated shuffle
+                if not os.path.exists(self.cs["explicitRepeatShuffles"]):
+                    raise RuntimeError(
+                        "Requested repeat shuffle file {0} does not exist. Cannot perform shuffling. ".format(
+                            self.cs["explicitRepeatShuffles"]
+                        )
                     )
-                )
-            runLog.important("Repeating a shuffling pattern from {}".format(self.cs["explicitRepeatShuffles"]))
-            self.repeatShufflePattern(self.cs["explicitRepeatShuffles"])
-        else:
-            # Normal shuffle from user-provided shuffle logic input
-            self.chooseSwaps(factor)
+                runLog.important("Repeating a shuffling pattern from {}".format(self.cs["explicitRepeatShuffles"]))
+                self.repeatShufflePattern(self.cs["explicitRepeatShuffles"])
+            else:
+                # Normal shuffle from user-provided shuffle logic input
+                self.chooseSwaps(factor)
+        finally:
+            self._searchTable = None
 
         # do rotations if pin-level details are available (requires fluxRecon plugin)
         if self.cs["fluxRecon"] and self.cs[CONF_ASSEMBLY_ROTATION_ALG]:
@@ -208,7 +215,8 @@ class FuelHandler:
         diff1 and diff2 are sufficiently close, the assembly with the lesser assemNum wins. This
         should result in a more stable comparison than on floating-point comparisons alone.
         """
-        if np.isclose(candidate[0], current[0], rtol=1e-8, atol=1e-8):
+        # the scalar equivalent of np.isclose(rtol=1e-8, atol=1e-8), which is slow for single values
+        if candidate[0] == current[0] or abs(candidate[0] - current[0]) <= 1e-8 + 1e-8 * abs(current[0]):
             return candidate[1].p.assemNum < current[1].p.assemNum
         else:
             return candidate[0] < current[0]
@@ -216,20 +224,7 @@ class FuelHandler:
     @staticmethod
     def _getParamMax(a, paramName, blockLevelMax=True):
         """Get assembly/block-level maximum parameter value in assembly."""
-        multiplier = a.getSymmetryFactor()
-        if multiplier != 1:
-            # handle special case: volume-integrated parameters where symmetry factor is not 1
-            if blockLevelMax:
-                paramCollection = a[0].p
-            else:
-                paramCollection = a.p
-            isVolumeIntegrated = paramCollection.paramDefs[paramName].location == ParamLocation.VOLUME_INTEGRATED
-            multiplier = a.getSymmetryFactor() if isVolumeIntegrated else 1.0
-
-        if blockLevelMax:
-            return a.getChildParamValues(paramName).max() * multiplier
-        else:
-            return a.p[paramName] * multiplier
+        return assemblySearch.getParamMax(a, paramName, blockLevelMax)
 
     def findAssembly(
         self,
@@ -409,6 +404,9 @@ class FuelHandler:
 
         minDiff = (1e60, None)
 
+        # use the snapshot of the core if this is during an outage
+        table = self._searchTable or assemblySearch.AssemblySearchTable(self.r.core)
+
         # compareTo can either be a tuple, a value, or an assembly
         # if it's a tuple, it can either be an int/float and a multiplier, or an assembly and a multiplier
         # if it's not a tuple, the multiplier will be assumed to be 1.0
@@ -424,7 +422,7 @@ class FuelHandler:
             compVal = compareTo * mult
         elif param:
             # assume compareTo is an assembly
-            compVal = FuelHandler._getParamMax(compareTo, param, blockLevelMax) * mult
+            compVal = table.getParamValue(compareTo, param, blockLevelMax) * mult
 
         if coords:
             # find the assembly closest to xt,yt if coords are given without considering params.
@@ -455,116 +453,100 @@ class FuelHandler:
                 for outer in range(width[0]):
                     candidateRings.append(targetRing + outer + 1)
 
-        # get lists of assemblies in each candidate ring. Do it in this order in case we prefer ones in the first.
-        # scan through all assemblies and find the one (or more) that best fits the criteria
-        for ringI, assemsInRings in enumerate(
-            self._getAssembliesInRings(candidateRings, typeSpec, exactType, exclusions, circularRingFlag)
-        ):
-            for a in assemsInRings:
-                innocent = True
-                # Check that this assembly's minParam is > the minimum for each minParam
-                for minIndex, minVal in enumerate(minVals):
-                    minParam = minParams[minIndex]
-                    if minParam:
-                        # a minimum was specified. Check to see if we're ok
-                        if isinstance(minVal, tuple):
-                            # tuple turned in. it's a multiplier and a param
-                            realMinVal = FuelHandler._getParamMax(a, minVal[0], blockLevelMax) * minVal[1]
-                        else:
-                            realMinVal = minVal
-
-                        if FuelHandler._getParamMax(a, minParam, blockLevelMax) < realMinVal:
-                            # this assembly does not meet the minVal specifications. Skip it.
-                            innocent = False
-                            break  # for speed (not a big deal here)
-
-                if not innocent:
-                    continue
-
-                # Check upper bounds, to make sure this assembly doesn't have maxParams>maxVals
-                for maxIndex, maxVal in enumerate(maxVals):
-                    maxParam = maxParams[maxIndex]
-                    if maxParam:
-                        if isinstance(maxVal, tuple):
-                            # tuple turned in. it's a multiplier and a param
-                            realMaxVal = FuelHandler._getParamMax(a, maxVal[0], blockLevelMax) * maxVal[1]
-                        else:
-                            realMaxVal = maxVal
-
-                        if FuelHandler._getParamMax(a, maxParam, blockLevelMax) > realMaxVal:
-                            # this assembly has a maxParam that's higher than maxVal and therefore
-                            # doesn't qualify. skip it.
-                            innocent = False
-                            break
-
-                if not innocent:
-                    continue
-
-                # Check to see if this assembly is in the list of candidate locations. if not, skip it.
-                if mandatoryLocations:
-                    if a.getLocation() not in mandatoryLocations:
-                        continue
-
-                if excludedLocations:
-                    if a.getLocation() in excludedLocations:
-                        # this assembly is in the excluded location list. skip it.
-                        continue
-
-                # only process of the Assembly is in a Zone
-                if not self.isAssemblyInAZone(zoneList, a):
+        # Gather the candidates in the order they are considered: by candidate ring, then in the
+        # order of the core (or SFP) within each ring. The target ring comes first, so it is preferred.
+        if findFromSfp or circularRingFlag:
+            candidates = []
+            ringIndices = []
+            for ringI, assemsInRing in enumerate(
+                self._getAssembliesInRings(candidateRings, typeSpec, exactType, exclusions, circularRingFlag)
+            ):
+                candidates.extend(assemsInRing)
+                ringIndices.extend([ringI] * len(assemsInRing))
+            ringIndices = np.array(ringIndices, dtype=int)
+            locations = [a.getLocation() for a in candidates]
+            rings = None
+        else:
+            rows, ringIndices = table.findRows(candidateRings, typeSpec, exactType, exclusions)
+            candidates = [table.assemblies[row] for row in rows]
+            locations = table.locations[rows]
+            rings = table.rings[rows]
+
+        # filter the candidates by location first, since those checks are cheap
+        keep = np.ones(len(candidates), dtype=bool)
+        if mandatoryLocations:
+            mandatoryLocations = set(mandatoryLocations)
+            keep &= np.array([loc in mandatoryLocations for loc in locations], dtype=bool)
+        if excludedLocations:
+            excludedLocations = set(excludedLocations)
+            keep &= np.array([loc not in excludedLocations for loc in locations], dtype=bool)
+        if zoneList:
+            keep &= np.array([any(loc in zone for zone in zoneList) for loc in locations], dtype=bool)
+
+        # then check that the minParams are >= their minVals and the maxParams are <= their maxVals,
+        # where the values are either floats or (param, multiplier) tuples.
+        for bounds, params, isOutside in ((minVals, minParams, np.less), (maxVals, maxParams, np.greater)):
+            for boundIndex, bound in enumerate(bounds):
+                boundParam = params[boundIndex]
+                if not boundParam:
                     continue
-
-                # Now find the assembly with the param closest to the target val.
-                if param:
-                    diff = abs(FuelHandler._getParamMax(a, param, blockLevelMax) - compVal)
-
-                    if (
-                        forceSide == 1
-                        and FuelHandler._getParamMax(a, param, blockLevelMax) > compVal
-                        and FuelHandler._compareAssem((diff, a), minDiff)
-                    ):
-                        # forceSide=1, so that means look in rings further out
-                        minDiff = (diff, a)
-                    elif (
-                        forceSide == -1
-                        and FuelHandler._getParamMax(a, param, blockLevelMax) < compVal
-                        and FuelHandler._compareAssem((diff, a), minDiff)
-                    ):
-                        # forceSide=-1, so that means look in rings closer in from the targetRing
-                        minDiff = (diff, a)
-                    elif FuelHandler._compareAssem((diff, a), minDiff):
-                        # no preference of which side, just take the one with the closest param.
-                        minDiff = (diff, a)
-                else:
-                    # no param specified. Just return one closest to the target ring
-                    diff = None
-                    if a.spatialLocator.getRingPos()[0] == targetRing:
-                        # short circuit the search
-                        if findMany:
-                            assemList.append((diff, a))
-                            continue
-                        else:
-                            return a
-                    elif abs(a.spatialLocator.getRingPos()[0] - targetRing) < minDiff[0]:
-                        minDiff = (
-                            abs(a.spatialLocator.getRingPos()[0] - targetRing),
-                            a,
-                        )
-
-                if findMany:
-                    # returning many assemblies. If there's a param, we'd like it to be honored by
-                    # ordering this list from smallest diff to largest diff.
-                    assemList.append((diff, a))
-
-            if ringI == 0 and acceptFirstCandidateRing and minDiff[1]:
-                # an acceptable assembly was found in the targetRing (ringI==0)
-                # and the user requested this to be returned. Therefore, return it without
-                # scanning through the additional rings.
+                indices = np.flatnonzero(keep)
+                assems = [candidates[i] for i in indices]
+                if isinstance(bound, tuple):
+                    bound = table.getParamValues(assems, bound[0], blockLevelMax) * bound[1]
+                values = table.getParamValues(assems, boundParam, blockLevelMax)
+                keep[indices[isOutside(values, bound)]] = False
+
+        indices = np.flatnonzero(keep)
+        candidates = [candidates[i] for i in indices]
+        ringIndices = ringIndices[indices]
+        # the candidates found in the target ring, for acceptFirstCandidateRing
+        numInTargetRing = int(np.count_nonzero(ringIndices == 0))
+
+        if param:
+            # Find the assembly with the param closest to the target value. Ties are broken by
+            # assembly number, in the order the candidates are considered. ``forceSide`` is not
+            # applied: in the original search loop, candidates on the wrong side still fell
+            # through to the unconditional comparison, so it never excluded any.
+            diffs = np.abs(table.getParamValues(candidates, param, blockLevelMax) - compVal).tolist()
+            minDiff = (1e60, None)
+            for i, (diff, a) in enumerate(zip(diffs, candidates)):
+                if i == numInTargetRing and acceptFirstCandidateRing and minDiff[1]:
+                    return minDiff[1]
+                if FuelHandler._compareAssem((diff, a), minDiff):
+                    minDiff = (diff, a)
+
+            if numInTargetRing == len(candidates) and acceptFirstCandidateRing and minDiff[1]:
                 return minDiff[1]
 
-        if not minDiff[1]:
-            # can't find assembly in targetRing with close param to compareTo
-            pass
+            if findMany:
+                assemList = list(zip(diffs, candidates))
+        else:
+            # no param specified. Just return one closest to the target ring
+            if rings is None:
+                rings = np.array([a.spatialLocator.getRingPos()[0] for a in candidates], dtype=int)
+            else:
+                rings = rings[indices]
+            ringDiffs = np.abs(rings - targetRing)
+            inTargetRing = np.flatnonzero(ringDiffs == 0)
+            firstRingDiffs = ringDiffs[:numInTargetRing]
+
+            if acceptFirstCandidateRing and numInTargetRing:
+                if not findMany and inTargetRing.size and inTargetRing[0] < numInTargetRing:
+                    return candidates[inTargetRing[0]]
+                if np.any(firstRingDiffs != 0):
+                    # the closest one that is not exactly in the target ring
+                    offTarget = np.where(firstRingDiffs != 0, firstRingDiffs, np.iinfo(int).max)
+                    return candidates[int(np.argmin(offTarget))]
+
+            if findMany:
+                assemList = [(None, a) for a in candidates]
+            elif inTargetRing.size:
+                return candidates[inTargetRing[0]]
+            elif candidates:
+                minDiff = (ringDiffs.min(), candidates[int(np.argmin(ringDiffs))])
+            else:
+                minDiff = (1e60, None)
 
         if findMany:
             assemList.sort()  # prefer items that have params that are the closest to the value.
@@ -726,6 +708,8 @@ class FuelHandler:
         self._transferStationaryBlocks(a1, a2)
         a1.moveTo(a2.spatialLocator)
         a2.moveTo(oldA1Location)
+        if self._searchTable is not None:
+            self._searchTable.update(a1, a2)
 
     def _transferStationaryBlocks(self, assembly1, assembly2):
         """
@@ -847,6 +831,8 @@ class FuelHandler:
 
         incoming.p.multiplicity = 1
         self.r.core.add(incoming, loc)
+        if self._searchTable is not None:
+            self._searchTable.update(incoming, outgoing)
 
     def swapCascade(self, assemList):
         """
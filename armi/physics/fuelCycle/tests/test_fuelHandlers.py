@@ -26,7 +26,7 @@ from unittest.mock import patch
 
 import numpy as np
 
-from armi.physics.fuelCycle import fuelHandlers, settings
+from armi.physics.fuelCycle import assemblySearch, fuelHandlers, settings
 from armi.physics.fuelCycle.settings import (
     CONF_ASSEM_ROTATION_STATIONARY,
     CONF_ASSEMBLY_ROTATION_ALG,
@@ -231,6 +231,8 @@ class TestFuelHandler(FuelHandlerTestHelper):
         )
         fh.outage(factor=1.0)
         self.assertEqual(len(fh.moved), 0)
+        # the search table only lives for the duration of the outage
+        self.assertIsNone(fh._searchTable)
 
     def test_outageEdgeCase(self):
         """Check that an error is raised if the list of moved assemblies is invalid."""
@@ -436,6 +438,63 @@ class TestFuelHandler(FuelHandlerTestHelper):
         )
         self.assertIsNone(assem)
 
+    def test_findWithSearchTable(self):
+        """Searches during an outage see the swaps made so far, like searches of the live core."""
+        fh = fuelHandlers.FuelHandler(self.o)
+        for i, b in enumerate(self.r.core.iterBlocks(Flags.FUEL)):
+            b.p.percentBu = (7 * i) % 23
+
+        def findAll():
+            return [
+                fh.findAssembly(targetRing=4, width=(2, 0), param="percentBu", compareTo=10, blockLevelMax=True),
+                fh.findAssembly(targetRing=3, width=(1, 1), findMany=True),
+                fh.findAssembly(param="percentBu", compareTo=100, blockLevelMax=True, maxParam="percentBu", maxVal=15),
+            ]
+
+        fh._searchTable = assemblySearch.AssemblySearchTable(self.r.core)
+        found = findAll()
+        self.assertIsNotNone(fh._searchTable.assemblies)
+        fh.swapAssemblies(found[0], found[2])
+        fh.dischargeSwap(self.r.excore["sfp"].getChildrenWithFlags(Flags.FUEL)[0], found[1][0])
+        afterSwaps = findAll()
+
+        # the cached table must give the same answers as a fresh look at the core
+        fh._searchTable = None
+        self.assertEqual(afterSwaps, findAll())
+
+    def test_searchTableSeesParamChanges(self):
+        """Parameters changed in the middle of an outage are seen by the next search."""
+        fh = fuelHandlers.FuelHandler(self.o)
+        fh._searchTable = assemblySearch.AssemblySearchTable(self.r.core)
+        for b in self.r.core.iterBlocks(Flags.FUEL):
+            b.p.percentBu = 5.0
+        a = fh.findAssembly(targetRing=3, width=(1, 0), param="percentBu", compareTo=100, blockLevelMax=True)
+
+        for b in a:
+            b.p.percentBu = 1.0
+        self.assertIsNot(
+            fh.findAssembly(targetRing=3, width=(1, 0), param="percentBu", compareTo=100, blockLevelMax=True), a
+        )
+        for b in a:
+            b.p.percentBu = 50.0
+        self.assertIs(
+            fh.findAssembly(targetRing=3, width=(1, 0), param="percentBu", compareTo=100, blockLevelMax=True), a
+        )
+
+    def test_searchTableRefresh(self):
+        """The table rebuilds its rows if the core changes without the fuel handler knowing."""
+        table = assemblySearch.AssemblySearchTable(self.r.core)
+        rows, ringIndices = table.findRows([2, 1], Flags.FUEL)
+        self.assertTrue(table.isCurrent())
+        self.assertTrue(all(table.rings[rows[ringIndices == 0]] == 2))
+
+        a = table.assemblies[rows[0]]
+        self.r.core.removeAssembly(a)
+        self.assertFalse(table.isCurrent())
+        newRows, _ = table.findRows([2, 1], Flags.FUEL)
+        self.assertEqual(len(newRows), len(rows) - 1)
+        self.assertNotIn(a, [table.assemblies[row] for row in newRows])
+
     def runShuffling(self, fh):
         """Shuffle fuel and write out a SHUFFLES.txt file."""
         fh.attachReactor(self.o, self.r)
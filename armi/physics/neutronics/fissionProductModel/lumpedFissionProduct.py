@@ -21,6 +21,9 @@ These are generally managed by the
 
 import os
 
+import numpy as np
+from scipy import sparse
+
 from armi import runLog
 from armi.nucDirectory import elements, nuclideBases
 from armi.physics.neutronics.fissionProductModel.fissionProductModelSettings import (
@@ -66,6 +69,8 @@ class LumpedFissionProduct:
         """
         self.name = name
         self.yld = {}
+        # counts changes to the yields, so collections know when to recompile their yield matrix
+        self._version = 0
 
     def duplicate(self):
         """Make a copy of this w/o using deepcopy."""
@@ -99,6 +104,7 @@ class LumpedFissionProduct:
             )
 
         self.yld[key] = val
+        self._version += 1
 
     def __contains__(self, item):
         return item in self.yld
@@ -185,6 +191,7 @@ class LumpedFissionProductCollection(dict):
 
     def __init__(self):
         self.collapsible = False
+        self._yieldMatrix = None
 
     def duplicate(self):
         new = self.__class__()
@@ -211,6 +218,39 @@ class LumpedFissionProductCollection(dict):
                 nucs.add(fp)
         return sorted(nucs)
 
+    def getYieldMatrix(self):
+        """
+        Get the yields of all fission products of all LFPs in this collection, as a sparse matrix.
+
+        The matrix is compiled the first time it is needed, and again only after the LFPs in the
+        collection, or their yields, change.
+
+        Returns
+        -------
+        lfpNames : list of str
+            The names of the LFPs, in the order of the rows of the matrix.
+        fpNames : list of str
+            The names of the fission products, in the order of the columns of the matrix.
+        yields : scipy.sparse.csr_matrix
+            The yield of each fission product from each LFP.
+        """
+        signature = tuple((lfpName, id(lfp), lfp._version, len(lfp.yld)) for lfpName, lfp in self.items())
+        if self._yieldMatrix is None or self._yieldMatrix[0] != signature:
+            lfpNames = list(self.keys())
+            fpNames = self.getAllFissionProductNames()
+            fpIndex = {fpName: i for i, fpName in enumerate(fpNames)}
+            rows, cols, ylds = [], [], []
+            for row, lfp in enumerate(self.values()):
+                for fp, fpFrac in lfp.items():
+                    rows.append(row)
+                    cols.append(fpIndex[fp.name])
+                    ylds.append(fpFrac)
+            yields = sparse.csr_matrix((ylds, (rows, cols)), shape=(len(lfpNames), len(fpNames)))
+            self._yieldMatrix = (signature, lfpNames, fpNames, yields)
+
+        _signature, lfpNames, fpNames, yields = self._yieldMatrix
+        return lfpNames, fpNames, yields
+
     def getNumberDensities(self, objectWithParentDensities=None, densFunc=None):
         """
         Gets all FP number densities in collection.
@@ -229,12 +269,36 @@ class LumpedFissionProductCollection(dict):
         """
         if not densFunc:
             densFunc = lambda lfpName: objectWithParentDensities.getNumberDensity(lfpName)
-        fpDensities = {}
-        for lfpName, lfp in self.items():
-            lfpDens = densFunc(lfpName)
-            for fp, fpFrac in lfp.items():
-                fpDensities[fp.name] = fpDensities.get(fp.name, 0.0) + fpFrac * lfpDens
-        return fpDensities
+        lfpNames, fpNames, _yields = self.getYieldMatrix()
+        lfpDensities = np.array([densFunc(lfpName) for lfpName in lfpNames], dtype=float)
+        return dict(zip(fpNames, self.expandNumberDensities(lfpDensities).tolist()))
+
+    def expandNumberDensities(self, lfpDensities):
+        """
+        Expand the LFP number densities of many objects into fission product number densities at once.
+
+        Parameters
+        ----------
+        lfpDensities : np.ndarray
+            The number densities of the LFPs, in the order of ``getYieldMatrix``, with shape
+            ``(nObjects, nLFPs)``, or ``(nLFPs,)`` for one object.
+
+        Returns
+        -------
+        np.ndarray
+            The number densities of the fission products, in the order of ``getYieldMatrix``, with
+            shape ``(nObjects, nFPs)``, or ``(nFPs,)`` for one object.
+
+        Examples
+        --------
+        >>> lfpNames, fpNames, _yields = lfps.getYieldMatrix()
+        >>> lfpDensities = np.array([b.getNuclideNumberDensities(lfpNames) for b in blocks])
+        >>> fpDensities = lfps.expandNumberDensities(lfpDensities)
+        """
+        _lfpNames, _fpNames, yields = self.getYieldMatrix()
+        lfpDensities = np.asarray(lfpDensities, dtype=float)
+        # (yields^T lfpDensities^T)^T keeps the sparse matrix on the left of the product
+        return np.asarray(yields.T @ lfpDensities.T).T
 
     def getMassFrac(self, oldMassFrac=None):
         """Returns the mass fraction vector of the collection of lumped fission products."""
@@ -19,6 +19,8 @@ import math
 import os
 import unittest
 
+import numpy as np
+
 from armi.context import RES
 from armi.nucDirectory import nuclideBases
 from armi.physics.neutronics.fissionProductModel import (
@@ -176,6 +178,36 @@ class TestLumpedFissionProductCollection(unittest.TestCase):
             self.assertEqual(fpDensities[fp], 0.0)
             # basic test reactor has no fission products in it
 
+    def test_getYieldMatrix(self):
+        lfpNames, fpNames, yields = self.lfps.getYieldMatrix()
+        self.assertEqual(lfpNames, list(self.lfps))
+        self.assertEqual(fpNames, self.lfps.getAllFissionProductNames())
+        for i, lfpName in enumerate(lfpNames):
+            for j, fpName in enumerate(fpNames):
+                self.assertEqual(yields[i, j], self.lfps[lfpName][nuclideBases.byName[fpName]])
+
+        # the matrix is reused until the collection or its yields change
+        self.assertIs(self.lfps.getYieldMatrix()[2], yields)
+        xe135 = nuclideBases.fromName("XE135")
+        self.lfps["LFP39"][xe135] = 1.2
+        _lfpNames, _fpNames, yields = self.lfps.getYieldMatrix()
+        self.assertEqual(yields[lfpNames.index("LFP39"), fpNames.index("XE135")], 1.2)
+        del self.lfps["LFP35"]
+        self.assertNotIn("LFP35", self.lfps.getYieldMatrix()[0])
+
+    def test_expandNumberDensities(self):
+        lfpNames, fpNames, _yields = self.lfps.getYieldMatrix()
+        lfpDensities = np.arange(2 * len(lfpNames), dtype=float).reshape(2, len(lfpNames))
+        fpDensities = self.lfps.expandNumberDensities(lfpDensities)
+        self.assertEqual(fpDensities.shape, (2, len(fpNames)))
+        for objDensities, expected in zip(lfpDensities, fpDensities):
+            densities = dict(zip(lfpNames, objDensities))
+            fpDensityByName = self.lfps.getNumberDensities(densFunc=densities.get)
+            for fpName, density in zip(fpNames, expected):
+                ref = sum(lfp[nuclideBases.byName[fpName]] * densities[name] for name, lfp in self.lfps.items())
+                self.assertAlmostEqual(density, ref, delta=1e-14)
+                self.assertEqual(fpDensityByName[fpName], density)
+
     def test_getMassFrac(self):
         with self.assertRaises(ValueError):
             self.lfps.getMassFrac(oldMassFrac=None)
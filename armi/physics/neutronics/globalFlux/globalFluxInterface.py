@@ -823,10 +823,11 @@ class GlobalFluxResultMapper(interfaces.OutputReader):
                 totalAbs += b.p.rateAbs
                 totalSrc += b.p.rateProdNet
 
-            a.p.maxPercentBu = a.getMaxParam("percentBu")
-            a.p.maxDpaPeak = a.getMaxParam("detailedDpaPeak")
+            maxima = a.summarizeParams(["percentBu", "detailedDpaPeak", "buLimit"], volumeAveraged=False)
+            a.p.maxPercentBu = maxima["percentBu"].maximum
+            a.p.maxDpaPeak = maxima["detailedDpaPeak"].maximum
             a.p.timeToLimit = a.getMinParam("timeToLimit", Flags.FUEL)
-            a.p.buLimit = a.getMaxParam("buLimit")
+            a.p.buLimit = maxima["buLimit"].maximum
 
             if totalAbs > 0:
                 a.p.kInf = totalSrc / totalAbs  # assembly average k-inf.
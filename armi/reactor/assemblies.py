@@ -211,6 +211,8 @@ class Assembly(composites.Composite):
             self.p.numMoves += 1
             self.p.daysSinceLastMove = 0.0
         self.parent.childrenByLocator[locator] = self
+        # the neighbors of the assemblies in the parent have changed (see Core.getNeighborTable)
+        self.parent.cached.pop("neighborTable", None)
         # symmetry may have changed (either moving on or off of symmetry line)
         self.clearCache()
         self.scaleParamsToNewSymmetryFactor(oldSymmetryFactor)
@@ -730,7 +732,7 @@ class Assembly(composites.Composite):
             newTop = blockMesh[topIndex]
 
             if newTop is None:
-                runLog.warning("Skipping axial snapping on {0}".format(self), 1)
+                runLog.warning("Skipping axial snapping on {0}".format(self), single=True)
                 return
 
             if conserveMassFlag == "auto":
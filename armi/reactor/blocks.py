@@ -1867,11 +1867,16 @@ class HexBlock(Block):
                 [math.sin(radians), math.cos(radians)],
             ]
         )
+        # children that share a multi-index locator, like the pins of a lattice, still share it
+        rotatedMultiLocations = {}
         for c in self:
             if isinstance(c.spatialLocator, grids.MultiIndexLocation):
-                newLocations = list(map(locationRotator, c.spatialLocator))
-                c.spatialLocator = grids.MultiIndexLocation(self.spatialGrid)
-                c.spatialLocator.extend(newLocations)
+                key = id(c.spatialLocator)
+                if key not in rotatedMultiLocations:
+                    # keep the original alive, so its id is not reused
+                    rotated = self._rotateMultiIndexLocation(c.spatialLocator, rotNum)
+                    rotatedMultiLocations[key] = (c.spatialLocator, rotated)
+                c.spatialLocator = rotatedMultiLocations[key][1]
             elif isinstance(c.spatialLocator, grids.CoordinateLocation):
                 oldCoords = c.spatialLocator.getLocalCoordinates()
                 newXY = rotationMatrix.dot(oldCoords[:2])
@@ -1884,6 +1889,31 @@ class HexBlock(Block):
                 runLog.error(msg)
                 raise TypeError(msg)
 
+    def _rotateMultiIndexLocation(self, multiLocation, rotNum: int):
+        """
+        Rotate all of the locations of a multi-index locator at once.
+
+        The rotated locations are the locations of this block's grid, like the ones the pins of a
+        lattice are built with.
+        """
+        locations = list(multiLocation)
+        for grid in {id(loc.grid): loc.grid for loc in locations}.values():
+            if grid is not None and not self.spatialGrid._roughlyEqual(grid):
+                raise TypeError(
+                    f"Refusing to rotate indices from a grid {grid} that is not consistent with {self.spatialGrid}"
+                )
+
+        newLocation = grids.MultiIndexLocation(self.spatialGrid)
+        if locations:
+            indices = np.array([(loc.i, loc.j) for loc in locations], dtype=int)
+            rotated = self.spatialGrid.rotateIndices(indices, rotNum).tolist()
+            grid = self.spatialGrid
+            newLocation.extend(
+                grids.IndexLocation(i, j, loc.k, None) if loc.grid is None else grid[i, j, loc.k]
+                for (i, j), loc in zip(rotated, locations)
+            )
+        return newLocation
+
     def _rotateBoundaryParameters(self, rotNum: int):
         """Rotate any parameters defined on the corners or edge of bounding hexagon.
 
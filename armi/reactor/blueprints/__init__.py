@@ -101,24 +101,41 @@ from armi.settings.fwSettings.globalSettings import (
     CONF_ACCEPTABLE_BLOCK_AREA_ERROR,
     CONF_ASSEM_FLAGS_SKIP_AXIAL_EXP,
     CONF_DETAILED_AXIAL_EXPANSION,
+    CONF_INPUT_CACHE,
     CONF_INPUT_HEIGHTS_HOT,
     CONF_NON_UNIFORM_ASSEM_FLAGS,
 )
-from armi.utils import tabulate, textProcessors
+from armi.utils import inputCache, tabulate, textProcessors
 from armi.utils.customExceptions import InputError
 
+_CACHE_KIND = "blueprints"
+
 context.BLUEPRINTS_IMPORTED = True
 context.BLUEPRINTS_IMPORT_CONTEXT = "".join(traceback.format_stack())
 
 
 def loadFromCs(cs, roundTrip=False):
-    """Function to load Blueprints based on supplied ``Settings``."""
+    """
+    Function to load Blueprints based on supplied ``Settings``.
+
+    When the ``inputCache`` setting is on, the parsed blueprints are kept in the :py:mod:`input
+    cache <armi.utils.inputCache>`, keyed by the blueprints text with all of its ``!include`` files
+    resolved, and later loads of the same text skip the YAML parsing. Round-trip loads are never
+    cached, since they are for writing the YAML back out.
+    """
     from armi.utils import directoryChangers
 
+    useCache = cs[CONF_INPUT_CACHE] and not roundTrip
     with directoryChangers.DirectoryChanger(cs.inputDirectory, dumpOnException=False):
         with open(cs[CONF_LOADING_FILE], "r") as bpYaml:
             root = pathlib.Path(cs[CONF_LOADING_FILE]).parent.absolute()
             bpYaml = textProcessors.resolveMarkupInclusions(bpYaml, root)
+            if useCache:
+                text = bpYaml.getvalue()
+                bp = inputCache.retrieve(_CACHE_KIND, text)
+                if bp is not None:
+                    return bp
+
             try:
                 bp = Blueprints.load(bpYaml, roundTrip=roundTrip)
             except yamlize.yamlizing_error.YamlizingError as err:
@@ -129,6 +146,9 @@ def loadFromCs(cs, roundTrip=False):
                         "".format(cs[CONF_LOADING_FILE])
                     )
                 raise
+
+    if useCache:
+        inputCache.store(_CACHE_KIND, text, bp)
     return bp
 
 
@@ -237,9 +257,12 @@ class Blueprints(yamlize.Object, metaclass=_BlueprintsPluginCollector):
 
         Notes
         -----
-        There is some possibility for "compiling" the logic with closures to make constructing an
-        assembly / block / component faster. At this point is is pretty much irrelevant because we
-        are currently just deepcopying already constructed assemblies.
+        New assemblies are deepcopies of the prototype assemblies in ``self.assemblies``. The
+        prototypes are not frozen (e.g. uniform mesh conversion updates them in place), so a copy
+        is always taken from their current state. Deepcopying is kept cheap by sharing the
+        immutable pieces of the prototype (flags, locator indices, scalar parameter values) and
+        bulk-copying the mutable parameter state, rather than visiting every value through the
+        generic ``copy`` machinery.
 
         Currently, this method is backward compatible with other code in ARMI and generates the
         `.assemblies` attribute (the BOL assemblies). Eventually, this should be removed.
@@ -148,6 +148,35 @@ class TestBlueprints(unittest.TestCase):
         self.assertAlmostEqual(fuel.getDimension("id"), 0.0)
         self.assertAlmostEqual(fuel.getDimension("mult"), 169)
 
+    def test_constructAssemIsIndependentOfPrototype(self):
+        """Constructed assemblies share immutable state with the prototype, but nothing mutable."""
+        prototype = self.blueprints.assemblies["igniter fuel"]
+        fuelAssem = self.blueprints.constructAssem(self.cs, name="igniter fuel")
+        self.assertNotEqual(fuelAssem.getNum(), prototype.getNum())
+
+        protoBlock = prototype.getFirstBlock(Flags.FUEL)
+        block = fuelAssem.getFirstBlock(Flags.FUEL)
+        self.assertIs(block.p.flags, protoBlock.p.flags)
+        self.assertIsNot(block.p, protoBlock.p)
+        self.assertNotEqual(block.p.serialNum, protoBlock.p.serialNum)
+
+        protoFuel = protoBlock.getComponent(Flags.FUEL)
+        fuel = block.getComponent(Flags.FUEL)
+        self.assertIsNot(fuel.material, protoFuel.material)
+        self.assertIs(fuel.material.parent, fuel)
+        self.assertIsNot(fuel.material.massFrac, protoFuel.material.massFrac)
+        self.assertEqual(fuel.material.massFrac, protoFuel.material.massFrac)
+        self.assertIs(fuel.spatialLocator.grid, block.spatialGrid)
+
+        # dimension links must resolve to components in the new block, not the prototype
+        for c in block:
+            for dimName in c.DIMENSION_NAMES:
+                if c.dimensionIsLinked(dimName):
+                    self.assertIs(c.p[dimName][0].parent, block)
+
+        fuel.p.temperatureInC += 100.0
+        self.assertNotAlmostEqual(fuel.p.temperatureInC, protoFuel.p.temperatureInC)
+
     def test_traceNuclides(self):
         """Ensure that armi.reactor.blueprints.componentBlueprint.insertDepletableNuclideKeys runs.
 
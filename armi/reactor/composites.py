@@ -261,6 +261,16 @@ class CompositeModelType(resolveCollections.ResolveParametersMeta):
         return newType
 
 
+ParamSummary = collections.namedtuple("ParamSummary", ("total", "average", "maximum", "maxObj"))
+"""
+The sum, average and maximum of a parameter over some objects, and the object with the maximum.
+
+See Also
+--------
+ArmiObject.summarizeParams
+"""
+
+
 class ArmiObject(metaclass=CompositeModelType):
     """
     The abstract base class for all composites and leaves.
@@ -1823,6 +1833,117 @@ class ArmiObject(metaclass=CompositeModelType):
         else:
             return realVal
 
+    def summarizeParams(
+        self,
+        params,
+        typeSpec: TypeSpec = None,
+        generationNum=1,
+        volumeIntegrated=False,
+        weightingParam=None,
+        volumeAveraged=True,
+        absolute=True,
+    ) -> dict[str, ParamSummary]:
+        """
+        Sum, average and find the maximum of many parameters of the children at once.
+
+        This gives the same values as :py:meth:`calcTotalParam`, :py:meth:`calcAvgParam` and
+        :py:meth:`getMaxParam` with the same arguments, for every parameter. Rather than walking the
+        children once per parameter and per quantity, the children are walked once; their flags,
+        volumes and parameters are gathered into arrays and reduced there.
+
+        Parameters
+        ----------
+        params : list of str
+            The parameters to summarize
+
+        typeSpec : TypeSpec, optional
+            The child types to restrict to
+
+        generationNum : int, optional
+            Which generation to consider (1 for children, 2 for grandchildren)
+
+        volumeIntegrated : bool, optional
+            Integrate the totals over volume, as in ``calcTotalParam``
+
+        weightingParam : str, optional
+            A parameter to weight the averages by, as in ``calcAvgParam``
+
+        volumeAveraged : bool, optional
+            Volume average the averages, as in ``calcAvgParam``
+
+        absolute : bool, optional
+            Average the absolute values, and find the values of largest magnitude, as in
+            ``calcAvgParam`` and ``getMaxParam``
+
+        Returns
+        -------
+        dict of ParamSummary
+            The total, average, maximum and the child with the maximum of each parameter. The average
+            is NaN if the weights sum to zero, where ``calcAvgParam`` would raise. Unset (``None``)
+            values are NaN in the total and average and are skipped for the maximum; the maximum is
+            0.0, with no child, if there are no values.
+        """
+        children = self.getChildren(generationNum=generationNum)
+        if typeSpec:
+            # gather the flags once and match them as arrays, like hasFlags with exact=False
+            flags = np.array([int(c.p.flags) for c in children], dtype=object)
+            candidates = [typeSpec] if isinstance(typeSpec, Flags) else typeSpec
+            mask = np.zeros(len(children), dtype=bool)
+            for flag in candidates:
+                value = int(flag)
+                if not value:
+                    mask[:] = True
+                    break
+                mask |= (flags & value == value).astype(bool)
+            children = [c for c, matches in zip(children, mask.tolist()) if matches]
+
+        gathered = list(params)
+        if weightingParam and weightingParam not in gathered:
+            gathered.append(weightingParam)
+        values = dict(zip(gathered, _gatherParamValues(children, gathered)))
+
+        volumes = None
+        if volumeIntegrated or volumeAveraged:
+            volumes = np.array([c.getVolume() for c in children], dtype=float)
+
+        weights = np.ones(len(children))
+        if weightingParam:
+            weights = values[weightingParam]
+            if (weights < 0).any():
+                # Just for conservatism, do not allow negative weights.
+                raise ValueError(f"Weighting value ({weightingParam},{weights.min()}) cannot be negative.")
+        if volumeAveraged:
+            weights = weights * volumes
+        weightSum = weights.sum()
+        totalMult = volumes if volumeIntegrated else 1.0
+
+        summaries = {}
+        for param in params:
+            vals = values[param]
+            magnitudes = np.abs(vals) if absolute else vals
+            average = (magnitudes * weights).sum() / weightSum if weightSum else float("nan")
+            isSet = ~np.isnan(vals)
+            if isSet.any():
+                # the first of the largest, like getMaxParam
+                maxIndex = int(np.flatnonzero(isSet)[np.argmax(magnitudes[isSet])])
+                maximum, maxObj = float(vals[maxIndex]), children[maxIndex]
+            else:
+                maximum, maxObj = 0.0, None
+
+            summaries[param] = ParamSummary(float((vals * totalMult).sum()), float(average), maximum, maxObj)
+
+        return summaries
+
+    def summarizeParam(self, param, **kwargs) -> ParamSummary:
+        """
+        Sum, average and find the maximum of a parameter of the children at once.
+
+        See Also
+        --------
+        summarizeParams : details
+        """
+        return self.summarizeParams([param], **kwargs)[param]
+
     def getChildParamValues(self, param):
         """Get the child parameter values in a numpy array."""
         return np.array([child.p[param] for child in self])
@@ -3097,7 +3218,7 @@ class StateRetainer:
         """Helper method for ``__enter__`` and ``__exit__``. ``func`` is a lambda to either
         ``backUp()`` or ``restoreBackup()``.
         """
-        paramDefs = set()
+        paramDefCollections = {}
         items = itertools.chain(
             (self.composite,),
             self.composite.iterChildrenWithMaterials(deep=True),
@@ -3105,12 +3226,30 @@ class StateRetainer:
         for child in items:
             if hasattr(child, "p"):
                 # materials don't have Parameters
-                paramDefs.update(child.p.paramDefs)
+                paramDefCollections[type(child.p)] = child.p.paramDefs
             func(child)
+
+        paramDefs = set()
+        for collection in paramDefCollections.values():
+            paramDefs.update(collection)
         for paramDef in paramDefs:
             func(paramDef)
 
 
+def _gatherParamValues(objs, params):
+    """Get the values of some scalar parameters of some objects, with NaN for unset or unknown ones."""
+    rows = []
+    for obj in objs:
+        row = []
+        for param in params:
+            try:
+                row.append(obj.p[param])
+            except parameters.UnknownParameterError:
+                row.append(None)
+        rows.append(row)
+    return np.array(rows, dtype=float).reshape(len(objs), len(params)).T
+
+
 def gatherMaterialsByVolume(objects: List[ArmiObject], typeSpec: TypeSpec = None, exact=False):
     """
     Compute the total volume of each material in a set of objects and give samples.
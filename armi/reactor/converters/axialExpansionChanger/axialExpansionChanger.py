@@ -13,6 +13,7 @@
 # limitations under the License.
 """Enable component-wise axial expansion for assemblies and/or a reactor."""
 
+import logging
 import typing
 
 from numpy import array
@@ -25,6 +26,7 @@ from armi.reactor.converters.axialExpansionChanger.assemblyAxialLinkage import (
 )
 from armi.reactor.converters.axialExpansionChanger.expansionData import (
     ExpansionData,
+    computeThermalExpansionFactorsInBulk,
     iterSolidComponents,
 )
 from armi.reactor.flags import Flags
@@ -233,6 +235,63 @@ class AxialExpansionChanger:
         self.expansionData.computeThermalExpansionFactors()
         self.axiallyExpandAssembly()
 
+    def performThermalAxialExpansionOnAssemblies(
+        self,
+        assems: list,
+        tempGrid: list,
+        tempFields,
+        setFuel: bool = True,
+        expandFromTinputToThot: bool = False,
+    ):
+        """Perform thermal expansion/contraction for many assemblies at once, e.g. the whole core.
+
+        This gives the same result as calling :py:meth:`performThermalAxialExpansion` on each
+        assembly, but the temperatures of all the solid components are gathered first, and the
+        thermal expansion factors are computed for all of them together, once per material class
+        (see :py:func:`computeThermalExpansionFactorsInBulk
+        <armi.reactor.converters.axialExpansionChanger.expansionData.computeThermalExpansionFactorsInBulk>`).
+        Each assembly is then expanded with its own axial linkage, as usual.
+
+        Parameters
+        ----------
+        assems : list[:py:class:`Assembly <armi.reactor.assemblies.Assembly>`]
+            ARMI assemblies to be changed
+        tempGrid : float, list
+            Axial temperature grid (in cm) shared by all assemblies
+        tempFields : 2D array
+            Temperature values (in C) along grid, one row per assembly
+        setFuel : boolean, optional
+            Boolean to determine whether or not fuel blocks should have their target components set
+            This is useful when target components within a fuel block need to be determined on-the-fly.
+        expandFromTinputToThot: bool
+            determines if thermal expansion factors should be calculated from c.inputTemperatureInC
+            to c.temperatureInC (True) or some other reference temperature and c.temperatureInC (False)
+
+        Notes
+        -----
+        The linkage and expansion data of every assembly are held in memory until all of them are
+        expanded. Afterwards, ``linked`` and ``expansionData`` refer to the last assembly.
+        """
+        assems = list(assems)
+        if len(assems) != len(tempFields):
+            raise RuntimeError(
+                "There must be one temperature field per assembly!\n"
+                f"     len(assems) = {len(assems)}\n"
+                f" len(tempFields) = {len(tempFields)}"
+            )
+
+        toExpand = []
+        for a, tempField in zip(assems, tempFields):
+            self.setAssembly(a, setFuel, expandFromTinputToThot)
+            self.expansionData.updateComponentTempsBy1DTempField(tempGrid, tempField)
+            toExpand.append((self.linked, self.expansionData))
+
+        computeThermalExpansionFactorsInBulk(expansionData for _linked, expansionData in toExpand)
+        for linked, expansionData in toExpand:
+            self.linked = linked
+            self.expansionData = expansionData
+            self.axiallyExpandAssembly()
+
     def reset(self):
         self.linked = None
         self.expansionData = None
@@ -332,12 +391,16 @@ class AxialExpansionChanger:
         """
         mesh = [0.0]
         numOfBlocks = self.linked.a.countBlocksWithFlags()
-        runLog.debug(
-            "Printing component expansion information (growth percentage and 'target component')"
-            f"for each block in assembly {self.linked.a}."
-        )
+        # only build the per-component messages if they will be logged
+        logDetails = runLog.getVerbosity() <= logging.DEBUG
+        if logDetails:
+            runLog.debug(
+                "Printing component expansion information (growth percentage and 'target component')"
+                f"for each block in assembly {self.linked.a}."
+            )
         for ib, b in enumerate(self.linked.a):
-            runLog.debug(msg=f"  Block {b}")
+            if logDetails:
+                runLog.debug(msg=f"  Block {b}")
             blockHeight = b.getHeight()
             # set bottom of block equal to top of block below it
             # if ib == 0, leave block bottom = 0.0
@@ -347,7 +410,8 @@ class AxialExpansionChanger:
             if not isDummyBlock:
                 for c in iterSolidComponents(b):
                     growFrac = self.expansionData.getExpansionFactor(c)
-                    runLog.debug(msg=f"      Component {c}, growFrac = {growFrac:.4e}")
+                    if logDetails:
+                        runLog.debug(msg=f"      Component {c}, growFrac = {growFrac:.4e}")
                     c.height = growFrac * blockHeight
                     # align linked components
                     if ib == 0:
@@ -13,11 +13,13 @@
 # limitations under the License.
 """Data container for axial expansion."""
 
-from statistics import mean
+import collections
 from textwrap import dedent
 from typing import TYPE_CHECKING, Iterable, Optional
 
-from armi.materials import material
+import numpy as np
+
+from armi.materials import custom, material
 from armi.reactor.flags import Flags
 
 TARGET_FLAGS_IN_PREFERRED_ORDER = [
@@ -56,6 +58,149 @@ def getSolidComponents(b: "Block") -> list["Component"]:
     return list(iterSolidComponents(b))
 
 
+def getBlockAverageTemperatures(a: "Assembly", tempGrid, tempField) -> np.ndarray:
+    """
+    Average a 1D axial temperature field over each block of an assembly.
+
+    Parameters
+    ----------
+    a : :py:class:`Assembly <armi.reactor.assemblies.Assembly>`
+        Assembly whose blocks the temperatures are averaged over
+    tempGrid : numpy array
+        1D axial temperature grid (i.e., physical locations where temp is stored)
+    tempField : numpy array
+        temperature values along grid
+
+    Returns
+    -------
+    numpy array
+        The average of the temperatures at the grid points within each block, bounds included.
+
+    Raises
+    ------
+    ValueError
+        if no temperature points found within a block
+    """
+    tempGrid = np.asarray(tempGrid, dtype=float)
+    zbottom = np.array([b.p.zbottom for b in a])
+    ztop = np.array([b.p.ztop for b in a])
+    inBlock = (zbottom[:, np.newaxis] <= tempGrid) & (tempGrid <= ztop[:, np.newaxis])
+    numPoints = inBlock.sum(axis=1)
+    if not numPoints.all():
+        b = a[int(np.argmin(numPoints))]
+        raise ValueError(
+            f"{b} has no temperature points within it!\nLikely need to increase the refinement of the temperature grid."
+        )
+
+    return inBlock @ np.asarray(tempField, dtype=float) / numPoints
+
+
+def getLinearExpansionFactors(materials: list[material.Material], Tc, T0) -> np.ndarray:
+    """
+    Evaluate the linear expansion factors, dL/L, of many materials between two temperatures.
+
+    The materials are grouped by class, and the correlation of each class is evaluated once, on
+    the distinct pairs of temperatures of the group. Materials that do not support arrays of
+    temperatures are evaluated one distinct pair at a time.
+
+    Parameters
+    ----------
+    materials : list of Material
+        The material of each entry
+    Tc : numpy array
+        Current (hot) temperature of each entry, in C
+    T0 : numpy array
+        Cold temperature of each entry, in C
+
+    Notes
+    -----
+    This assumes that ``linearExpansionFactor`` depends only on the class of a material and on the
+    temperatures, not on the state of the material instance, as is the case for the materials in
+    ARMI.
+
+    See Also
+    --------
+    armi.materials.material.Material.linearExpansionFactor
+    """
+    Tc = np.asarray(Tc, dtype=float)
+    T0 = np.asarray(T0, dtype=float)
+    dLL = np.zeros(len(materials))
+    groups = collections.defaultdict(list)
+    for i, mat in enumerate(materials):
+        groups[type(mat)].append(i)
+
+    for indices in groups.values():
+        indices = np.array(indices)
+        pairs, inverse = np.unique(np.column_stack((Tc[indices], T0[indices])), axis=0, return_inverse=True)
+        values = _evaluateLinearExpansionFactors(materials[indices[0]], pairs[:, 0], pairs[:, 1])
+        dLL[indices] = values[inverse.ravel()]
+
+    return dLL
+
+
+def _evaluateLinearExpansionFactors(mat: material.Material, Tc: np.ndarray, T0: np.ndarray) -> np.ndarray:
+    """Evaluate the linear expansion factors of a material with arrays, or one pair at a time if it cannot."""
+    if len(Tc) > 1:
+        try:
+            dLL = np.asarray(mat.linearExpansionFactor(Tc=Tc, T0=T0), dtype=float)
+        except (TypeError, ValueError):
+            # the correlation or its range check only supports scalars
+            dLL = None
+        if dLL is not None and dLL.shape in ((), Tc.shape):
+            return np.broadcast_to(dLL, Tc.shape)
+
+    return np.array([mat.linearExpansionFactor(Tc=tc, T0=t0) for tc, t0 in zip(Tc.tolist(), T0.tolist())], dtype=float)
+
+
+def computeThermalExpansionFactorsInBulk(expansionData: Iterable["ExpansionData"]):
+    """
+    Compute the thermal expansion factors of the solid components of many assemblies at once.
+
+    This is equivalent to calling :py:meth:`ExpansionData.computeThermalExpansionFactors` on each
+    of them, but the material correlations are evaluated with :py:func:`getLinearExpansionFactors`,
+    once per material class for the whole set, rather than once per component.
+
+    Parameters
+    ----------
+    expansionData : iterable of ExpansionData
+        The expansion data of each assembly, with the component temperatures already updated
+    """
+    owners, components, hotTemps, coldTemps = [], [], [], []
+    for data in expansionData:
+        for c in (c for b in data._a for c in iterSolidComponents(b)):
+            if isinstance(c.material, custom.Custom):
+                # No thermal expansion of custom materials
+                data._expansionFactors[c] = 1.0
+                continue
+
+            if data.expandFromTinputToThot:
+                coldTemp = c.inputTemperatureInC
+            elif c in data.componentReferenceTemperature:
+                coldTemp = data.componentReferenceTemperature[c]
+            else:
+                # no componentReferenceTemperature for this component, so it does not expand
+                data._expansionFactors[c] = 1.0
+                continue
+
+            owners.append(data)
+            components.append(c)
+            hotTemps.append(c.temperatureInC)
+            coldTemps.append(coldTemp)
+
+    hotTemps = np.array(hotTemps, dtype=float)
+    coldTemps = np.array(coldTemps, dtype=float)
+    dLL = getLinearExpansionFactors([c.material for c in components], hotTemps, coldTemps)
+
+    if components:
+        # materials without an expansion correlation are reported by Component.getThermalExpansionFactor
+        unexpanded = (dLL == 0.0) & (np.abs(hotTemps - coldTemps) > components[0]._TOLERANCE)
+        for i in np.flatnonzero(unexpanded):
+            components[i].getThermalExpansionFactor(Tc=hotTemps[i], T0=coldTemps[i])
+
+    for data, c, factor in zip(owners, components, (1.0 + dLL).tolist()):
+        data._expansionFactors[c] = factor
+
+
 class ExpansionData:
     r"""Data container for axial expansion.
 
@@ -150,21 +295,8 @@ class ExpansionData:
             raise RuntimeError("tempGrid and tempField must have the same length.")
 
         self.componentReferenceTemperature = {}  # reset, just to be safe
-        for b in self._a:
-            tmpMapping = []
-            for idz, z in enumerate(tempGrid):
-                if b.p.zbottom <= z <= b.p.ztop:
-                    tmpMapping.append(tempField[idz])
-                if z > b.p.ztop:
-                    break
-
-            if len(tmpMapping) == 0:
-                raise ValueError(
-                    f"{b} has no temperature points within it!\n"
-                    "Likely need to increase the refinement of the temperature grid."
-                )
-
-            blockAveTemp = mean(tmpMapping)
+        blockAveTemps = getBlockAverageTemperatures(self._a, tempGrid, tempField)
+        for b, blockAveTemp in zip(self._a, blockAveTemps.tolist()):
             for c in b:
                 self.updateComponentTemp(c, blockAveTemp)
 
@@ -35,6 +35,7 @@ import os
 import matplotlib
 import matplotlib.pyplot as plt
 import numpy as np
+from scipy import sparse
 
 from armi import materials, runLog
 from armi.physics.neutronics.fissionProductModel import lumpedFissionProduct
@@ -276,6 +277,146 @@ class FuelAssemNumModifier(GeometryChanger):
         raise NotImplementedError
 
 
+class _SourceBlockTable:
+    """
+    Arrays describing the assemblies and blocks of a hex core, for the vectorized R-Z-Theta conversion.
+
+    The ring and polar angle of every assembly are computed once, so the assemblies of a radial-theta
+    zone are found with array masks. Every block is a row of a core-wide number density matrix, and
+    its volume within each axial zone of the converted reactor is a column of ``volumeWeights``, so
+    a radial-theta zone is homogenized for all of its axial zones with a few matrix products.
+
+    The assemblies are in sorted order and their blocks are bottom to top, which is the order in
+    which :py:meth:`HexToRZThetaConverter.createHomogenizedRZTBlock` visits them.
+
+    Attributes
+    ----------
+    assems : list of Assembly
+        The assemblies of the core, sorted.
+    rings, thetas : np.ndarray
+        The hex ring and the polar angle (degrees, in [0, 360]) of each assembly.
+    blocks : list of Block
+        The blocks of all of the assemblies.
+    blockAssems : np.ndarray
+        The index of the assembly of each block.
+    nucNames : list of str
+        The nuclides of the columns of ``densities``.
+    densities : scipy.sparse.csr_matrix
+        The number densities (atoms/bn-cm) of each block. Nuclides that are in a block with a zero
+        number density are stored as explicit zeros.
+    overlaps : np.ndarray
+        ``overlaps[k, j]`` is True if block ``j`` overlaps axial zone ``k``.
+    volumeWeights : np.ndarray
+        ``volumeWeights[k, j]`` is the volume (cc) of block ``j`` within axial zone ``k``.
+    """
+
+    # blocks that overlap an axial zone by a smaller fraction of their height are left out
+    EPS = 1e-10
+
+    def __init__(self, core, axialMesh):
+        self.assems = sorted(core)
+        self.assemIndex = {a: i for i, a in enumerate(self.assems)}
+        self.rings = np.array([a.spatialLocator.getRingPos()[0] for a in self.assems], dtype=int)
+        x, y = np.array([a.spatialLocator.getLocalCoordinates()[:2] for a in self.assems], dtype=float).reshape(-1, 2).T
+        thetas = np.arctan2(y, x)
+        self.thetas = np.degrees(np.where(thetas < 0.0, math.tau + thetas, thetas))
+
+        self.blocks = [b for a in self.assems for b in a]
+        self.blockAssems = np.array([i for i, a in enumerate(self.assems) for _b in a], dtype=int)
+        self.blockTypes = [b.getType().lower() for b in self.blocks]
+        self.xsTypes = [b.p.xsType for b in self.blocks]
+        self.volumes = np.array([b.getVolume() for b in self.blocks], dtype=float)
+        self.temperatures = np.array([b.getAverageTempInC() for b in self.blocks], dtype=float)
+        self.nucNames, self.densities = self._buildDensityMatrix(self.blocks)
+        self.presence = self.densities.copy()
+        self.presence.data[:] = 1.0
+
+        zbottom = np.array([b.p.zbottom for b in self.blocks], dtype=float)
+        ztop = np.array([b.p.ztop for b in self.blocks], dtype=float)
+        heights = np.array([b.getHeight() for b in self.blocks], dtype=float)
+        upper = np.array(axialMesh, dtype=float)[:, np.newaxis]
+        lower = np.concatenate(([0.0], axialMesh[:-1]))[:, np.newaxis]
+        overlapHeights = np.minimum(ztop, upper) - np.maximum(zbottom, lower)
+        self.overlaps = (ztop >= lower) & (zbottom <= upper) & (overlapHeights / heights > self.EPS)
+        self.volumeWeights = np.where(self.overlaps, self.volumes * overlapHeights / heights, 0.0)
+
+    @staticmethod
+    def _buildDensityMatrix(blocks):
+        """Stack the number densities of the blocks into a sparse matrix with a column per nuclide."""
+        blockDensities = [b.getNumberDensities() for b in blocks]
+        nucIndex = {}
+        indices = []
+        data = []
+        indptr = [0]
+        for densities in blockDensities:
+            indices.extend(nucIndex.setdefault(nuc, len(nucIndex)) for nuc in densities)
+            data.extend(densities.values())
+            indptr.append(len(indices))
+        matrix = sparse.csr_matrix(
+            (np.array(data, dtype=float), np.array(indices, dtype=int), np.array(indptr, dtype=int)),
+            shape=(len(blocks), len(nucIndex)),
+        )
+        return list(nucIndex), matrix
+
+    def getAssemsInRings(self, lowerRing, upperRing):
+        """Return a mask of the assemblies in rings ``[lowerRing, upperRing)``."""
+        return (self.rings >= lowerRing) & (self.rings < upperRing)
+
+    def getAssemsInSector(self, theta1, theta2):
+        """
+        Return a mask of the assemblies in an angular sector.
+
+        This matches :py:meth:`HexToRZThetaConverter._getAssembliesInSector`, including its
+        tolerance on the bounds of the sector.
+        """
+        return (
+            ((theta1 <= self.thetas) & (self.thetas <= theta2))
+            | (np.abs(theta1 - self.thetas) < 0.001)
+            | (np.abs(theta2 - self.thetas) < 0.001)
+        )
+
+    def homogenize(self, assems):
+        """
+        Homogenize the blocks of some assemblies within each axial zone.
+
+        Returns
+        -------
+        list of tuple
+            For each axial zone, the indices of the overlapping blocks, their volumes within the
+            zone, the total atoms of each nuclide that is in any of them, and their volume-weighted
+            average temperature (C).
+        """
+        inZone = np.zeros(len(self.assems), dtype=bool)
+        inZone[[self.assemIndex[a] for a in assems]] = True
+        zoneBlocks = np.flatnonzero(inZone[self.blockAssems])
+        weights = sparse.csr_matrix(self.volumeWeights[:, zoneBlocks])
+        overlaps = sparse.csr_matrix(self.overlaps[:, zoneBlocks], dtype=float)
+
+        atoms = (weights @ self.densities[zoneBlocks]).toarray()
+        present = (overlaps @ self.presence[zoneBlocks]).toarray() > 0.0
+        totalVolumes = np.asarray(weights.sum(axis=1)).ravel()
+        with np.errstate(divide="ignore", invalid="ignore"):
+            temperatures = (weights @ self.temperatures[zoneBlocks]) / totalVolumes
+
+        zones = []
+        for k in range(len(self.volumeWeights)):
+            blockIndices = zoneBlocks[self.overlaps[k, zoneBlocks]]
+            nucIndices = np.flatnonzero(present[k])
+            zoneAtoms = dict(zip([self.nucNames[i] for i in nucIndices], atoms[k, nucIndices].tolist()))
+            zones.append((blockIndices, self.volumeWeights[k, blockIndices], zoneAtoms, temperatures[k]))
+        return zones
+
+    def getRingVolumes(self, assems):
+        """
+        Return the volume of some assemblies within each axial zone.
+
+        Assemblies that are listed more than once are counted more than once, like in
+        :py:meth:`HexToRZThetaConverter._calcRadialRingVolume`.
+        """
+        counts = np.bincount([self.assemIndex[a] for a in assems], minlength=len(self.assems))
+        return self.volumeWeights @ counts[self.blockAssems]
+
+
 class HexToRZThetaConverter(GeometryConverter):
     """
     Convert hex-based cases to an equivalent R-Z-Theta full core geometry.
@@ -311,6 +452,12 @@ class HexToRZThetaConverter(GeometryConverter):
     strictHomogenization : bool
         If True, the converter will restrict HEX-Z blocks with dissimilar XS types from being
         homogenized into an RZT block.
+    vectorized : bool
+        If True, the rings and polar angles of the assemblies and the number densities of the
+        blocks are tabulated once, and each radial-theta zone is homogenized over all of its axial
+        zones with sparse matrix products. This is much faster for large cores. The converted
+        reactor is the same, to round-off, but its assemblies are numbered differently because
+        the edge assemblies are not added to find the assemblies in each sector.
     """
 
     _GEOMETRY_TYPE = geometry.GeomType.RZT
@@ -338,12 +485,14 @@ class HexToRZThetaConverter(GeometryConverter):
     _MESH_BY_AXIAL_COORDS = "Axial Coordinates"
     _MESH_BY_AXIAL_BINS = "Axial Bins"
 
-    def __init__(self, cs, converterSettings, expandReactor=False, strictHomogenization=False):
+    def __init__(self, cs, converterSettings, expandReactor=False, strictHomogenization=False, vectorized=False):
         GeometryConverter.__init__(self, cs)
         self.converterSettings = converterSettings
         self.meshConverter = None
         self._expandSourceReactor = expandReactor
         self._strictHomogenization = strictHomogenization
+        self._vectorized = vectorized
+        self._blockTable = None
         self._radialMeshConversionType = None
         self._axialMeshConversionType = None
         self._previousRadialZoneAssemTypes = None
@@ -434,6 +583,8 @@ class HexToRZThetaConverter(GeometryConverter):
         runLog.info(rztSpatialGrid)
         self._setupConvertedReactor(rztSpatialGrid)
         self.convReactor.core.lib = self._sourceReactor.core.lib
+        if self._vectorized:
+            self._blockTable = _SourceBlockTable(self._sourceReactor.core, self.meshConverter.axialMesh)
 
         innerDiameter = 0.0
         lowerRing = 1
@@ -483,6 +634,7 @@ class HexToRZThetaConverter(GeometryConverter):
         # Track the new assemblies that were created when the converted reactor was
         # initialized so that the global assembly counter can be reset later.
         self._newAssembliesAdded = self.convReactor.core.getAssemblies()
+        self._blockTable = None
 
     def _setNextAssemblyTypeInRadialZone(self, lowerRing, upperRing):
         """
@@ -519,6 +671,10 @@ class HexToRZThetaConverter(GeometryConverter):
         return sortedAssemTypes
 
     def _getAssembliesInCurrentRadialZone(self, lowerRing, upperRing):
+        if self._blockTable is not None:
+            inRings = self._blockTable.getAssemsInRings(lowerRing, upperRing)
+            return [self._blockTable.assems[i] for i in np.flatnonzero(inRings)]
+
         ringAssems = []
         for ring in range(lowerRing, upperRing):
             ringAssems.extend(self._sourceReactor.core.getAssembliesInSquareOrHexRing(ring))
@@ -610,9 +766,19 @@ class HexToRZThetaConverter(GeometryConverter):
         """Retrieve list of assemblies in the reactor between (lowerRing, upperRing) and
         (lowerTheta, upperTheta).
         """
-        thetaAssems = self._getAssembliesInSector(
-            self._sourceReactor.core, math.degrees(lowerTheta), math.degrees(upperTheta)
-        )
+        if self._blockTable is not None:
+            inSector = self._blockTable.getAssemsInSector(math.degrees(lowerTheta), math.degrees(upperTheta))
+            if not inSector.any():
+                raise ValueError(
+                    "There are no assemblies in {} between angles of {} and {}".format(
+                        self._sourceReactor.core, math.degrees(lowerTheta), math.degrees(upperTheta)
+                    )
+                )
+            thetaAssems = [self._blockTable.assems[i] for i in np.flatnonzero(inSector)]
+        else:
+            thetaAssems = self._getAssembliesInSector(
+                self._sourceReactor.core, math.degrees(lowerTheta), math.degrees(upperTheta)
+            )
         ringAssems = self._getAssembliesInCurrentRadialZone(lowerRing, upperRing)
         if self._radialMeshConversionType == self._MESH_BY_RING_COMP:
             ringAssems = self._selectAssemsBasedOnType(ringAssems)
@@ -677,6 +843,9 @@ class HexToRZThetaConverter(GeometryConverter):
         newAssembly.spatialGrid = grids.AxialGrid.fromNCells(len(self.meshConverter.axialMesh), armiObject=newAssembly)
 
         lfp = lumpedFissionProduct.lumpedFissionProductFactory(self._cs)
+        if self._blockTable is not None:
+            homogenizedZones = self._blockTable.homogenize(zoneAssems)
+            ringVolumes = self._blockTable.getRingVolumes(self._assemsInRadialZone[radialIndex])
 
         lowerAxialZ = 0.0
         for axialIndex, upperAxialZ in enumerate(self.meshConverter.axialMesh):
@@ -685,15 +854,29 @@ class HexToRZThetaConverter(GeometryConverter):
             newBlock = blocks.ThRZBlock(newBlockName)
 
             # Compute the homogenized block data
-            (
-                newBlockAtoms,
-                newBlockType,
-                newBlockTemp,
-                newBlockVol,
-            ) = self.createHomogenizedRZTBlock(newBlock, lowerAxialZ, upperAxialZ, zoneAssems)
+            if self._blockTable is not None:
+                (
+                    newBlockAtoms,
+                    newBlockType,
+                    newBlockTemp,
+                    newBlockVol,
+                ) = self._createHomogenizedRZTBlockFromTable(
+                    newBlock, lowerAxialZ, upperAxialZ, homogenizedZones[axialIndex]
+                )
+                radialZoneVolume = ringVolumes[axialIndex]
+                if not radialZoneVolume:
+                    raise ValueError("Ring volume of ring {} is 0.0".format(radialIndex + 1))
+            else:
+                (
+                    newBlockAtoms,
+                    newBlockType,
+                    newBlockTemp,
+                    newBlockVol,
+                ) = self.createHomogenizedRZTBlock(newBlock, lowerAxialZ, upperAxialZ, zoneAssems)
+                radialZoneVolume = self._calcRadialRingVolume(lowerAxialZ, upperAxialZ, radialIndex)
+
             # Compute radial zone outer diameter
             axialSegmentHeight = upperAxialZ - lowerAxialZ
-            radialZoneVolume = self._calcRadialRingVolume(lowerAxialZ, upperAxialZ, radialIndex)
             radialRingArea = radialZoneVolume / axialSegmentHeight * self._sourceReactor.core.powerMultiplier
             outerDiameter = blockConverters.getOuterDiamFromIDAndArea(innerDiameter, radialRingArea)
 
@@ -824,6 +1007,45 @@ class HexToRZThetaConverter(GeometryConverter):
 
         return homBlockAtoms, homBlockType, homBlockTemperature, homBlockVolume
 
+    def _createHomogenizedRZTBlockFromTable(self, homBlock, lowerAxialZ, upperAxialZ, homogenizedZone):
+        """
+        Create the homogenized RZT block from a zone homogenized by the block table.
+
+        This is :py:meth:`createHomogenizedRZTBlock` for the vectorized converter, where the atoms,
+        volume, and temperature of the zone have already been computed by
+        :py:meth:`_SourceBlockTable.homogenize`.
+        """
+        table = self._blockTable
+        blockIndices, blockVolumes, homBlockAtoms, homBlockTemperature = homogenizedZone
+        if (blockVolumes == 0.0).any():
+            b = table.blocks[blockIndices[np.flatnonzero(blockVolumes == 0.0)[0]]]
+            raise ValueError("Geometry conversion failed. Block {} has zero volume".format(b))
+
+        homBlockVolume = float(blockVolumes.sum())
+        hexBlocks = [table.blocks[j] for j in blockIndices]
+        self.blockMap[homBlock].extend(hexBlocks)
+        for b, blockVolumeHere in zip(hexBlocks, (blockVolumes / homBlockVolume).tolist()):
+            self.blockVolFracs[homBlock][b] = blockVolumeHere
+
+        # Notify if blocks with different xs types are being homogenized. May be undesired behavior.
+        if len({table.xsTypes[j] for j in blockIndices}) > 1:
+            msg = (
+                "Blocks {} with dissimilar XS IDs are being homogenized in {} between axial heights"
+                " {} cm and {} cm. ".format(
+                    self.blockMap[homBlock],
+                    self.convReactor.core,
+                    lowerAxialZ,
+                    upperAxialZ,
+                )
+            )
+            if self._strictHomogenization:
+                raise ValueError(msg + "Modify mesh converter settings before proceeding.")
+            else:
+                runLog.extra(msg)
+
+        homBlockType = self._getHomogenizedBlockType(collections.Counter(table.blockTypes[j] for j in blockIndices))
+        return homBlockAtoms, homBlockType, float(homBlockTemperature), homBlockVolume
+
     def _getHomogenizedBlockType(self, numHexBlockByType):
         """
         Generate the homogenized block mixture type based on the frequency of hex block types that
@@ -1081,6 +1303,7 @@ class HexToRZThetaConverter(GeometryConverter):
         self._newBlockNum = 0
         self.blockMap = collections.defaultdict(list)
         self.blockVolFracs = collections.defaultdict(dict)
+        self._blockTable = None
         self.convReactor = None
         super().reset()
 
@@ -1102,6 +1325,16 @@ class ThirdCoreHexToFullCoreChanger(GeometryChanger):
 
     Does not generate a new reactor object.
 
+    Parameters
+    ----------
+    cs : Settings, optional
+        The case settings
+    vectorized : bool, optional
+        If True, the symmetric locations of all assemblies are found with one grid operation, the
+        parameters of the center assembly are scaled with one array operation per parameter, and
+        the added assemblies are purged from the core all at once when restoring. The expanded
+        reactor is the same either way.
+
     Examples
     --------
     >>> converter = ThirdCoreHexToFullCoreChanger()
@@ -1110,9 +1343,10 @@ class ThirdCoreHexToFullCoreChanger(GeometryChanger):
 
     EXPECTED_INPUT_SYMMETRY = geometry.SymmetryType(geometry.DomainType.THIRD_CORE, geometry.BoundaryType.PERIODIC)
 
-    def __init__(self, cs=None):
+    def __init__(self, cs=None, vectorized=False):
         GeometryChanger.__init__(self, cs)
         self.listOfVolIntegratedParamsToScale = []
+        self._vectorized = vectorized
 
     def _scaleBlockVolIntegratedParams(self, b, direction):
         if direction == "up":
@@ -1129,6 +1363,24 @@ class ThirdCoreHexToFullCoreChanger(GeometryChanger):
             else:
                 b.p[param] = op(b.p[param], 3)
 
+    def _scaleVolIntegratedParamsInBulk(self, blocks, direction):
+        """Scale the volume-integrated parameters of many blocks, with one array operation per parameter."""
+        op = operator.mul if direction == "up" else operator.truediv
+        for param in self.listOfVolIntegratedParamsToScale:
+            values = [b.p[param] for b in blocks]
+            scalars = [i for i, val in enumerate(values) if isinstance(val, (int, float)) and not isinstance(val, bool)]
+            if scalars:
+                scaled = op(np.array([values[i] for i in scalars]), 3).tolist()
+                for i, val in zip(scalars, scaled):
+                    blocks[i].p[param] = val
+
+            for b, val in zip(blocks, values):
+                if type(val) is list:
+                    # some params like volume-integrated mg flux are lists
+                    b.p[param] = [op(v, 3) for v in val]
+                elif isinstance(val, np.ndarray):
+                    b.p[param] = op(val, 3)
+
     def convert(self, r):
         """
         Run the conversion.
@@ -1185,6 +1437,19 @@ class ThirdCoreHexToFullCoreChanger(GeometryChanger):
             geometry.DomainType.FULL_CORE, geometry.BoundaryType.NO_SYMMETRY
         )
 
+        if self._vectorized:
+            self._expandAssemblies(grid)
+        else:
+            self._expandAssembliesOneByOne(grid)
+
+        # set domain after expanding, because it isn't actually full core until it's
+        # full core; setting the domain causes the core to clear its caches.
+        self._sourceReactor.core.symmetry = geometry.SymmetryType(
+            geometry.DomainType.FULL_CORE, geometry.BoundaryType.NO_SYMMETRY
+        )
+
+    def _expandAssembliesOneByOne(self, grid):
+        """Copy each assembly of the 1/3 core into its symmetric locations."""
         for a in self._sourceReactor.core.getAssemblies():
             # make extras and add them too. since the input is assumed to be 1/3 core.
             otherLocs = grid.getSymmetricEquivalents(a.spatialLocator.indices)
@@ -1216,11 +1481,44 @@ class ThirdCoreHexToFullCoreChanger(GeometryChanger):
                 for b in a:
                     self._scaleBlockVolIntegratedParams(b, "up")
 
-        # set domain after expanding, because it isn't actually full core until it's
-        # full core; setting the domain causes the core to clear its caches.
-        self._sourceReactor.core.symmetry = geometry.SymmetryType(
-            geometry.DomainType.FULL_CORE, geometry.BoundaryType.NO_SYMMETRY
-        )
+    def _expandAssemblies(self, grid):
+        """
+        Copy all assemblies of the 1/3 core into their symmetric locations.
+
+        The symmetric locations of every assembly are found with one grid operation, up front.
+        """
+        core = self._sourceReactor.core
+        assems = core.getAssemblies()
+        indices = np.array([a.spatialLocator.indices[:2] for a in assems], dtype=int)
+        allOtherLocs = grid.getAllSymmetricEquivalents(indices)
+        angle = 2 * math.pi / (allOtherLocs.shape[1] + 1)
+        hasZones = len(core.zones) > 0
+
+        for a, (i0, j0), otherLocs in zip(assems, indices, allOtherLocs):
+            if i0 == 0 and j0 == 0:
+                runLog.extra(f"Modifying parameters in central assembly {a} to convert from 1/3 to full core")
+                self._scaleCenterAssembly(a, "up")
+                continue
+
+            thisZone = core.zones.findZoneItIsIn(a) if hasZones else None
+            for count, (i, j) in enumerate(otherLocs.tolist(), start=1):
+                newAssem = copy.deepcopy(a)
+                newAssem.makeUnique()
+                newAssem.rotate(count * angle)
+                core.add(newAssem, core.spatialGrid[i, j, 0])
+                if thisZone:
+                    thisZone.addLoc(newAssem.getLocation())
+                self._newAssembliesAdded.append(newAssem)
+
+    def _scaleCenterAssembly(self, a, direction):
+        """Scale the volume-integrated parameters of the blocks in the center assembly."""
+        if not self.listOfVolIntegratedParamsToScale:
+            # populate the list with all parameters that are VOLUME_INTEGRATED
+            self.listOfVolIntegratedParamsToScale, _ = _generateListOfParamsToScale(
+                self._sourceReactor.core, paramsToScaleSubset=[]
+            )
+
+        self._scaleVolIntegratedParamsInBulk(a.getChildren(), direction)
 
     def restorePreviousGeometry(self, r=None):
         """Undo the changes made by convert by going back to 1/3 core.
@@ -1238,16 +1536,22 @@ class ThirdCoreHexToFullCoreChanger(GeometryChanger):
 
         # remove the assemblies that were added when the conversion happened.
         if bool(self._newAssembliesAdded):
-            for a in self._newAssembliesAdded:
-                r.core.removeAssembly(a, discharge=False)
+            if self._vectorized:
+                r.core.purgeAssemblies(self._newAssembliesAdded)
+            else:
+                for a in self._newAssembliesAdded:
+                    r.core.removeAssembly(a, discharge=False)
 
             r.core.symmetry = geometry.SymmetryType.fromAny(self.EXPECTED_INPUT_SYMMETRY)
 
             # change the central assembly params back to 1/3
             a = r.core.getAssemblyWithStringLocation("001-001")
             runLog.extra(f"Modifying parameters in central assembly {a} to revert from full to 1/3 core")
-            for b in a:
-                self._scaleBlockVolIntegratedParams(b, "down")
+            if self._vectorized:
+                self._scaleVolIntegratedParamsInBulk(a.getChildren(), "down")
+            else:
+                for b in a:
+                    self._scaleBlockVolIntegratedParams(b, "down")
         self.reset()
 
 
@@ -36,6 +36,7 @@ from armi.reactor.converters.axialExpansionChanger import (
     getSolidComponents,
     iterSolidComponents,
 )
+from armi.reactor.converters.axialExpansionChanger.expansionData import getLinearExpansionFactors
 from armi.reactor.flags import Flags
 from armi.testing import loadTestReactor
 from armi.tests import TEST_ROOT
@@ -563,6 +564,44 @@ class TestConservation(AxialExpansionTestBase):
                     )
 
 
+class TestBulkExpansion(AxialExpansionTestBase):
+    """Verify that expanding many assemblies at once matches expanding them one at a time."""
+
+    def test_performThermalAxialExpansionOnAssemblies(self):
+        names = ["FakeMat", "HT9", "FakeMat"]
+        bulkAssems = [buildTestAssemblyWithFakeMaterial(name=name) for name in names]
+        refAssems = [buildTestAssemblyWithFakeMaterial(name=name) for name in names]
+        temp = Temperature(bulkAssems[0].getTotalHeight(), numTempGridPts=11, tempSteps=4)
+        refChanger = AxialExpansionChanger()
+        for idt in range(1, temp.tempSteps):
+            # give each assembly a different temperature field
+            tempFields = [temp.tempField[idt, :] + 10.0 * i for i in range(len(names))]
+            self.obj.performThermalAxialExpansionOnAssemblies(bulkAssems, temp.tempGrid, tempFields)
+            for a, tempField in zip(refAssems, tempFields):
+                refChanger.performThermalAxialExpansion(a, temp.tempGrid, tempField)
+
+            for bulkAssem, refAssem in zip(bulkAssems, refAssems):
+                self.assertEqual(bulkAssem.getAxialMesh(), refAssem.getAxialMesh())
+                for bulkBlock, refBlock in zip(bulkAssem[:-1], refAssem[:-1]):
+                    for bulkComp, refComp in zip(iterSolidComponents(bulkBlock), iterSolidComponents(refBlock)):
+                        self.assertEqual(bulkComp.ztop, refComp.ztop)
+                        self.assertEqual(bulkComp.getNumberDensities(), refComp.getNumberDensities())
+
+        self.assertIs(self.obj.linked.a, bulkAssems[-1])
+        with self.assertRaisesRegex(RuntimeError, "one temperature field per assembly"):
+            self.obj.performThermalAxialExpansionOnAssemblies(bulkAssems, temp.tempGrid, tempFields[:1])
+
+    def test_getLinearExpansionFactors(self):
+        a = buildTestAssemblyWithFakeMaterial(name="HT9")
+        b = buildTestAssemblyWithFakeMaterial(name="FakeMat")
+        components = list(a.iterComponents()) + list(b.iterComponents())
+        hotTemps = [100.0 + 5.0 * (i % 3) for i in range(len(components))]
+        coldTemps = [25.0] * len(components)
+        dLL = getLinearExpansionFactors([c.material for c in components], hotTemps, coldTemps)
+        for c, value, hot, cold in zip(components, dLL, hotTemps, coldTemps):
+            self.assertAlmostEqual(value, c.material.linearExpansionFactor(Tc=hot, T0=cold), places=15)
+
+
 class TestManageCoreMesh(unittest.TestCase):
     """Verify that manage core mesh unifies the mesh for detailedAxialExpansion: False."""
 
@@ -173,6 +173,40 @@ class TestHexToRZConverter(unittest.TestCase):
         self.assertIsNone(geomConv._currentRadialZoneType)
         self.assertEqual(geomConv._newBlockNum, 0)
 
+    def test_convertVectorized(self):
+        """The vectorized converter builds the same reactor as the default one."""
+        for ring in [9, 8, 7, 6, 5, 4]:
+            self.r.core.removeAssembliesInRing(ring, self.o.cs)
+
+        converterSettings = {
+            "radialConversionType": "Ring Compositions",
+            "axialConversionType": "Axial Coordinates",
+            "uniformThetaMesh": True,
+            "thetaBins": 1,
+            "axialMesh": [25, 50, 75, 100, 150, 175],
+            "thetaMesh": [2 * math.pi],
+        }
+        expectedMassDict, _expectedNuclideList = self._getExpectedData()
+        reference = geometryConverters.HexToRZConverter(self.cs, converterSettings)
+        reference.convert(self.r)
+        geomConv = geometryConverters.HexToRZConverter(self.cs, converterSettings, vectorized=True)
+        geomConv.convert(self.r)
+
+        self._checkNuclideMasses(expectedMassDict, geomConv.convReactor)
+        assert_allclose(geomConv._getReactorMeshCoordinates()[1], reference._getReactorMeshCoordinates()[1])
+        refBlocks = list(reference.convReactor.core.iterBlocks())
+        newBlocks = list(geomConv.convReactor.core.iterBlocks())
+        self.assertEqual(len(newBlocks), len(refBlocks))
+        for refBlock, newBlock in zip(refBlocks, newBlocks):
+            self.assertEqual(newBlock.getType(), refBlock.getType())
+            self.assertEqual(newBlock.p.xsType, refBlock.p.xsType)
+            self.assertAlmostEqual(newBlock.getAverageTempInC(), refBlock.getAverageTempInC())
+            self.assertEqual(geomConv.blockMap[newBlock], reference.blockMap[refBlock])
+            refDensities = refBlock.getNumberDensities()
+            newDensities = newBlock.getNumberDensities()
+            self.assertEqual(set(newDensities), set(refDensities))
+            assert_allclose([newDensities[nuc] for nuc in refDensities], list(refDensities.values()), rtol=1e-12)
+
     def _checkBlockAtMeshPoint(self, geomConv):
         b = geomConv._getBlockAtMeshPoint(0.0, 2.0 * math.pi, 0.0, 12.0, 50.0, 75.0)
         self.assertTrue(b.hasFlags(Flags.FUEL))
@@ -395,6 +429,28 @@ class TestThirdCoreHexToFullCoreChanger(unittest.TestCase):
         for i, a in enumerate(assems):
             self.assertEqual(a.spatialLocator.getRingPos(), expectedLoc[i])
 
+    def test_growToFullCoreVectorized(self):
+        def getCoreState():
+            return {a.getLocation(): (a.getType(), str(a.p.orientation), [b.p.power for b in a]) for a in self.r.core}
+
+        initialNumBlocks = len(self.r.core.getBlocks())
+        changer = geometryConverters.ThirdCoreHexToFullCoreChanger(self.o.cs)
+        changer.convert(self.r)
+        expected = getCoreState()
+        changer.restorePreviousGeometry(self.r)
+
+        changer = geometryConverters.ThirdCoreHexToFullCoreChanger(self.o.cs, vectorized=True)
+        changer.convert(self.r)
+        self.assertTrue(self.r.core.isFullCore)
+        self.assertEqual(getCoreState(), expected)
+        self.assertAlmostEqual(self.r.core.getTotalBlockParam("power"), self.o.cs["power"], places=5)
+
+        changer.restorePreviousGeometry(self.r)
+        self.assertFalse(self.r.core.isFullCore)
+        self.assertEqual(initialNumBlocks, len(self.r.core.getBlocks()))
+        self.assertEqual(len(self.r.core.getChildren()), len(self.r.core.childrenByLocator))
+        self.assertAlmostEqual(self.r.core.getTotalBlockParam("power"), self.o.cs["power"] / 3, places=5)
+
     def test_initNewFullReactor(self):
         """Test that initNewReactor will growToFullCore if necessary."""
         # Perform reactor conversion
@@ -19,6 +19,8 @@ import os
 import random
 import unittest
 
+import numpy as np
+
 from armi.nuclearDataIO.cccc import isotxs
 from armi.physics.neutronics.settings import CONF_XS_KERNEL
 from armi.reactor.converters import uniformMesh
@@ -652,6 +654,51 @@ class TestParamConversion(unittest.TestCase):
                 self._cachedBlockParamData[b]["mgNeutronVelocity"],
             )
 
+    def test_axialOverlaps(self):
+        """The overlap heights are computed once per pair of axial meshes."""
+        overlaps = uniformMesh.getAxialOverlaps(self.sourceAssem, self.destinationAssem)
+        # the first destination block covers the first two source blocks; the others line up
+        self.assertEqual(overlaps.heights.shape, (len(self.destinationAssem), len(self.sourceAssem)))
+        np.testing.assert_allclose(overlaps.heights[0, :2], [self.height1, self.height2])
+        np.testing.assert_allclose(overlaps.heights[1:, 2:], np.diag(overlaps.sourceHeights[2:]))
+        self.assertEqual(overlaps.destHeights[0], self.height1 + self.height2)
+        self.assertIs(uniformMesh.getAxialOverlaps(self.sourceAssem, self.destinationAssem), overlaps)
+
+        reverse = uniformMesh.getAxialOverlaps(self.destinationAssem, self.sourceAssem)
+        np.testing.assert_allclose(reverse.heights, overlaps.heights.T)
+
+        # changing the mesh gives new overlaps
+        self.sourceAssem[0].setHeight(4.0)
+        self.sourceAssem[1].setHeight(6.0)
+        self.sourceAssem.calculateZCoords()
+        overlaps = uniformMesh.getAxialOverlaps(self.sourceAssem, self.destinationAssem)
+        np.testing.assert_allclose(overlaps.heights[0, :2], [4.0, 6.0])
+
+    def test_setPeakAndArrayStateFromOverlaps(self):
+        """Peak parameters take the maximum of the source blocks, and arrays are averaged like scalars."""
+        self.sourceAssem[0].p.fluxPeak = 2.0
+        self.sourceAssem[1].p.fluxPeak = 1.0
+        self.sourceAssem[0].p.mgFlux = [1.0, 2.0]
+        self.sourceAssem[1].p.mgFlux = [3.0, 4.0]
+        self.sourceAssem[0].p.pinMgFluxes = np.ones((2, 3))
+        self.sourceAssem[1].p.pinMgFluxes = 2.0 * np.ones((2, 3))
+
+        bpNames = ["fluxPeak", "mgFlux", "pinMgFluxes"]
+        uniformMesh.UniformMeshGeometryConverter.setAssemblyStateFromOverlaps(
+            self.sourceAssem,
+            self.destinationAssem,
+            paramMapper=uniformMesh.ParamMapper([], bpNames, self.sourceAssem[0]),
+        )
+
+        destBlock = self.destinationAssem[0]
+        self.assertEqual(destBlock.p.fluxPeak, 2.0)
+        # mgFlux is volume integrated, so the source values are summed by the fraction of each
+        # source block that is in the destination block.
+        np.testing.assert_allclose(destBlock.p.mgFlux, [4.0, 6.0])
+        # pinMgFluxes is an average, so it is weighted by the fraction of the destination block
+        expected = (self.height1 * 1.0 + self.height2 * 2.0) / (self.height1 + self.height2)
+        np.testing.assert_allclose(destBlock.p.pinMgFluxes, expected * np.ones((2, 3)))
+
 
 class TestUniformMeshNonUniformAssemFlags(unittest.TestCase):
     """
@@ -56,6 +56,7 @@ The mesh mapping happens as described in the figure:
 import collections
 import copy
 import glob
+import itertools
 import re
 from timeit import default_timer as timer
 
@@ -806,59 +807,25 @@ class UniformMeshGeometryConverter(GeometryConverter):
             assembly. Note that this will skip the reaction rate calculations for a block if it does
             not contain a valid multi-group flux.
 
+        The overlaps between the blocks of the two assemblies are computed once per pair of axial
+        meshes (see :py:func:`getAxialOverlaps`), and the state is mapped with matrix products over
+        all of the blocks of the assembly.
+
         See Also
         --------
-        setNumberDensitiesFromOverlaps : does this but does smarter caching for number densities.
+        setNumberDensitiesFromOverlaps : does this for the number densities of a single block.
         """
-        for destBlock in destinationAssembly:
-            zLower = destBlock.p.zbottom
-            zUpper = destBlock.p.ztop
-            destinationBlockHeight = destBlock.getHeight()
-            # Determine which blocks in the uniform mesh source assembly are
-            # within the lower and upper bounds of the destination block.
-            sourceBlocksInfo = sourceAssembly.getBlocksBetweenElevations(zLower, zUpper)
+        overlaps = getAxialOverlaps(sourceAssembly, destinationAssembly)
+        sourceBlocks = list(sourceAssembly)
+        destBlocks = [destinationAssembly[i] for i in overlaps.mappedRows]
 
-            if abs(zUpper - zLower) < 1e-6 and not sourceBlocksInfo:
-                continue
-            elif not sourceBlocksInfo:
-                raise ValueError(
-                    "An error occurred when attempting to map to the "
-                    f"results from {sourceAssembly} to {destinationAssembly}. "
-                    f"No blocks in {sourceAssembly} exist between the axial "
-                    f"elevations of {zLower:<12.5f} cm and {zUpper:<12.5f} cm. "
-                    "This a major bug in the uniform mesh converter that should "
-                    "be reported to the developers."
-                )
+        if mapNumberDensities:
+            _setNumberDensitiesFromOverlapMatrix(destBlocks, sourceBlocks, overlaps)
 
-            if mapNumberDensities:
-                setNumberDensitiesFromOverlaps(destBlock, sourceBlocksInfo)
-
-            # Iterate over each of the blocks that were found in the uniform mesh
-            # source assembly within the lower and upper bounds of the destination
-            # block and perform the parameter mapping.
-            if paramMapper is not None:
-                updatedDestVals = collections.defaultdict(float)
-                for sourceBlock, sourceBlockOverlapHeight in sourceBlocksInfo:
-                    sourceBlockVals = paramMapper.paramGetter(
-                        sourceBlock,
-                        paramMapper.blockParamNames,
-                    )
-                    sourceBlockHeight = sourceBlock.getHeight()
-
-                    for paramName, sourceBlockVal in zip(paramMapper.blockParamNames, sourceBlockVals):
-                        if sourceBlockVal is None:
-                            continue
-                        if paramMapper.isPeak[paramName]:
-                            updatedDestVals[paramName] = max(sourceBlockVal, updatedDestVals[paramName])
-                        else:
-                            if paramMapper.isVolIntegrated[paramName]:
-                                denominator = sourceBlockHeight
-                            else:
-                                denominator = destinationBlockHeight
-                            integrationFactor = sourceBlockOverlapHeight / denominator
-                            updatedDestVals[paramName] += sourceBlockVal * integrationFactor
-
-                paramMapper.paramSetter(destBlock, updatedDestVals.values(), updatedDestVals.keys())
+        if paramMapper is not None:
+            updatedDestVals = _mapParamsFromOverlapMatrix(sourceBlocks, overlaps, paramMapper)
+            for destBlock, destVals in zip(destBlocks, updatedDestVals):
+                paramMapper.paramSetter(destBlock, destVals.values(), destVals.keys())
 
         # If requested, the reaction rates will be calculated based on the
         # mapped neutron flux and the XS library.
@@ -1482,3 +1449,213 @@ def setNumberDensitiesFromOverlaps(block, overlappingBlockInfo):
     # volume of each component is recomputed.
     for c in block:
         c.p.volume = None
+
+
+class AxialOverlaps:
+    """
+    The heights over which the blocks of a destination assembly overlap the blocks of a source assembly.
+
+    This is the operator that maps the state of one axial mesh onto another: the state of a
+    destination block is a height-weighted sum over the source blocks it overlaps. Each row is a
+    destination block and each column a source block, so the state of all of the blocks of an
+    assembly is mapped with one matrix product per parameter. The rows only have a few non-zero
+    entries, but the matrices are small (one row per block of an assembly), so they are kept dense.
+
+    Attributes
+    ----------
+    heights : np.ndarray
+        ``heights[i, j]`` is the height (cm) over which destination block ``mappedRows[i]``
+        overlaps source block ``j``.
+    sourceHeights : np.ndarray
+        Height (cm) of each source block.
+    destHeights : np.ndarray
+        Height (cm) of each mapped destination block.
+    mappedRows : np.ndarray
+        Indices of the destination blocks that have state mapped onto them. Destination blocks with
+        no height that do not overlap any source block are skipped.
+    """
+
+    def __init__(self, heights, sourceHeights, destHeights, mappedRows):
+        self.heights = heights
+        self.sourceHeights = sourceHeights
+        self.destHeights = destHeights
+        self.mappedRows = mappedRows
+
+    @classmethod
+    def fromAssemblies(cls, sourceAssembly, destinationAssembly):
+        """Find the overlaps of the blocks of two assemblies."""
+        sourceIndex = {id(b): j for j, b in enumerate(sourceAssembly)}
+        mappedRows = []
+        heights = []
+        destHeights = []
+        for i, destBlock in enumerate(destinationAssembly):
+            zLower = destBlock.p.zbottom
+            zUpper = destBlock.p.ztop
+            # Determine which blocks in the source assembly are within the lower and upper bounds
+            # of the destination block.
+            sourceBlocksInfo = sourceAssembly.getBlocksBetweenElevations(zLower, zUpper)
+
+            if abs(zUpper - zLower) < 1e-6 and not sourceBlocksInfo:
+                continue
+            elif not sourceBlocksInfo:
+                raise ValueError(
+                    "An error occurred when attempting to map to the "
+                    f"results from {sourceAssembly} to {destinationAssembly}. "
+                    f"No blocks in {sourceAssembly} exist between the axial "
+                    f"elevations of {zLower:<12.5f} cm and {zUpper:<12.5f} cm. "
+                    "This a major bug in the uniform mesh converter that should "
+                    "be reported to the developers."
+                )
+
+            row = np.zeros(len(sourceIndex))
+            for sourceBlock, overlapHeight in sourceBlocksInfo:
+                row[sourceIndex[id(sourceBlock)]] += overlapHeight
+            mappedRows.append(i)
+            heights.append(row)
+            destHeights.append(destBlock.getHeight())
+
+        return cls(
+            np.array(heights).reshape(len(mappedRows), len(sourceIndex)),
+            np.array([b.getHeight() for b in sourceAssembly]),
+            np.array(destHeights),
+            np.array(mappedRows, dtype=int),
+        )
+
+
+MAX_CACHED_OVERLAPS = 1000
+_overlapCache = {}
+
+
+def _getAxialMeshKey(assembly):
+    return tuple((b.p.zbottom, b.p.ztop, b.getHeight()) for b in assembly)
+
+
+def getAxialOverlaps(sourceAssembly, destinationAssembly):
+    """
+    Return the overlaps between the blocks of two assemblies.
+
+    The overlaps only depend on the axial meshes of the two assemblies, so they are cached by
+    mesh. Most assemblies of a core share a few meshes, and both directions of the uniform mesh
+    conversion reuse them until the axial mesh changes, e.g. from axial expansion.
+    """
+    key = (_getAxialMeshKey(sourceAssembly), _getAxialMeshKey(destinationAssembly))
+    overlaps = _overlapCache.get(key)
+    if overlaps is None:
+        if len(_overlapCache) >= MAX_CACHED_OVERLAPS:
+            _overlapCache.clear()
+        overlaps = _overlapCache[key] = AxialOverlaps.fromAssemblies(sourceAssembly, destinationAssembly)
+    return overlaps
+
+
+def _setNumberDensitiesFromOverlapMatrix(destBlocks, sourceBlocks, overlaps):
+    """
+    Set the number densities of destination blocks from the source blocks they overlap.
+
+    This is :py:func:`setNumberDensitiesFromOverlaps` for all of the blocks of an assembly at once.
+    """
+    sourceDensities = [b.getNumberDensities() for b in sourceBlocks]
+    nucIndex = {nuc: k for k, nuc in enumerate(dict.fromkeys(itertools.chain.from_iterable(sourceDensities)))}
+    densities = np.zeros((len(sourceBlocks), len(nucIndex)))
+    for j, blockDensities in enumerate(sourceDensities):
+        densities[j, [nucIndex[nuc] for nuc in blockDensities]] = list(blockDensities.values())
+
+    destDensities = (overlaps.heights / overlaps.destHeights[:, np.newaxis]) @ densities
+    for block, overlapRow, blockDensities in zip(destBlocks, overlaps.heights, destDensities):
+        # only the nuclides of the overlapping blocks are set, in the order they are found in them
+        nucs = dict.fromkeys(
+            itertools.chain.from_iterable(sourceDensities[j] for j in np.flatnonzero(overlapRow))
+        ).keys()
+        block.clearNumberDensities()
+        block.setNumberDensities(dict(zip(nucs, blockDensities[[nucIndex[nuc] for nuc in nucs]].tolist())))
+        # Set the volume of each component in the block to `None` so that the
+        # volume of each component is recomputed.
+        for c in block:
+            c.p.volume = None
+
+
+def _stackParamValues(values, hasValue, isPeak):
+    """
+    Stack the values of a parameter on the source blocks into an array, with zeros for missing values.
+
+    Returns None for values that cannot be mapped with matrix products, such as arrays of different
+    shapes or non-numeric values.
+    """
+    valid = [v for v, ok in zip(values, hasValue) if ok]
+    if all(isinstance(v, (int, float, np.number)) for v in valid):
+        stacked = np.zeros(len(values))
+    elif not isPeak and all(isinstance(v, np.ndarray) and v.dtype.kind in "biuf" for v in valid):
+        shape = valid[0].shape
+        if any(v.shape != shape for v in valid):
+            return None
+        stacked = np.zeros((len(values),) + shape)
+    else:
+        return None
+
+    for j in np.flatnonzero(hasValue):
+        stacked[j] = values[j]
+    return stacked
+
+
+def _mapParamsFromOverlapMatrix(sourceBlocks, overlaps, paramMapper):
+    """
+    Compute the block parameter values of the destination blocks from the source blocks they overlap.
+
+    See :py:meth:`UniformMeshGeometryConverter.setAssemblyStateFromOverlaps` for the averaging. Peak
+    parameters take the maximum over the overlapping source blocks instead.
+
+    Returns
+    -------
+    list of dict
+        The new parameter values of each mapped destination block. Parameters that have no value on
+        any of the overlapping source blocks are left out, so they are not changed.
+    """
+    paramNames = paramMapper.blockParamNames
+    sourceVals = [paramMapper.paramGetter(b, paramNames) for b in sourceBlocks]
+    overlapping = overlaps.heights > 0.0
+    updatedDestVals = [{} for _ in overlaps.mappedRows]
+
+    for paramIndex, paramName in enumerate(paramNames):
+        values = [vals[paramIndex] for vals in sourceVals]
+        hasValue = np.array([v is not None for v in values], dtype=bool)
+        destHasValue = (overlapping & hasValue).any(axis=1)
+        if not destHasValue.any():
+            continue
+
+        isPeak = paramMapper.isPeak[paramName]
+        if isPeak:
+            weights = None
+        elif paramMapper.isVolIntegrated[paramName]:
+            weights = overlaps.heights / overlaps.sourceHeights
+        else:
+            weights = overlaps.heights / overlaps.destHeights[:, np.newaxis]
+
+        stacked = _stackParamValues(values, hasValue, isPeak)
+        if stacked is None:
+            destVals = _accumulateParam(values, overlapping, weights)
+        elif isPeak:
+            destVals = np.where(overlapping & hasValue, stacked, -np.inf).max(axis=1)
+            destVals = np.maximum(destVals, 0.0).tolist()
+        else:
+            destVals = (weights @ stacked.reshape(len(values), -1)).reshape((-1,) + stacked.shape[1:])
+            destVals = destVals.tolist() if stacked.ndim == 1 else list(destVals)
+
+        for i in np.flatnonzero(destHasValue):
+            updatedDestVals[i][paramName] = destVals[i]
+
+    return updatedDestVals
+
+
+def _accumulateParam(values, overlapping, weights):
+    """Map the values of a parameter one source block at a time, for values that cannot be stacked."""
+    destVals = []
+    for i, overlappingRow in enumerate(overlapping):
+        destVal = 0.0
+        for j in np.flatnonzero(overlappingRow):
+            if values[j] is None:
+                continue
+            if weights is None:
+                destVal = max(values[j], destVal)
+            else:
+                destVal += values[j] * weights[i, j]
+        destVals.append(destVal)
+    return destVals
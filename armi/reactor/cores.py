@@ -57,6 +57,10 @@ from armi.utils import createFormattedStrWithDelimiter, tabulate, units
 from armi.utils.iterables import Sequence
 from armi.utils.mathematics import average1DWithinTolerance
 
+# Sentinels in the neighbor table of a core. See Core.getNeighborTable.
+NEIGHBOR_BLANK = -1
+NEIGHBOR_BOUNDARY = -2
+
 
 class Core(composites.Composite):
     """
@@ -363,14 +367,8 @@ class Core(composites.Composite):
         Originally, this held onto all assemblies in the Spend Fuel Pool. However, they use memory.
         And it is possible to have the history interface record only the parameters you need.
         """
-        from armi.reactor.reactors import Reactor
-
-        paramDefs = set(parameters.ALL_DEFINITIONS)
-        paramDefs.difference_update(set(parameters.forType(Core)))
-        paramDefs.difference_update(set(parameters.forType(Reactor)))
-        for paramDef in paramDefs:
-            if paramDef.assigned & parameters.SINCE_ANYTHING:
-                paramDef.assigned = parameters.SINCE_ANYTHING
+        self._resetParamAssignments()
+        self._resetNeighborTable()
 
         if discharge:
             runLog.debug(f"Removing {a1} from {self}")
@@ -412,6 +410,47 @@ class Core(composites.Composite):
 
         self.processLoading(cs)
 
+    def purgeAssemblies(self, assems):
+        """
+        Remove many assemblies from the core at once, without discharging them.
+
+        This is equivalent to calling ``removeAssembly(a, discharge=False)`` on each assembly, but
+        the core's list of children is only rebuilt once.
+
+        Parameters
+        ----------
+        assems : list of Assembly
+            The assemblies to remove. They must all be in the core.
+        """
+        self._resetParamAssignments()
+        self._resetNeighborTable()
+
+        toPurge = set(assems)
+        for a in assems:
+            runLog.debug(f"Purging  {a} from {self}")
+            self.childrenByLocator.pop(a.spatialLocator)
+            a.p.dischargeTime = self.r.p.time
+            a.parent = None
+            a.spatialLocator = a.spatialLocator.detachedCopy()
+            self._removeListFromAuxiliaries(a)
+
+        self._children = [a for a in self._children if a not in toPurge]
+
+    def _resetParamAssignments(self):
+        """Reset the ``assigned`` flags of the parameters below the core, so the database rewrites them."""
+        from armi.reactor.reactors import Reactor
+
+        paramDefs = set(parameters.ALL_DEFINITIONS)
+        paramDefs.difference_update(set(parameters.forType(Core)))
+        paramDefs.difference_update(set(parameters.forType(Reactor)))
+        for paramDef in paramDefs:
+            if paramDef.assigned & parameters.SINCE_ANYTHING:
+                paramDef.assigned = parameters.SINCE_ANYTHING
+
+    def _resetNeighborTable(self):
+        """Forget the neighbor table, so it is rebuilt the next time neighbors are needed."""
+        self.cached.pop("neighborTable", None)
+
     def _removeListFromAuxiliaries(self, assembly):
         """
         Remove an assembly from all auxiliary reference tables and lists.
@@ -495,19 +534,12 @@ class Core(composites.Composite):
         --------
         removeAssembly : removes an assembly
         """
-        from armi.reactor.reactors import Reactor
-
         # Negative assembly IDs are placeholders, and we need to renumber the assembly
         if a.p.assemNum < 0:
             a.renumber(self.r.incrementAssemNum())
 
-        # resetting .assigned forces database to be rewritten for shuffled core
-        paramDefs = set(parameters.ALL_DEFINITIONS)
-        paramDefs.difference_update(set(parameters.forType(Core)))
-        paramDefs.difference_update(set(parameters.forType(Reactor)))
-        for paramDef in paramDefs:
-            if paramDef.assigned & parameters.SINCE_ANYTHING:
-                paramDef.assigned = parameters.SINCE_ANYTHING
+        self._resetParamAssignments()
+        self._resetNeighborTable()
 
         # could speed up output by passing format args as an arg and only process if verb good.
         runLog.debug("Adding   {0} to {1}".format(a, self))
@@ -1548,14 +1580,23 @@ class Core(composites.Composite):
         See Also
         --------
         grids.Grid.getSymmetricEquivalents
+        getNeighborTable : the neighbors of all assemblies at once
         """
-        neighborIndices = self.spatialGrid.getNeighboringCellIndices(*a.spatialLocator.getCompleteIndices())
+        # the duplicates only fill in blanks, so they are left out when the blanks are
+        assems, rows, table = self._getNeighborTable(showBlanks and duplicateAssembliesOnReflectiveBoundary)
+        row = rows.get(a)
+        if row is not None:
+            if showBlanks:
+                return [assems[n] if n >= 0 else None for n in table[row].tolist()]
+            return [assems[n] for n in table[row].tolist() if n >= 0]
 
-        dupReflectors = (
-            self.symmetry.domain == geometry.DomainType.THIRD_CORE
-            and self.symmetry.boundary == geometry.BoundaryType.PERIODIC
-            and duplicateAssembliesOnReflectiveBoundary
-        )
+        # not one of the assemblies of the core, so look up its neighbors by location
+        return self._findNeighborsByLocation(a, showBlanks, duplicateAssembliesOnReflectiveBoundary)
+
+    def _findNeighborsByLocation(self, a, showBlanks, duplicateAssembliesOnReflectiveBoundary):
+        """Find the neighbors of an assembly from the grid locations around it, without the neighbor table."""
+        neighborIndices = self.spatialGrid.getNeighboringCellIndices(*a.spatialLocator.getCompleteIndices())
+        dupReflectors = self._duplicatesReflectiveNeighbors(duplicateAssembliesOnReflectiveBoundary)
 
         neighbors = []
         for iN, jN, kN in neighborIndices:
@@ -1572,6 +1613,106 @@ class Core(composites.Composite):
 
         return neighbors
 
+    def getNeighborTable(self, duplicateAssembliesOnReflectiveBoundary=False):
+        """
+        Get the neighbors of all assemblies in the core at once.
+
+        This is the bulk :py:meth:`findNeighbors`. The neighbors are kept in an integer table, with a
+        row for each assembly and a column for each neighbor, in the same order as
+        ``findNeighbors``. The table is built the first time it is needed, and is rebuilt only after
+        assemblies are added, removed or moved, or the grid or symmetry of the core changes, so
+        looking up neighbors is cheap even in loops over the core.
+
+        Parameters
+        ----------
+        duplicateAssembliesOnReflectiveBoundary : bool, optional
+            Fill in neighbors across the symmetry lines of a 1/3 core with their symmetric
+            identicals, as in ``findNeighbors``.
+
+        Returns
+        -------
+        assems : list of Assembly
+            The assemblies of the core, in the order of the rows of the table.
+        neighbors : np.ndarray
+            The neighbors of each assembly, with shape ``(len(assems), 6)`` for a hexagonal grid or
+            ``(len(assems), 4)`` for a Cartesian grid. Each neighbor is an index into ``assems``, or
+            ``NEIGHBOR_BLANK`` if there is no assembly there, or ``NEIGHBOR_BOUNDARY`` if there is
+            no assembly there and it is outside of the domain of the core (e.g. across a symmetry
+            line).
+
+        Examples
+        --------
+        Find the maximum power of the neighbors of every assembly::
+
+            >>> assems, neighbors = core.getNeighborTable()
+            >>> powers = np.array([a.calcTotalParam("power") for a in assems] + [0.0])
+            >>> maxNeighborPower = powers[neighbors].max(axis=1)
+
+        Blank neighbors index the padding zero at the end of ``powers``.
+        """
+        assems, _rows, table = self._getNeighborTable(duplicateAssembliesOnReflectiveBoundary)
+        return list(assems), table.copy()
+
+    def _getNeighborTable(self, duplicateAssembliesOnReflectiveBoundary):
+        """Get the cached neighbor table, and a map of the row of each assembly, building it if needed."""
+        cached = self._getCached("neighborTable")
+        symmetry = str(self.symmetry)
+        if cached is None or cached[0] is not self.spatialGrid or cached[1] != symmetry:
+            cached = (self.spatialGrid, symmetry, *self._buildNeighborTable())
+            self._setCache("neighborTable", cached)
+
+        _grid, _symmetry, assems, rows, table, duplicatesTable = cached
+        if self._duplicatesReflectiveNeighbors(duplicateAssembliesOnReflectiveBoundary):
+            return assems, rows, duplicatesTable
+        return assems, rows, table
+
+    def _buildNeighborTable(self):
+        """
+        Build the neighbor table of the assemblies of the core.
+
+        Returns the assemblies, the row of each assembly, the neighbor table and the neighbor
+        table with the reflective duplicates filled in.
+        """
+        grid = self.spatialGrid
+        assems = list(self)
+        rows = {a: row for row, a in enumerate(assems)}
+
+        neighborLocs = [
+            [grid[iN, jN, kN] for iN, jN, kN in grid.getNeighboringCellIndices(*a.spatialLocator.getCompleteIndices())]
+            for a in assems
+        ]
+        table = np.full((len(assems), max((len(locs) for locs in neighborLocs), default=0)), NEIGHBOR_BLANK, dtype=int)
+        duplicates = {}
+        dupReflectors = self._duplicatesReflectiveNeighbors(True)
+        for row, locs in enumerate(neighborLocs):
+            for col, neighborLoc in enumerate(locs):
+                neighbor = self.childrenByLocator.get(neighborLoc)
+                if neighbor is not None and neighbor in rows:
+                    table[row, col] = rows[neighbor]
+                    continue
+                if not grid.locatorInDomain(neighborLoc, symmetryOverlap=True):
+                    table[row, col] = NEIGHBOR_BOUNDARY
+                if dupReflectors:
+                    symmetricAssem = self._getReflectiveDuplicateAssembly(neighborLoc)
+                    if symmetricAssem in rows:
+                        duplicates[row, col] = rows[symmetricAssem]
+
+        duplicatesTable = table
+        if dupReflectors:
+            duplicatesTable = table.copy()
+            for (row, col), duplicateRow in duplicates.items():
+                duplicatesTable[row, col] = duplicateRow
+
+        return assems, rows, table, duplicatesTable
+
+    def _duplicatesReflectiveNeighbors(self, duplicateAssembliesOnReflectiveBoundary):
+        """Whether neighbors across the symmetry lines are filled in with their symmetric identicals."""
+        return (
+            self.symmetry.domain == geometry.DomainType.THIRD_CORE
+            and self.symmetry.boundary == geometry.BoundaryType.PERIODIC
+            and duplicateAssembliesOnReflectiveBoundary
+        )
+
     def _getReflectiveDuplicateAssembly(self, neighborLoc):
         """
         Return duplicate assemblies across symmetry line.
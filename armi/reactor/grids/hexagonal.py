@@ -441,6 +441,37 @@ class HexGrid(StructuredGrid):
         else:
             raise NotImplementedError(f"Unhandled symmetry condition for HexGrid: {self.symmetry}")
 
+    def getAllSymmetricEquivalents(self, indices: np.ndarray) -> np.ndarray:
+        """
+        Retrieve the equivalent indices of many cells at once.
+
+        This is the vectorized :py:meth:`getSymmetricEquivalents`.
+
+        Parameters
+        ----------
+        indices : np.ndarray
+            The ``(i, j)`` indices of ``n`` cells, with shape ``(n, 2)``. Further columns, like
+            ``k``, are ignored.
+
+        Returns
+        -------
+        np.ndarray
+            The ``(i, j)`` indices of the equivalents of each cell, with shape ``(n, m, 2)``, where
+            ``m`` is 2 for a 1/3-core grid and 0 for a full-core grid. The center cell is its own
+            equivalent, so its rows are ``(0, 0)``; it has no other equivalents.
+        """
+        indices = np.asarray(indices, dtype=int).reshape(-1, np.shape(indices)[-1])[:, :2]
+        if (
+            self.symmetry.domain == geometry.DomainType.THIRD_CORE
+            and self.symmetry.boundary == geometry.BoundaryType.PERIODIC
+        ):
+            # the 120 and 240 degree rotations, like _getSymmetricIdenticalsThird
+            return np.stack([self.rotateIndices(indices, 2), self.rotateIndices(indices, 4)], axis=1)
+        elif self.symmetry.domain == geometry.DomainType.FULL_CORE:
+            return np.zeros((len(indices), 0, 2), dtype=int)
+        else:
+            raise NotImplementedError(f"Unhandled symmetry condition for HexGrid: {self.symmetry}")
+
     @staticmethod
     def _getSymmetricIdenticalsThird(indices) -> List[IJType]:
         """This works by rotating the indices by 120 degrees twice, counterclockwise."""
@@ -619,6 +650,33 @@ class HexGrid(StructuredGrid):
             return IndexLocation(newI, newJ, k, loc.grid)
         raise TypeError(f"Refusing to rotate an index {loc} from a grid {loc.grid} that is not consistent with {self}")
 
+    @staticmethod
+    def rotateIndices(indices: np.ndarray, rotations: int) -> np.ndarray:
+        """
+        Find the new indices of many cells after some number of CCW rotations.
+
+        This is the vectorized :py:meth:`rotateIndex`, for the ``(i, j)`` indices of many cells in
+        this grid.
+
+        Parameters
+        ----------
+        indices : np.ndarray
+            Starting ``(i, j)`` indices, with shape ``(n, 2)``
+        rotations : int
+            Number of counter clockwise rotations
+
+        Returns
+        -------
+        np.ndarray
+            The ``(i, j)`` indices after rotation, with shape ``(n, 2)``
+        """
+        indices = np.asarray(indices, dtype=int)
+        cubic = np.stack([indices[:, 0], indices[:, 1], -(indices[:, 0] + indices[:, 1])], axis=1)
+        rotated = np.roll(cubic, -rotations, axis=1)[:, :2]
+        if rotations % 2:
+            rotated = -rotated
+        return rotated
+
     def _roughlyEqual(self, other) -> bool:
         """Check that two hex grids are nearly identical.
 
@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import copy
 import math
 from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING, Hashable, Iterator, List, Optional, Tuple, Union
@@ -65,6 +66,16 @@ class LocationBase(ABC):
         """
         self.__init__(*state)
 
+    def __deepcopy__(self, memo) -> "LocationBase":
+        """
+        Copy a locator, detaching the grid just like pickling does.
+
+        The indices are immutable, so this skips the generic reduce/reconstruct machinery, which is
+        significant when copying composites that contain thousands of locators.
+        """
+        memo[id(self)] = newLoc = self.__class__(self._i, self._j, self._k, None)
+        return newLoc
+
     @property
     def i(self) -> int:
         return self._i
@@ -352,6 +363,11 @@ class MultiIndexLocation(IndexLocation):
         self.__init__(None)
         self._locations = state
 
+    def __deepcopy__(self, memo) -> "MultiIndexLocation":
+        memo[id(self)] = newLoc = self.__class__(None)
+        newLoc._locations = copy.deepcopy(self._locations, memo)
+        return newLoc
+
     def __repr__(self) -> str:
         return "<{} with {} locations>".format(self.__class__.__name__, len(self._locations))
 
@@ -288,6 +288,23 @@ class TestHexGrid(unittest.TestCase):
                 self.assertNotEqual(coords0[1], coords1[1], msg=f"Y @ ({i}, {j})")
                 self.assertEqual(coords0[2], coords1[2], msg=f"Z @ ({i}, {j})")
 
+    def test_getManyCoordinates(self):
+        """Test getManyCoordinates() matches getCoordinates() for each cell."""
+        indices = np.array([(i, j, k) for i in range(-2, 3) for j in range(-2, 3) for k in range(2)])
+        for grid in (
+            grids.HexGrid.fromPitch(1.0, cornersUp=True),
+            grids.HexGrid.fromPitch(1.0, cornersUp=False),
+            grids.CartesianGrid.fromRectangle(1.0, 2.0, isOffset=True),
+        ):
+            expected = [grid.getCoordinates(ijk) for ijk in indices]
+            assert_allclose(grid.getManyCoordinates(indices), expected)
+
+        grid = grids.AxialGrid.fromNCells(4)
+        indices = np.array([(0, 0, k) for k in range(4)])
+        assert_allclose(grid.getManyCoordinates(indices), [grid.getCoordinates(ijk) for ijk in indices])
+        with self.assertRaises(IndexError):
+            grid.getManyCoordinates([(0, 0, -1)])
+
     def test_getLocalCoordinatesCornersUp(self):
         """Test getLocalCoordinates() for corners up hex grids."""
         # validate the first ring of a corners-up hex grid
@@ -695,6 +712,24 @@ class TestHexGrid(unittest.TestCase):
             reversed = self._rotateAndCheckAngle(g, postRotate, -rotations)
             self.assertEqual(reversed, start)
 
+    def test_rotateManyIndices(self):
+        g = grids.HexGrid.fromPitch(1.0, numRings=3)
+        indices = np.array([(i, j) for i in range(-4, 5) for j in range(-4, 5)])
+        for rotations in range(-7, 8):
+            expected = [g.rotateIndex(g[i, j, 0], rotations).indices[:2] for i, j in indices]
+            np.testing.assert_array_equal(g.rotateIndices(indices, rotations), expected)
+
+    def test_getAllSymmetricEquivalents(self):
+        third = grids.HexGrid.fromPitch(1.0, symmetry="third core periodic")
+        equivalents = third.getAllSymmetricEquivalents(np.array([(3, -2, 0), (2, 1, 0), (0, 0, 0)]))
+        self.assertEqual(equivalents.shape, (3, 2, 2))
+        self.assertEqual(equivalents[0].tolist(), [[-1, 3], [-2, -1]])
+        self.assertEqual(equivalents[1].tolist(), [[-3, 2], [1, -3]])
+        self.assertEqual(equivalents[2].tolist(), [[0, 0], [0, 0]])
+
+        full = grids.HexGrid.fromPitch(1.0, symmetry="full core")
+        self.assertEqual(full.getAllSymmetricEquivalents(np.array([(3, -2)])).shape, (1, 0, 2))
+
     def _rotateAndCheckAngle(self, g: grids.HexGrid, start: grids.IndexLocation, rotations: int) -> grids.IndexLocation:
         """Rotate a location and verify it lands where we expected."""
         finish = g.rotateIndex(start, rotations)
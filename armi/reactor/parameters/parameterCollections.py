@@ -13,7 +13,6 @@
 # limitations under the License.
 
 import copy
-import pickle
 import sys
 from typing import Any, Callable, Iterator, List, Optional, Set
 
@@ -42,6 +41,14 @@ This is not MPI safe. We also have not done anything to make it thread safe, exc
 exists.
 """
 
+_IMMUTABLE_TYPES = frozenset(
+    {type(None), bool, int, float, complex, str, bytes, np.bool_, np.int32, np.int64, np.float32, np.float64}
+)
+"""Parameter value types that are immutable, and can therefore be shared between copies."""
+
+_MUTABLE_TYPES = frozenset({np.ndarray, list, dict, set})
+"""Parameter value types that are commonly changed in place, and must be copied by a backup."""
+
 
 def _getBaseParameterDefinitions():
     pDefs = parameterDefinitions.ParameterDefinitionCollection()
@@ -93,8 +100,9 @@ class ParameterCollection(metaclass=_ParameterCollectionType):
 
     Attributes
     ----------
-    _backup : str
-        A pickle dump of the __getstate__, or None.
+    _backup : dict
+        The journal of the state being retained by ``backUp``, or None. It maps the fields written
+        since the backup to their values at the time of the backup.
 
     _hist : dict
         Keys are ``(paramName, timeStep)``.
@@ -114,6 +122,7 @@ class ParameterCollection(metaclass=_ParameterCollectionType):
 
     pDefs: parameterDefinitions.ParameterDefinitionCollection = _getBaseParameterDefinitions()
     _allFields: List[str] = []
+    _fieldSet: Set[str] = set()
 
     _ArmiObject = None
     """The ArmiObject class that this ParameterCollection belongs to.
@@ -165,8 +174,7 @@ class ParameterCollection(metaclass=_ParameterCollectionType):
             for pDef in self.paramDefs:
                 setattr(self, pDef.fieldName, pDef.default)
         else:
-            for key, val in zip(self._allFields, _state):
-                self.__dict__[key] = val
+            self.__dict__.update(zip(self._allFields, _state))
 
         self.assigned = NEVER
 
@@ -250,6 +258,7 @@ class ParameterCollection(metaclass=_ParameterCollectionType):
         # early, rather than mysterious attribute access errors later.
         cls.pDefs.lock()
         cls._allFields = list(sorted(["_backup", "_hist", "assigned"] + [pd.fieldName for pd in cls.pDefs]))
+        cls._fieldSet = frozenset(cls._allFields)
 
         cls._slots = set(cls._allFields).union({pd.name for pd in cls.pDefs})
 
@@ -265,6 +274,11 @@ class ParameterCollection(metaclass=_ParameterCollectionType):
             else:
                 raise RuntimeError(f"Cannot set a read-only parameter {key}.")
 
+        values = self.__dict__
+        journal = values.get("_backup")
+        if journal is not None and key not in journal and key in self._fieldSet:
+            journal[key] = values.get(key, parameterDefinitions.NoDefault)
+
         object.__setattr__(self, key, value)
 
     def __deepcopy__(self, memo):
@@ -282,8 +296,12 @@ class ParameterCollection(metaclass=_ParameterCollectionType):
         # Grabbing state first and passing it into __init__() as a performance
         # optimization. This avoids the extra work in __init__() of defaulting all of
         # the parameters, only to set them in __setstate__(). Instead we pass them in,
-        # so that __init__() can set them.
-        state = copy.deepcopy(self.__getstate__(), memo)
+        # so that __init__() can set them. Most parameter values are immutable scalars, which
+        # deepcopy would return as-is anyway, so they are shared directly without a trip through
+        # the deepcopy dispatch machinery.
+        state = [val if type(val) in _IMMUTABLE_TYPES else copy.deepcopy(val, memo) for val in self.__getstate__()]
+        # a copy is not part of any retained state, so it does not get the backup journal
+        state[self._allFields.index("_backup")] = None
         memo[id(self)] = newPC = self.__class__(_state=state)
         return newPC
 
@@ -305,7 +323,8 @@ class ParameterCollection(metaclass=_ParameterCollectionType):
     def __getstate__(self):
         # reduce data to one giant list, ordered by _allFields (sorted). Use NoDefault
         # when a value is missing
-        data = [getattr(self, fieldName, parameterDefinitions.NoDefault) for fieldName in self._allFields]
+        values = self.__dict__
+        data = [values.get(fieldName, parameterDefinitions.NoDefault) for fieldName in self._allFields]
         return data
 
     def __setstate__(self, state):
@@ -326,6 +345,9 @@ class ParameterCollection(metaclass=_ParameterCollectionType):
             setattr(self, name, value)
         except TypeError:  # allows for history parameter tuples
             if isinstance(name, tuple):
+                journal = self._backup
+                if journal is not None and "_hist" not in journal:
+                    journal["_hist"] = dict(self._hist)
                 self._hist[name] = value
             else:
                 raise
@@ -339,8 +361,14 @@ class ParameterCollection(metaclass=_ParameterCollectionType):
             pd = self.paramDefs[name]
             if hasattr(self, pd.fieldName):
                 pd.assigned = SINCE_ANYTHING
+                journal = self._backup
+                if journal is not None and pd.fieldName not in journal:
+                    journal[pd.fieldName] = getattr(self, pd.fieldName)
                 delattr(self, pd.fieldName)
         else:
+            journal = self._backup
+            if journal is not None and "_hist" not in journal:
+                journal["_hist"] = dict(self._hist)
             del self._hist[name]
 
     def __contains__(self, name):
@@ -434,17 +462,29 @@ class ParameterCollection(metaclass=_ParameterCollectionType):
         return None
 
     def backUp(self):
-        """Back up the state in a Pickle."""
-        try:
-            self._backup = pickle.dumps(self.__getstate__())
-            # this reads as assigned & everything_but(SINCE_BACKUP)
-            self.assigned &= ~SINCE_BACKUP
-        except:
-            runLog.error("Attempted to pickle {}.".format(self))
-            raise
+        """
+        Back up the state, in a copy-on-write journal.
+
+        Rather than copying the whole state, this starts a journal of the fields that are written
+        from now on, which keeps the value each field had at the time of the backup, the first time
+        it is written. Parameter values that are often changed in place (arrays, lists, dicts and
+        sets) do not go through a write, so they are copied into the journal up front.
+
+        Backups can be nested. The journal of the enclosing backup is kept in the new journal.
+        """
+        values = self.__dict__
+        journal = {
+            key: _copyMutable(value)
+            for key, value in values.items()
+            if type(value) in _MUTABLE_TYPES and key.startswith("_p_")
+        }
+        journal["_backup"] = values["_backup"]
+        object.__setattr__(self, "_backup", journal)
+        # this reads as assigned & everything_but(SINCE_BACKUP)
+        self.assigned &= ~SINCE_BACKUP
 
     def restoreBackup(self, paramsToApply):
-        """Restore the backed up the state in a from a pickle.
+        """Restore the backed up state, by writing back the values in the journal.
 
         Parameters
         ----------
@@ -457,7 +497,12 @@ class ParameterCollection(metaclass=_ParameterCollectionType):
             compParams = (pd for pd in paramsToApply.intersection(set(self.paramDefs)))
             currentData = {pd: getattr(self, pd.fieldName) for pd in compParams if hasattr(self, pd.fieldName)}
 
-        self.__setstate__(pickle.loads(self._backup))
+        journal = self._backup
+        object.__setattr__(self, "_backup", None)
+        outerJournal = journal.pop("_backup")
+        for key, value in journal.items():
+            setattr(self, key, value)
+        object.__setattr__(self, "_backup", outerJournal)
 
         for pd, currentValue in currentData.items():
             # correct for global paramDef.assigned assumption
@@ -497,6 +542,15 @@ class ParameterCollection(metaclass=_ParameterCollectionType):
         return filter(f, self.paramDefs)
 
 
+def _copyMutable(value):
+    """Copy a parameter value that may be changed in place, sharing any immutable contents."""
+    if type(value) is np.ndarray:
+        return value.copy()
+    if type(value) is list and all(type(v) in _IMMUTABLE_TYPES for v in value):
+        return list(value)
+    return copy.deepcopy(value)
+
+
 def collectPluginParameters(pm):
     """Apply parameters from plugins to their respective object classes."""
     for pluginParamDefnCollections in pm.hook.defineParameters():
@@ -454,13 +454,14 @@ class ParameterDefinitionCollection:
 
     # Slots are not being used here as an attempt at optimization. Rather, they serve to add some
     # needed rigidity to the parameter system.
-    __slots__ = ("_paramDefs", "_paramDefDict", "_representedTypes", "_locked")
+    __slots__ = ("_paramDefs", "_paramDefDict", "_representedTypes", "_locked", "_locationQueries")
 
     def __init__(self):
         self._paramDefs = list()
         self._paramDefDict = dict()
         self._representedTypes = set()
         self._locked = False
+        self._locationQueries = dict()
 
     def __iter__(self):
         return iter(self._paramDefs)
@@ -534,8 +535,20 @@ class ParameterDefinitionCollection:
 
         Parameters can be defined at various locations within their container based on
         :py:class:`ParamLocation`. This allows selection by those values.
+
+        Notes
+        -----
+        Blocks query their own definitions by location every time they are rotated, so the result
+        for a locked collection is cached. The cached collection is locked too, since it is shared.
         """
-        return self._filter(lambda pd: pd.atLocation(paramLoc))
+        if not self._locked:
+            return self._filter(lambda pd: pd.atLocation(paramLoc))
+
+        if paramLoc not in self._locationQueries:
+            pdc = self._filter(lambda pd: pd.atLocation(paramLoc))
+            pdc.lock()
+            self._locationQueries[paramLoc] = pdc
+        return self._locationQueries[paramLoc]
 
     def since(self, mask):
         """
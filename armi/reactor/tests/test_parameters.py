@@ -19,6 +19,8 @@ import unittest
 from glob import glob
 from shutil import copyfile
 
+import numpy as np
+
 from armi.reactor import parameters
 from armi.reactor.reactorParameters import makeParametersReadOnly
 from armi.testing import loadTestReactor
@@ -324,6 +326,48 @@ class ParameterTests(unittest.TestCase):
         self.assertEqual(data["n"], 99)
         self.assertEqual(data["nPlus1"], 100)
 
+    def test_backUpJournal(self):
+        """Backups only keep the values written since, and restore them, even when nested."""
+
+        class Mock(parameters.ParameterCollection):
+            pDefs = parameters.ParameterDefinitionCollection()
+            with pDefs.createBuilder() as pb:
+                pb.defParam("a", "units", "description", "location", default=1.0)
+                pb.defParam("b", "units", "description", "location", default=None)
+                pb.defParam("c", "units", "description", "location", default=None)
+
+        mock = Mock()
+        mock.b = np.array([1.0, 2.0])
+        mock.c = "unchanged"
+        mock[("a", 0)] = 5.0
+
+        mock.backUp()
+        # arrays are copied up front, since they can be changed in place
+        self.assertEqual(set(mock._backup), {"_p_b", "_backup", "assigned"})
+        mock.a = 2.0
+        mock.b *= 10.0
+        mock[("a", 1)] = 6.0
+        del mock["c"]
+        self.assertEqual(set(mock._backup), {"_p_a", "_p_b", "_p_c", "_hist", "_backup", "assigned"})
+
+        # a copy does not carry the journal of the original
+        self.assertIsNone(copy.deepcopy(mock)._backup)
+
+        mock.backUp()
+        mock.a = 3.0
+        mock.b[0] = -1.0
+        mock.restoreBackup(set())
+        self.assertEqual(mock.a, 2.0)
+        self.assertEqual(mock.b.tolist(), [10.0, 20.0])
+        self.assertNotIn("c", mock)
+
+        mock.restoreBackup({Mock.pDefs["a"]})
+        self.assertIsNone(mock._backup)
+        self.assertEqual(mock.a, 2.0)
+        self.assertEqual(mock.b.tolist(), [1.0, 2.0])
+        self.assertEqual(mock.c, "unchanged")
+        self.assertEqual(mock._hist, {("a", 0): 5.0})
+
     def test_cannotDefineParameterWithSameName(self):
         with self.assertRaises(parameters.ParameterDefinitionError):
 
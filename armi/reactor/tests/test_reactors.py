@@ -15,6 +15,7 @@
 
 import copy
 import logging
+import math
 import os
 import pickle
 import unittest
@@ -26,7 +27,7 @@ from numpy.testing import assert_allclose, assert_equal
 from armi import operators, runLog, settings, tests
 from armi.materials import uZr
 from armi.physics.neutronics.settings import CONF_XS_KERNEL
-from armi.reactor import assemblies, blocks, geometry, grids, reactors
+from armi.reactor import assemblies, blocks, cores, geometry, grids, reactors
 from armi.reactor.components import Hexagon, Rectangle
 from armi.reactor.composites import Composite
 from armi.reactor.converters import geometryConverters
@@ -250,6 +251,61 @@ class HexReactorTests(ReactorTests):
         with self.assertRaises(ValueError):
             self.r.core.getTotalBlockParam(generationNum=1)
 
+    def test_summarizeParams(self):
+        core = self.r.core
+        for i, b in enumerate(core.iterBlocks()):
+            b.p.power = float(i % 7)
+            b.p.percentBu = (-1.0) ** i * i / 10.0
+        params = ["power", "percentBu"]
+
+        for kwargs in (
+            {},
+            {"volumeAveraged": False, "absolute": False},
+            {"typeSpec": Flags.FUEL, "volumeIntegrated": True},
+            {"typeSpec": [Flags.FUEL, Flags.PLENUM], "weightingParam": "power"},
+        ):
+            summaries = core.summarizeParams(params, generationNum=2, **kwargs)
+            for param in params:
+                summary = summaries[param]
+                self.assertAlmostEqual(
+                    summary.total,
+                    core.calcTotalParam(
+                        param,
+                        generationNum=2,
+                        typeSpec=kwargs.get("typeSpec"),
+                        volumeIntegrated=kwargs.get("volumeIntegrated", False),
+                    ),
+                )
+                self.assertAlmostEqual(
+                    summary.average,
+                    core.calcAvgParam(
+                        param,
+                        generationNum=2,
+                        typeSpec=kwargs.get("typeSpec"),
+                        weightingParam=kwargs.get("weightingParam"),
+                        volumeAveraged=kwargs.get("volumeAveraged", True),
+                        absolute=kwargs.get("absolute", True),
+                    ),
+                )
+                maximum, maxObj = core.getMaxParam(
+                    param,
+                    generationNum=2,
+                    typeSpec=kwargs.get("typeSpec"),
+                    absolute=kwargs.get("absolute", True),
+                    returnObj=True,
+                )
+                self.assertEqual(summary.maximum, maximum)
+                self.assertIs(summary.maxObj, maxObj)
+
+        # zero weights give a NaN average, and no children give no maximum
+        a = core.getFirstAssembly()
+        for b in a:
+            b.p.power = 0.0
+        summary = a.summarizeParam("percentBu", weightingParam="power")
+        self.assertTrue(math.isnan(summary.average))
+        summary = a.summarizeParam("percentBu", typeSpec=Flags.CONTROL | Flags.FUEL)
+        self.assertEqual((summary.total, summary.maximum, summary.maxObj), (0.0, 0.0, None))
+
     def test_geomType(self):
         self.assertEqual(self.r.core.geomType, geometry.GeomType.HEX)
 
@@ -557,6 +613,58 @@ class HexReactorTests(ReactorTests):
         self.assertEqual(len(neighbs), 6)
         self.assertEqual(locs, [(3, 2), (3, 3), (3, 4), (2, 3), (1, 1), (2, 1)])
 
+    def test_getNeighborTable(self):
+        core = self.r.core
+        assems, neighbors = core.getNeighborTable()
+        self.assertEqual(assems, list(core))
+        self.assertEqual(neighbors.shape, (len(assems), 6))
+        for a, row in zip(assems, neighbors):
+            neighborIndices = core.spatialGrid.getNeighboringCellIndices(*a.spatialLocator.getCompleteIndices())
+            for n, (i, j, k) in zip(row, neighborIndices):
+                loc = core.spatialGrid[i, j, k]
+                if n >= 0:
+                    self.assertIs(assems[n].spatialLocator, loc)
+                elif n == cores.NEIGHBOR_BOUNDARY:
+                    self.assertNotIn(loc, core.childrenByLocator)
+                    self.assertFalse(core.spatialGrid.locatorInDomain(loc, symmetryOverlap=True))
+                else:
+                    self.assertEqual(n, cores.NEIGHBOR_BLANK)
+                    self.assertNotIn(loc, core.childrenByLocator)
+                    self.assertTrue(core.spatialGrid.locatorInDomain(loc, symmetryOverlap=True))
+
+        # the duplicates fill in neighbors across the symmetry lines
+        _assems, duplicates = core.getNeighborTable(duplicateAssembliesOnReflectiveBoundary=True)
+        center = assems.index(core.childrenByLocator[core.spatialGrid[0, 0, 0]])
+        self.assertTrue((duplicates[center] >= 0).all())
+        self.assertEqual((neighbors[center] >= 0).sum(), 2)
+        filled = neighbors >= 0
+        assert_equal(duplicates[filled], neighbors[filled])
+
+        # moving assemblies rebuilds the table
+        a1, a2 = assems[center], assems[neighbors[center][0]]
+        loc1, loc2 = a1.spatialLocator, a2.spatialLocator
+        a1.moveTo(loc2)
+        a2.moveTo(loc1)
+        assems2, neighbors2 = core.getNeighborTable()
+        self.assertIs(assems2[neighbors2[assems2.index(a2)][0]], a1)
+
+        # and so does removing them
+        core.removeAssembly(a1)
+        self.assertNotIn(a1, core.getNeighborTable()[0])
+        self.assertNotIn(a1, core.findNeighbors(a2))
+
+    def test_findNeighborsTableParity(self):
+        """The neighbor table gives the same neighbors as the location lookup, for every option."""
+        core = self.r.core
+        for showBlanks in (True, False):
+            for duplicates in (True, False):
+                for a in core:
+                    self.assertEqual(
+                        core.findNeighbors(a, showBlanks, duplicates),
+                        core._findNeighborsByLocation(a, showBlanks, duplicates),
+                        msg=f"{a} with showBlanks={showBlanks}, duplicates={duplicates}",
+                    )
+
     def test_getAssembliesInCircularRing(self):
         expectedAssemsInRing = [5, 6, 8, 10, 12, 16, 14, 2]
         actualAssemsInRing = []
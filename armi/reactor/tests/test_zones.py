@@ -18,6 +18,8 @@ import logging
 import os
 import unittest
 
+import numpy as np
+
 from armi import runLog
 from armi.reactor import (
     assemblies,
@@ -341,3 +343,52 @@ class TestZones(unittest.TestCase):
         self.assertEqual(list(zs._zones.keys())[0], "ring-1")
         self.assertEqual(list(zs._zones.keys())[1], "ring-2")
         self.assertEqual(list(zs._zones.keys())[2], "ring-3")
+
+    def test_findZoneAfterAddLoc(self):
+        """The location index of the zones follows the locations added to and removed from a zone."""
+        a = self.r.core.getAssemblyWithStringLocation("004-001")
+        self.assertIsNone(self.zonez.findZoneItIsIn(a))
+
+        self.zonez["ring-3"].addLoc("004-001")
+        self.assertIs(self.zonez.findZoneItIsIn(a), self.zonez["ring-3"])
+        self.assertIn("004-001", self.zonez.getAllLocations())
+
+        self.zonez["ring-3"].removeLoc("004-001")
+        self.assertIsNone(self.zonez.findZoneItIsIn(a))
+        self.assertNotIn("004-001", self.zonez.getAllLocations())
+
+    def test_summarizeParam(self):
+        for i, a in enumerate(self.r.core):
+            a.p.chargeTime = float(i)
+            for b in a:
+                b.p.power = float(i) + b.p.zbottom
+
+        assems = self.r.core.getAssemblies()
+        indices = self.zonez.getZoneIndices(assems)
+        self.assertEqual(indices[assems.index(self.r.core.getAssemblyWithStringLocation("001-001"))], 0)
+        self.assertEqual((indices == 2).sum(), 3)
+        self.assertEqual((indices == -1).sum(), len(assems) - 6)
+
+        summary = self.zonez.summarizeParam(assems, "chargeTime")
+        self.assertEqual(summary.names, ["ring-1", "ring-2", "ring-3"])
+        for i, zone in enumerate(self.zonez):
+            values = [self.r.core.getAssemblyWithStringLocation(loc).p.chargeTime for loc in zone]
+            self.assertAlmostEqual(summary.sums[i], sum(values))
+            self.assertAlmostEqual(summary.averages[i], sum(values) / len(values))
+            self.assertAlmostEqual(summary.maxima[i], max(values))
+
+        # blocks are grouped by the zones of their assemblies
+        summary = self.zonez.summarizeParam(self.r.core.getBlocks(), "power", weightingParam="height")
+        blocks = [b for loc in self.zonez["ring-2"] for b in self.r.core.getAssemblyWithStringLocation(loc)]
+        self.assertEqual(summary.maxima[1], max(b.p.power for b in blocks))
+        for zone, average in zip(self.zonez, summary.averages):
+            blocks = [b for loc in zone for b in self.r.core.getAssemblyWithStringLocation(loc)]
+            expected = sum(b.p.power * b.p.height for b in blocks) / sum(b.p.height for b in blocks)
+            self.assertAlmostEqual(average, expected)
+
+        # a zone with no items has no average or maximum
+        self.zonez.addZone(zones.Zone("empty"))
+        summary = self.zonez.summarizeParam(assems, "chargeTime")
+        self.assertEqual(summary.sums[0], 0.0)
+        self.assertTrue(np.isnan(summary.averages[0]))
+        self.assertTrue(np.isnan(summary.maxima[0]))
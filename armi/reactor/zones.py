@@ -18,7 +18,10 @@ A Zones object is a collection of Zone objects.
 Together, they are used to conceptually divide the Core for analysis.
 """
 
-from typing import Iterator, List, Optional, Set, Union
+import collections
+from typing import Iterator, List, NamedTuple, Optional, Set, Union
+
+import numpy as np
 
 from armi import runLog
 from armi.reactor.assemblies import Assembly
@@ -44,6 +47,11 @@ class Zone:
         performing functions to check if a location exists in the Zone, looping through the
         locations in the Zone in alphabetical order, and returning the number of locations in the
         Zone, etc.
+
+    Notes
+    -----
+    The Zones collections that a Zone is in keep an index from each location to its zone, which is
+    updated by ``addLoc`` and ``removeLoc``. Changing ``locs`` directly bypasses that index.
     """
 
     VALID_TYPES = (Assembly, Block)
@@ -63,6 +71,9 @@ class Zone:
             # NOTE: We are not validating the locations.
             self.locs = set(locations)
 
+        # the Zones collections this Zone is in, which index its locations
+        self._collections = []
+
     def __contains__(self, loc: str) -> bool:
         return loc in self.locs
 
@@ -100,6 +111,8 @@ class Zone:
         """
         assert isinstance(loc, str), "The location must be a str: {0}".format(loc)
         self.locs.add(loc)
+        for zones in self._collections:
+            zones._indexLoc(self.name, loc)
 
     def removeLoc(self, loc: str) -> None:
         """
@@ -123,6 +136,8 @@ class Zone:
         """
         assert isinstance(loc, str), "The location must be a str: {0}".format(loc)
         self.locs.remove(loc)
+        for zones in self._collections:
+            zones._unindexLoc(self.name, loc)
 
     def addLocs(self, locs: List) -> None:
         """
@@ -201,6 +216,20 @@ class Zone:
             self.removeItem(item)
 
 
+class ZoneParamSummary(NamedTuple):
+    """
+    The sum, average, and maximum of a parameter in each zone.
+
+    The arrays are in the order of ``names``. Zones without any items have a sum of zero and an
+    average and maximum of NaN.
+    """
+
+    names: List[str]
+    sums: np.ndarray
+    averages: np.ndarray
+    maxima: np.ndarray
+
+
 class Zones:
     """Collection of Zone objects.
 
@@ -215,11 +244,18 @@ class Zones:
         resides, sort the Zone objects alphabetically, and summarize the zone definitions. In
         addition, methods are provided to facilitate the retrieval of Zone objects by name, loop
         through the Zones in order, and return the number of Zone objects.
+
+    Notes
+    -----
+    The names of the zones that each location is in are indexed, so finding the zone of an item
+    does not search every zone. The index is updated as zones are added and removed, and as the
+    zones add and remove locations.
     """
 
     def __init__(self):
         """Build a Zones object."""
         self._zones = {}
+        self._zoneNamesByLoc = collections.defaultdict(set)
 
     @property
     def names(self) -> List:
@@ -236,7 +272,10 @@ class Zones:
         return name in self._zones
 
     def __delitem__(self, name: str) -> None:
-        del self._zones[name]
+        zone = self._zones.pop(name)
+        zone._collections.remove(self)
+        for loc in zone.locs:
+            self._unindexLoc(name, loc)
 
     def __getitem__(self, name: str) -> Zone:
         """Access a zone by name."""
@@ -262,6 +301,21 @@ class Zones:
         if zone.name in self._zones:
             raise ValueError("Cannot add {} because a zone of that name already exists.".format(zone.name))
         self._zones[zone.name] = zone
+        zone._collections.append(self)
+        for loc in zone.locs:
+            self._indexLoc(zone.name, loc)
+
+    def _indexLoc(self, name: str, loc: str) -> None:
+        """Record that a location is in the named zone."""
+        self._zoneNamesByLoc[loc].add(name)
+
+    def _unindexLoc(self, name: str, loc: str) -> None:
+        """Record that a location is no longer in the named zone."""
+        names = self._zoneNamesByLoc.get(loc)
+        if names is not None:
+            names.discard(name)
+            if not names:
+                del self._zoneNamesByLoc[loc]
 
     def addZones(self, zones: List) -> None:
         """
@@ -342,7 +396,7 @@ class Zones:
         zoneLocs = set()
         for zn in zoneNames:
             try:
-                thisZoneLocs = set(self[zn])
+                thisZoneLocs = self[zn].locs
             except KeyError:
                 runLog.error("The zone {0} does not exist. Please define it.".format(zn))
                 raise
@@ -358,11 +412,7 @@ class Zones:
         set
             A combination set of all locations, from every Zone
         """
-        locs = set()
-        for zone in self:
-            locs.update(self[zone.name])
-
-        return locs
+        return set(self._zoneNamesByLoc)
 
     def findZoneItIsIn(self, a: Union[Assembly, Block]) -> Optional[Zone]:
         """
@@ -376,19 +426,94 @@ class Zones:
         Returns
         -------
         zone : Zone object that the input item resides in.
-        """
-        aLoc = a.getLocation()
-        zoneFound = False
-        for zone in self:
-            if aLoc in zone.locs:
-                zoneFound = True
-                return zone
 
-        if not zoneFound:
-            runLog.debug(f"Was not able to find which zone {a} is in", single=True)
+        Notes
+        -----
+        If the location is in more than one zone, the first of them by name is returned.
+        """
+        names = self._zoneNamesByLoc.get(a.getLocation())
+        if names:
+            return self._zones[min(names)]
 
+        runLog.debug(f"Was not able to find which zone {a} is in", single=True)
         return None
 
+    def getZoneIndices(self, items: List) -> np.ndarray:
+        """
+        Return the index in ``names`` of the zone that each Assembly or Block is in.
+
+        A Block that is not in a zone itself is looked up by the location of its Assembly, so the
+        blocks of the core can be grouped by assembly zones.
+
+        Parameters
+        ----------
+        items : list
+            Assemblies and/or Blocks
+
+        Returns
+        -------
+        np.ndarray
+            The zone index of each item, or -1 for items that are not in any zone.
+        """
+        zoneIndex = {name: i for i, name in enumerate(self.names)}
+        indices = np.full(len(items), -1, dtype=int)
+        for i, item in enumerate(items):
+            names = self._zoneNamesByLoc.get(item.getLocation())
+            if not names and isinstance(item, Block) and item.parent is not None:
+                names = self._zoneNamesByLoc.get(item.parent.getLocation())
+            if names:
+                indices[i] = zoneIndex[min(names)]
+        return indices
+
+    def summarizeParam(self, items: List, param: str, weightingParam: Optional[str] = None) -> ZoneParamSummary:
+        """
+        Compute the sum, average, and maximum of a parameter in every zone at once.
+
+        The items are grouped by :py:meth:`getZoneIndices` and each statistic is a single grouped
+        reduction over all of the zones, rather than a loop over the zones. Items that are not in
+        any zone are left out.
+
+        Parameters
+        ----------
+        items : list
+            Assemblies or Blocks, e.g. ``core.getBlocks()``
+        param : str
+            The parameter to summarize
+        weightingParam : str, optional
+            A parameter that the averages are weighted by. By default, each item has the same
+            weight.
+
+        Returns
+        -------
+        ZoneParamSummary
+            The sums, averages, and maxima, in the order of ``names``
+        """
+        names = self.names
+        indices = self.getZoneIndices(items)
+        inZone = indices >= 0
+        indices = indices[inZone]
+        selected = [item for item, isIn in zip(items, inZone) if isIn]
+        values = np.array([item.p[param] for item in selected], dtype=float)
+
+        if weightingParam:
+            weights = np.array([item.p[weightingParam] for item in selected], dtype=float)
+            if (weights < 0.0).any():
+                raise ValueError(f"Weighting values of {weightingParam} cannot be negative.")
+        else:
+            weights = np.ones(len(selected))
+
+        sums = np.bincount(indices, weights=values, minlength=len(names))
+        weightSums = np.bincount(indices, weights=weights, minlength=len(names))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            averages = np.bincount(indices, weights=values * weights, minlength=len(names)) / weightSums
+        averages[weightSums == 0.0] = np.nan
+
+        maxima = np.full(len(names), -np.inf)
+        np.maximum.at(maxima, indices, values)
+        maxima[np.bincount(indices, minlength=len(names)) == 0] = np.nan
+
+        return ZoneParamSummary(names, sums, averages, maxima)
+
     def sortZones(self, reverse=False) -> None:
         """Sorts the Zone objects alphabetically.
 
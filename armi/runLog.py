@@ -37,6 +37,14 @@ In either case, you can then log things the same way:
     runLog.error('extra error info here')
     raise SomeException  # runLog.error() implies that the code will crash!
 
+Messages that are expensive to build can be passed as ``%``-style arguments, or as a callable that
+returns the message. Either way, the message is only built if its level passes the verbosity:
+
+.. code::
+
+    runLog.debug('Block %s has %d components', b, len(b))
+    runLog.debug(lambda: f'Densities: {b.getNumberDensities()}')
+
 Or change the log level the same way:
 
 .. code::
@@ -45,11 +53,14 @@ Or change the log level the same way:
 """
 
 import collections
+import functools
 import logging
+import logging.handlers
 import operator
 import os
 import sys
 import time
+import warnings
 from glob import glob
 
 from armi import context
@@ -59,6 +70,8 @@ _ADD_LOG_METHOD_STR = """def {0}(self, message, *args, **kws):
     if self.isEnabledFor({1}):
         self._log({1}, message, args, **kws)
 logging.Logger.{0} = {0}"""
+LOG_BUFFER_CAPACITY = 1000
+_LOG_COPY_CHUNK = 1 << 20
 LOG_DIR = os.path.join(os.getcwd(), "logs")
 OS_SECONDS_TIMEOUT = 2 * 60
 SEP = "|"
@@ -131,6 +144,7 @@ class _RunLog:
         )
 
     @staticmethod
+    @functools.lru_cache
     def getWhiteSpace(mpiRank):
         """Helper method to build the white space used to left-adjust the log lines.
 
@@ -166,23 +180,35 @@ class _RunLog:
             except AttributeError:
                 exec(_ADD_LOG_METHOD_STR.format(longLogString, logValue))
 
-    def log(self, msgType, msg, single=False, label=None, **kwargs):
+    def log(self, msgType, msg, *args, single=False, label=None, **kwargs):
         """
         This is a wrapper around logger.log() that does most of the work and is used by all message
         passers (e.g. info, warning, etc.).
 
         In this situation, we do the mangling needed to get the log level to the correct number.
         And we do some custom string manipulation so we can handle de-duplicating warnings.
+
+        Messages below the verbosity are dropped before they are built, so callable messages are not
+        called, and ``args`` are not formatted into the message.
         """
         # Determine the log level: users can optionally pass in custom strings ("debug")
         msgLevel = msgType if isinstance(msgType, int) else self.logLevels[msgType][0]
+        if not self.logger.isEnabledFor(msgLevel):
+            return
 
-        # If this is a special "don't duplicate me" string, we need to add that info to the msg temporarily
-        msg = str(msg)
+        msg = self.resolveMessage(msg, args)
 
         # Do the actual logging
         self.logger.log(msgLevel, msg, single=single, label=label)
 
+    @staticmethod
+    def resolveMessage(msg, args=()):
+        """Build the string of a message, which can be a callable, with optional ``%``-style args."""
+        if callable(msg):
+            msg = msg()
+        msg = str(msg)
+        return msg % args if args else msg
+
     def getDuplicatesFilter(self):
         """If it exists, find the top-level ARMI logger 'should have a no duplicates' filter."""
         if not self.logger or not isinstance(self.logger, logging.Logger):
@@ -353,17 +379,11 @@ def concatenateLogs(logDir=None):
         for stdoutName in stdoutFiles:
             # NOTE: If the log file name format changes, this will need to change.
             rank = int(stdoutName.split(".")[-2])
-            with open(stdoutName, "r") as logFile:
-                data = logFile.read()
-                # only write if there's something to write
-                if data:
-                    rankId = "\n{0} RANK {1:03d} STDOUT {2}\n".format("-" * 10, rank, "-" * 60)
-                    if rank == 0:
-                        print(rankId, file=sys.stdout)
-                        print(data, file=sys.stdout)
-                    else:
-                        workerLog.write(rankId)
-                        workerLog.write(data)
+            rankId = "\n{0} RANK {1:03d} STDOUT {2}\n".format("-" * 10, rank, "-" * 60)
+            if rank == 0:
+                _copyLogFile(stdoutName, sys.stdout, rankId + "\n", "\n")
+            else:
+                _copyLogFile(stdoutName, workerLog, rankId)
             try:
                 os.remove(stdoutName)
             except OSError:
@@ -372,19 +392,61 @@ def concatenateLogs(logDir=None):
             # then print the stderr messages for that child process
             stderrName = stdoutName[:-3] + "err"
             if os.path.exists(stderrName):
-                with open(stderrName) as logFile:
-                    data = logFile.read()
-                    if data:
-                        # only write if there's something to write.
-                        rankId = "\n{0} RANK {1:03d} STDERR {2}\n".format("-" * 10, rank, "-" * 60)
-                        print(rankId, file=sys.stderr)
-                        print(data, file=sys.stderr)
+                rankId = "\n{0} RANK {1:03d} STDERR {2}\n".format("-" * 10, rank, "-" * 60)
+                _copyLogFile(stderrName, sys.stderr, rankId + "\n", "\n")
                 try:
                     os.remove(stderrName)
                 except OSError:
                     warning(f"Could not delete {stderrName}")
 
 
+def _copyLogFile(logPath, stream, head, tail=""):
+    """
+    Copy a log file to a stream in chunks, between a head and a tail, if the file is not empty.
+
+    The logs of a large run can be big, so they are never read into memory whole.
+    """
+    with open(logPath, "r") as logFile:
+        chunk = logFile.read(_LOG_COPY_CHUNK)
+        # only write if there's something to write
+        if not chunk:
+            return
+
+        stream.write(head)
+        while chunk:
+            stream.write(chunk)
+            chunk = logFile.read(_LOG_COPY_CHUNK)
+        stream.write(tail)
+
+
+def _handleLegacyArgs(msg, args, single, label):
+    """
+    Support the old positional ``single`` and ``label`` arguments of the logging functions.
+
+    They used to be the second and third positional arguments, e.g. ``runLog.warning(msg, True)``,
+    which would now be taken as ``%``-style arguments of the message. A bool, optionally followed by
+    a label, is always treated as ``single`` and ``label``, with a deprecation warning, whatever the
+    message holds: old messages may well have a literal ``%`` in them. To format a bool into a
+    message, pass it as a string.
+    """
+    if (
+        args
+        and len(args) <= 2
+        and isinstance(args[0], bool)
+        and (len(args) == 1 or args[1] is None or isinstance(args[1], str))
+    ):
+        warnings.warn(
+            "Passing `single` and `label` to the runLog functions as positional arguments is deprecated, "
+            "please pass them as keywords.",
+            DeprecationWarning,
+            stacklevel=3,
+        )
+        single = args[0]
+        label = args[1] if len(args) == 2 else label
+        args = ()
+    return args, single, label
+
+
 # Here are all the module-level functions that should be used for most outputs. They use the Log
 # object behind the scenes.
 def raw(msg):
@@ -392,32 +454,39 @@ def raw(msg):
     LOG.log("header", msg, single=False)
 
 
-def extra(msg, single=False, label=None):
-    LOG.log("extra", msg, single=single, label=label)
+def extra(msg, *args, single=False, label=None):
+    args, single, label = _handleLegacyArgs(msg, args, single, label)
+    LOG.log("extra", msg, *args, single=single, label=label)
 
 
-def debug(msg, single=False, label=None):
-    LOG.log("debug", msg, single=single, label=label)
+def debug(msg, *args, single=False, label=None):
+    args, single, label = _handleLegacyArgs(msg, args, single, label)
+    LOG.log("debug", msg, *args, single=single, label=label)
 
 
-def info(msg, single=False, label=None):
-    LOG.log("info", msg, single=single, label=label)
+def info(msg, *args, single=False, label=None):
+    args, single, label = _handleLegacyArgs(msg, args, single, label)
+    LOG.log("info", msg, *args, single=single, label=label)
 
 
-def important(msg, single=False, label=None):
-    LOG.log("important", msg, single=single, label=label)
+def important(msg, *args, single=False, label=None):
+    args, single, label = _handleLegacyArgs(msg, args, single, label)
+    LOG.log("important", msg, *args, single=single, label=label)
 
 
-def warning(msg, single=False, label=None):
-    LOG.log("warning", msg, single=single, label=label)
+def warning(msg, *args, single=False, label=None):
+    args, single, label = _handleLegacyArgs(msg, args, single, label)
+    LOG.log("warning", msg, *args, single=single, label=label)
 
 
-def error(msg, single=False, label=None):
-    LOG.log("error", msg, single=single, label=label)
+def error(msg, *args, single=False, label=None):
+    args, single, label = _handleLegacyArgs(msg, args, single, label)
+    LOG.log("error", msg, *args, single=single, label=label)
 
 
-def header(msg, single=False, label=None):
-    LOG.log("header", msg, single=single, label=label)
+def header(msg, *args, single=False, label=None):
+    args, single, label = _handleLegacyArgs(msg, args, single, label)
+    LOG.log("header", msg, *args, single=single, label=label)
 
 
 def warningReport():
@@ -447,7 +516,7 @@ class DeduplicationFilter(logging.Filter):
 
     def filter(self, record):
         # determine if this is a "do not duplicate" message
-        msg = str(record.msg)
+        msg = record.msg if isinstance(record.msg, str) else str(record.msg)
         single = getattr(record, "single", False)
 
         # grab the label if it exist, otherwise use the message itself as the label
@@ -473,11 +542,49 @@ class DeduplicationFilter(logging.Filter):
                 return False
 
         # Handle some special string-mangling we want to do, for multi-line messages
-        whiteSpace = _RunLog.getWhiteSpace(context.MPI_RANK)
-        record.msg = msg.rstrip().replace("\n", "\n" + whiteSpace)
+        msg = msg.rstrip()
+        if "\n" in msg:
+            msg = msg.replace("\n", "\n" + _RunLog.getWhiteSpace(context.MPI_RANK))
+        record.msg = msg
         return True
 
 
+class BufferedFileHandler(logging.handlers.MemoryHandler):
+    """
+    A handler that writes log records to a file in batches.
+
+    Worker processes can log a great many lines to their own files. Rather than writing each line as
+    it comes, this keeps up to ``capacity`` records in memory, and writes them all at once when the
+    buffer is full, when a record at ``flushLevel`` or above comes in, or when the handler is closed.
+    Warnings are written right away by default, so they are not lost if the process is killed.
+
+    Parameters
+    ----------
+    filePath : str
+        The log file. It is not created until the first records are written.
+    capacity : int, optional
+        The most records to keep in memory
+    flushLevel : int, optional
+        Records at or above this level are written right away, with everything before them
+    """
+
+    def __init__(self, filePath, capacity=LOG_BUFFER_CAPACITY, flushLevel=logging.WARNING):
+        target = logging.FileHandler(filePath, delay=True)
+        logging.handlers.MemoryHandler.__init__(self, capacity, flushLevel=flushLevel, target=target)
+
+    def setFormatter(self, fmt):
+        logging.handlers.MemoryHandler.setFormatter(self, fmt)
+        if self.target is not None:
+            self.target.setFormatter(fmt)
+
+    def close(self):
+        """Write the buffered records, and close the file."""
+        target = self.target
+        logging.handlers.MemoryHandler.close(self)
+        if target is not None:
+            target.close()
+
+
 class RunLogger(logging.Logger):
     """Custom Logger to support our specific desires.
 
@@ -541,7 +648,7 @@ class RunLogger(logging.Logger):
             self.setLevel(logging.INFO)
         else:
             filePath = os.path.join(LOG_DIR, _RunLog.STDOUT_NAME.format(args[0], mpiRank))
-            handler = logging.FileHandler(filePath, delay=True)
+            handler = BufferedFileHandler(filePath)
             handler.setLevel(logging.WARNING)
             self.setLevel(logging.WARNING)
 
@@ -21,6 +21,7 @@ CONF_DEBUG_DB = "debugDB"
 CONF_RELOAD_DB_NAME = "reloadDBName"
 CONF_LOAD_FROM_DB_EVERY_NODE = "loadFromDBEveryNode"
 CONF_SYNC_AFTER_WRITE = "syncDbAfterWrite"
+CONF_SYNC_MODE = "dbSyncMode"
 CONF_FORCE_DB_PARAMS = "forceDbParams"
 
 
@@ -60,6 +61,18 @@ def defineSettings():
                 "Copy the output database from the fast scratch space to the shared network drive after each write."
             ),
         ),
+        setting.Setting(
+            CONF_SYNC_MODE,
+            default="copy",
+            label="Database Sync Mode",
+            description=(
+                "How the output database is synced to the shared network drive after each write. `copy` copies "
+                "the whole file, while `incremental` only adds the groups written since the last sync to the "
+                "shared copy, so the cost of a sync scales with the new data rather than the size of the file. "
+                "The shared copy is updated in place, so it must not be held open by readers during a sync."
+            ),
+            options=["copy", "incremental"],
+        ),
         setting.Setting(
             CONF_FORCE_DB_PARAMS,
             default=[],
@@ -56,6 +56,7 @@ CONF_CYCLES = "cycles"
 CONF_CYCLES_SKIP_TIGHT_COUPLING_INTERACTION = "cyclesSkipTightCouplingInteraction"
 CONF_DEBUG_MEM = "debugMem"
 CONF_DEBUG_MEM_SIZE = "debugMemSize"
+CONF_DEBUG_MEM_TRACE_DEPTH = "debugMemTraceDepth"
 CONF_DECAY_CONSTANTS = "decayConstants"
 CONF_DEFAULT_SNAPSHOTS = "defaultSnapshots"
 CONF_DEFERRED_INTERFACE_NAMES = "deferredInterfaceNames"
@@ -64,14 +65,17 @@ CONF_DETAIL_ALL_ASSEMS = "detailAllAssems"
 CONF_DETAIL_ASSEM_LOCATIONS_BOL = "detailAssemLocationsBOL"
 CONF_DETAIL_ASSEM_NUMS = "detailAssemNums"
 CONF_DETAILED_AXIAL_EXPANSION = "detailedAxialExpansion"
+CONF_DISTRIBUTE_STATE_MODE = "distributeStateMode"
 CONF_DUMP_SNAPSHOT = "dumpSnapshot"
 CONF_EQ_DIRECT = "eqDirect"  # fuelCycle/equilibrium coupling
 CONF_EXPLICIT_REPEAT_SHUFFLES = "explicitRepeatShuffles"
 CONF_FLUX_RECON = "fluxRecon"  # strange coupling in fuel handlers
 CONF_FRESH_FEED_TYPE = "freshFeedType"
 CONF_GROW_TO_FULL_CORE_AFTER_LOAD = "growToFullCoreAfterLoad"
+CONF_HISTORY_STORE = "historyStore"
 CONF_INDEPENDENT_VARIABLES = "independentVariables"
 CONF_INITIALIZE_BURN_CHAIN = "initializeBurnChain"
+CONF_INPUT_CACHE = "inputCache"
 CONF_INPUT_HEIGHTS_HOT = "inputHeightsConsideredHot"
 CONF_LOAD_STYLE = "loadStyle"
 CONF_LOADING_FILE = "loadingFile"
@@ -223,6 +227,16 @@ def defineSettings() -> List[setting.Setting]:
                 "be thermally expanded as appropriate."
             ),
         ),
+        setting.Setting(
+            CONF_INPUT_CACHE,
+            default=False,
+            label="Cache Parsed Inputs",
+            description=(
+                "Keep the parsed settings and blueprints of this case in a local on-disk cache, keyed "
+                "by the input text and the ARMI version and plugins, so that later loads of the same "
+                "inputs (e.g. the cases of a suite) skip the YAML parsing."
+            ),
+        ),
         setting.Setting(
             CONF_AUTOMATIC_VARIABLE_MESH,
             default=False,
@@ -241,7 +255,8 @@ def defineSettings() -> List[setting.Setting]:
             default=False,
             label="Turn On the Profiler",
             description="Turn on the profiler for the submitted case. The profiler "
-            "results will not include all import times.",
+            "results will not include all import times. The timer trees are also written as a Chrome "
+            "trace and a speedscope file at the end of the run.",
             isEnvironment=True,
             oldNames=[
                 ("turnOnProfiler", None),
@@ -473,12 +488,35 @@ def defineSettings() -> List[setting.Setting]:
             label="Debug Memory Size",
             description="Show size of objects during memory debugging",
         ),
+        setting.Setting(
+            CONF_DEBUG_MEM_TRACE_DEPTH,
+            default=0,
+            label="Debug Memory Trace Depth",
+            description="Number of stack frames tracemalloc keeps per allocation when profiling memory. "
+            "Zero turns tracing off. When on, tracing starts with the operator, before the reactor is built, "
+            "and every rank reports its traced memory by ARMI subsystem and "
+            "its largest allocation growths since the previous time node, instead of the much slower "
+            f"object walk of {CONF_DEBUG_MEM}. Deeper stacks attribute more allocations, at a higher cost.",
+            schema=vol.All(vol.Coerce(int), vol.Range(min=0)),
+        ),
         setting.Setting(
             CONF_DEFAULT_SNAPSHOTS,
             default=False,
             label="Basic Reactor Snapshots",
             description="Generate snapshots at BOL, MOL, and EOL.",
         ),
+        setting.Setting(
+            CONF_DISTRIBUTE_STATE_MODE,
+            default="pickle",
+            label="Distribute State Mode",
+            description="How the reactor is sent to the other MPI processes. `pickle` broadcasts the "
+            "pickled reactor. `structured` broadcasts the reactor in the compact form of the database, "
+            "and rebuilds it on each process. That sends several times less data, which pays off at large "
+            "process counts, but is slower to write and rebuild. It does not reduce the memory of each "
+            "process: every process still holds its own reactor and cross section library. Only the state "
+            "held in parameters is sent; use `pickle` if the workers need other state of the composites.",
+            options=["pickle", "structured"],
+        ),
         setting.Setting(
             CONF_DETAIL_ALL_ASSEMS,
             default=False,
@@ -546,6 +584,15 @@ def defineSettings() -> List[setting.Setting]:
             "symmetric snapshot. Note: This is needed when a full core model is needed "
             "and the database was produced using a third core model.",
         ),
+        setting.Setting(
+            CONF_HISTORY_STORE,
+            default="database",
+            label="Detail Assembly History Store",
+            description="Where the history tracker gets the histories of the detail assemblies from. "
+            "`database` reads them from the database. `memory` copies the tracked parameters from the "
+            "reactor into arrays at every time node, which is much faster for many detail assemblies.",
+            options=["database", "memory"],
+        ),
         setting.Setting(
             CONF_START_CYCLE,
             default=0,
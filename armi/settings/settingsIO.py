@@ -19,6 +19,7 @@
 
 import collections
 import datetime
+import io
 import os
 import sys
 from typing import Dict, Set, Tuple
@@ -29,6 +30,7 @@ from ruamel.yaml import YAML
 from armi import context, runLog
 from armi.meta import __version__ as version
 from armi.settings.setting import Setting
+from armi.utils import inputCache
 from armi.utils.customExceptions import (
     InvalidSettingsFileError,
     InvalidSettingsStopProcess,
@@ -144,6 +146,8 @@ class SettingsReader:
         The settings object to read into
     """
 
+    _CACHE_KIND = "settings"
+
     def __init__(self, cs):
         self.cs = cs
         self.inputPath = "<stream>"
@@ -166,15 +170,38 @@ class SettingsReader:
         return f"<{self.__class__.__name__} {self.inputPath}>"
 
     def readFromFile(self, path, handleInvalids=True):
-        """Load file and read it."""
+        """
+        Load file and read it.
+
+        If the parsed settings of a file with the same text are in the :py:mod:`input cache
+        <armi.utils.inputCache>`, they are applied without parsing the file. The parsed settings of
+        a file are cached when it turns on the ``inputCache`` setting and has no invalid settings.
+        """
+        from armi.settings.fwSettings.globalSettings import CONF_INPUT_CACHE
+
         with open(path, "r") as f:
             ext = os.path.splitext(path)[1].lower()
             assert ext.lower() in (".yaml", ".yml"), f"{ext} is the wrong extension"
             self.inputPath = path
-            try:
-                self.readFromStream(f, handleInvalids)
-            except Exception as ee:
-                raise InvalidSettingsFileError(path, str(ee))
+            text = f.read()
+
+        try:
+            cached = inputCache.retrieve(self._CACHE_KIND, text)
+            if cached is not None:
+                self.inputVersion, caseSettings = cached
+            else:
+                caseSettings = self._parseYaml(io.StringIO(text))
+
+            for settingName, settingVal in caseSettings.items():
+                self._applySettings(settingName, settingVal)
+
+            if handleInvalids:
+                self._checkInvalidSettings()
+        except Exception as ee:
+            raise InvalidSettingsFileError(path, str(ee))
+
+        if cached is None and not self.invalidSettings and self.cs[CONF_INPUT_CACHE]:
+            inputCache.store(self._CACHE_KIND, text, (self.inputVersion, caseSettings))
 
     def readFromStream(self, stream, handleInvalids=True):
         """Read from a file-like stream."""
@@ -184,6 +211,11 @@ class SettingsReader:
 
     def _readYaml(self, stream):
         """Read settings from a YAML stream."""
+        for settingName, settingVal in self._parseYaml(stream).items():
+            self._applySettings(settingName, settingVal)
+
+    def _parseYaml(self, stream):
+        """Parse the settings in a YAML stream, and the version of ARMI they were written with."""
         from armi.physics.thermalHydraulics import const  # avoid circular import
         from armi.settings.fwSettings.globalSettings import CONF_VERSIONS
 
@@ -207,8 +239,7 @@ class SettingsReader:
             runLog.warning("Versions setting section not found. Continuing with uncontrolled versions.")
             self.inputVersion = "uncontrolled"
 
-        for settingName, settingVal in caseSettings.items():
-            self._applySettings(settingName, settingVal)
+        return caseSettings
 
     def _checkInvalidSettings(self):
         if not self.invalidSettings:
@@ -47,22 +47,24 @@ class BufferLog(runLog._RunLog):
     def __exit__(self, exception_type, exception_value, traceback):
         runLog.LOG = self.originalLog
 
-    def log(self, msgType, msg, single=False, label=None):
+    def log(self, msgType, msg, *args, single=False, label=None):
         """
         Add formatting to a message and handle its singleness, if applicable.
 
         This is a wrapper around logger.log() that does most of the work and is
         used by all message passers (e.g. info, warning, etc.).
         """
-        # the message label is only used to determine unique for single-print warnings
-        if label is None:
-            label = msg
-
         # Skip writing the message if it is below the set verbosity
         msgVerbosity = self.logLevels[msgType][0]
         if msgVerbosity < self._verbosity:
             return
 
+        msg = self.resolveMessage(msg, args)
+
+        # the message label is only used to determine unique for single-print warnings
+        if label is None:
+            label = msg
+
         # Skip writing the message if it is single-print warning
         record = LogRecord("BufferLog", msgVerbosity, "pathname", 1, msg, {}, ())
         record.label = label
@@ -30,6 +30,8 @@ import shutil
 import unittest
 from unittest.mock import patch
 
+import numpy as np
+
 from armi import context, mpiActions, settings
 from armi.interfaces import Interface
 from armi.mpiActions import DistributeStateAction
@@ -244,6 +246,23 @@ class MpiDistributeStateTests(unittest.TestCase):
             self.assertNotEqual(original_reactor, self.action.r)
         self.assertIsNone(self.action.r.core.lib)
 
+    @unittest.skipIf(context.MPI_SIZE <= 1 or MPI_EXE is None, "Parallel test only")
+    def test_distributeReactorStructured(self):
+        """The reactor can be sent as a database image and rebuilt on the workers."""
+        cs = self.cs.modified(newSettings={"distributeStateMode": "structured"})
+        original_reactor = self.action.r
+        # a parameter that is not saved to the database, only set on the primary
+        if context.MPI_RANK == 0:
+            original_reactor.core.getFirstBlock().p.lastMgFlux = np.arange(33, dtype=float)
+        self.action._distributeReactor(cs)
+        if context.MPI_RANK == 0:
+            self.assertIs(original_reactor, self.action.r)
+        else:
+            self.assertIsNot(original_reactor, self.action.r)
+        self.assertEqual(len(original_reactor.core), len(self.action.r.core))
+        self.assertIs(self.action.r.o, self.o)
+        np.testing.assert_array_equal(self.action.r.core.getFirstBlock().p.lastMgFlux, np.arange(33, dtype=float))
+
     @unittest.skipIf(context.MPI_SIZE <= 1 or MPI_EXE is None, "Parallel test only")
     def test_distributeInterfaces(self):
         """Under normal circumstances, we would not test "private" methods;
@@ -97,6 +97,87 @@ class TestRunLog(unittest.TestCase):
         self.assertIn("Hello", streamVal, msg=streamVal)
         self.assertIn("world", streamVal, msg=streamVal)
 
+    def test_lazyMessages(self):
+        """Messages below the verbosity are not built, and the others are built from their args."""
+        log = runLog.LOG = runLog._RunLog(0)
+        log.startLog("test_lazyMessages")
+        log.setVerbosity(logging.INFO)
+        stream = StringIO()
+        log.logger.handlers = [logging.StreamHandler(stream)]
+
+        calls = []
+
+        def buildMessage():
+            calls.append(1)
+            return "built lazily"
+
+        runLog.debug(buildMessage)
+        runLog.debug("%s %d", "invisible", 1)
+        self.assertEqual(calls, [])
+        runLog.info(buildMessage)
+        runLog.warning("%s number %d", "warning", 2, single=True)
+        runLog.warning("%s number %d", "warning", 2, single=True)
+        runLog.close(99)
+
+        streamVal = stream.getvalue()
+        self.assertEqual(calls, [1])
+        self.assertIn("built lazily", streamVal, msg=streamVal)
+        self.assertEqual(streamVal.count("warning number 2"), 1, msg=streamVal)
+        self.assertNotIn("invisible", streamVal, msg=streamVal)
+
+    def test_legacyPositionalArgs(self):
+        """The old positional single and label still work, with a deprecation warning."""
+        log = runLog.LOG = runLog._RunLog(0)
+        log.startLog("test_legacyPositionalArgs")
+        log.setVerbosity(logging.INFO)
+        stream = StringIO()
+        log.logger.handlers = [logging.StreamHandler(stream)]
+
+        for _ in range(2):
+            with self.assertWarns(DeprecationWarning):
+                runLog.warning("legacy single", True)
+            with self.assertWarns(DeprecationWarning):
+                runLog.warning("legacy label", True, "legacyLabel")
+            # a literal % in the message does not stop the old arguments from being recognized
+            with self.assertWarns(DeprecationWarning):
+                runLog.warning("10% burnup", True)
+        runLog.warning("flag is %s", "on")
+        runLog.close(99)
+
+        streamVal = stream.getvalue()
+        self.assertEqual(streamVal.count("legacy single"), 1, msg=streamVal)
+        self.assertEqual(streamVal.count("legacy label"), 1, msg=streamVal)
+        self.assertEqual(streamVal.count("10% burnup"), 1, msg=streamVal)
+        self.assertIn("flag is on", streamVal, msg=streamVal)
+
+    def test_bufferedFileHandler(self):
+        """Worker log records are written in batches, and all of them by the time the log closes."""
+        with TemporaryDirectoryChanger():
+            logPath = "test_bufferedFileHandler.stdout"
+            handler = runLog.BufferedFileHandler(logPath, capacity=3)
+            handler.setFormatter(logging.Formatter("%(message)s"))
+            logger = logging.Logger("test_bufferedFileHandler")
+            logger.addHandler(handler)
+
+            logger.info("first")
+            logger.info("second")
+            self.assertFalse(os.path.exists(logPath))
+            logger.info("third")
+            with open(logPath) as f:
+                self.assertEqual(f.read().split(), ["first", "second", "third"])
+
+            # warnings are written right away, in case the process is killed
+            logger.info("fourth")
+            logger.warning("fifth")
+            logger.info("sixth")
+            with open(logPath) as f:
+                self.assertEqual(f.read().split()[-1], "fifth")
+
+            handler.close()
+            with open(logPath) as f:
+                self.assertEqual(f.read().split()[-1], "sixth")
+            self.assertTrue(handler.target is None or handler.target.stream is None)
+
     def test_getWhiteSpace(self):
         log = runLog._RunLog(0)
         space0 = len(log.getWhiteSpace(0))
@@ -11,13 +11,27 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-"""Utilities related to profiling code."""
+"""
+Utilities related to profiling code.
+
+The :py:class:`MasterTimer` keeps two views of the timers. The flat view has one :py:class:`_Timer` per name,
+no matter where it was started from; it backs :py:meth:`MasterTimer.report` and :py:meth:`MasterTimer.timeline`.
+The tree view follows the call stack of the ``@timed`` functions and ``with timer:`` blocks, separately for each
+thread, so nested timers are not double counted: each node has an inclusive time, and an exclusive time that leaves
+out its children. The trees of all MPI ranks can be gathered and exported as a Chrome trace
+(``chrome://tracing``, Perfetto) or as a speedscope profile (https://www.speedscope.app).
+"""
 
 import copy
 import functools
+import json
 import os
+import threading
 import time
 
+MAX_TRACE_EVENTS = 100000
+"""The most timer events a process keeps for the Chrome trace. The timer trees are always complete."""
+
 
 def timed(*args):
     """
@@ -47,11 +61,14 @@ def timed(*args):
                 ]
             )
 
-            MasterTimer.startTimer(label or generated_name)
-            return_value = func(*args, **kwargs)
-            MasterTimer.endTimer(label or generated_name)
-
-            return return_value
+            name = label or generated_name
+            MasterTimer.startTimer(name)
+            MasterTimer.enterNode(name)
+            try:
+                return func(*args, **kwargs)
+            finally:
+                MasterTimer.exitNode(name)
+                MasterTimer.endTimer(name)
 
         return time_wrapper
 
@@ -81,6 +98,11 @@ class MasterTimer:
         self.start_time = time.time()
         self.end_time = None
 
+        # the tree view of the timers: a root node and a stack of open (node, startTime) per thread
+        self.trees = {}
+        self.events = []
+        self._stacks = {}
+
     @staticmethod
     def getMasterTimer():
         """Primary method that users need get access to the MasterTimer singleton."""
@@ -136,6 +158,59 @@ class MasterTimer:
             master.timers[eventName] = timer
         return timer
 
+    def _getStack(self):
+        """Return the stack of open timer nodes of the current thread."""
+        threadId = threading.get_ident()
+        stack = self._stacks.get(threadId)
+        if stack is None:
+            threadName = threading.current_thread().name
+            root = self.trees.setdefault(threadName, _TimerNode(threadName))
+            stack = self._stacks[threadId] = [(root, 0.0)]
+        return stack
+
+    @staticmethod
+    def enterNode(eventName):
+        """Open a node of the timer tree of this thread, under the innermost node that is open."""
+        if _Timer._frozen:
+            return
+
+        stack = MasterTimer.getMasterTimer()._getStack()
+        parent = stack[-1][0]
+        node = parent.children.get(eventName)
+        if node is None:
+            node = parent.children[eventName] = _TimerNode(eventName)
+        stack.append((node, MasterTimer.time()))
+
+    @staticmethod
+    def exitNode(eventName):
+        """
+        Close the innermost open node of the timer tree of this thread with the given name.
+
+        Nodes that were opened inside of it and are still open are closed too, so an exception that skips an
+        ``exitNode`` call does not corrupt the tree. A name that is not open is ignored.
+        """
+        if _Timer._frozen:
+            return
+
+        master = MasterTimer.getMasterTimer()
+        stack = master._getStack()
+        for depth in range(len(stack) - 1, 0, -1):
+            if stack[depth][0].name == eventName:
+                break
+        else:
+            return
+
+        master._closeNodes(stack, depth, MasterTimer.time(), threading.current_thread().name)
+
+    def _closeNodes(self, stack, depth, curTime, threadName):
+        """Close the open nodes of a stack, down to and including the given depth."""
+        while len(stack) > depth:
+            node, startTime = stack.pop()
+            node.time += curTime - startTime
+            node.count += 1
+            if len(self.events) < MAX_TRACE_EVENTS:
+                self.events.append((threadName, node.name, startTime, curTime))
+
     @staticmethod
     def time():
         """System time offset by when this master timer was initialized."""
@@ -163,6 +238,10 @@ class MasterTimer:
             timer.overStart = 0  # deal with what recursion may have caused
             timer.stop()
 
+        curTime = MasterTimer.time()
+        for stack in master._stacks.values():
+            master._closeNodes(stack, 1, curTime, stack[0][0].name)
+
         _Timer._frozen = True
 
         master.end_time = time.time()
@@ -230,6 +309,152 @@ class MasterTimer:
         table.append(str(master))
         return "\n".join(table)
 
+    @staticmethod
+    def toDict():
+        """
+        Return the timer trees and trace events of this process as plain data.
+
+        This is what gets gathered from each MPI rank, so it has to be cheap to pickle.
+        """
+        master = MasterTimer.getMasterTimer()
+        return {
+            "trees": {threadName: root.toDict() for threadName, root in master.trees.items()},
+            "events": list(master.events),
+        }
+
+    @staticmethod
+    def treeReport(inclusionCutoff=0.01, timerData=None):
+        """
+        Write a string report of the timer trees, with the inclusive and exclusive time of each node.
+
+        Parameters
+        ----------
+        inclusionCutoff : float, optional
+            Will not show nodes (and their children) that have less than this fraction of the total time.
+        timerData : list of dict, optional
+            The ``toDict()`` of each MPI rank, in rank order. Defaults to the timers of this process.
+
+        Returns
+        -------
+        str : Plain-text table report on the timer trees.
+        """
+        timerData = timerData if timerData is not None else [MasterTimer.toDict()]
+        totalTime = MasterTimer.time()
+        table = [
+            "{:55s} {:^15} {:^15} {:9}".format("TIMER TREE", "INCLUSIVE (s)", "EXCLUSIVE (s)", "NUM ITERS".rjust(9))
+        ]
+
+        def addNode(node, depth):
+            if totalTime > 0.0 and node["time"] / totalTime < inclusionCutoff:
+                return
+            label = "{}{}".format("  " * depth, node["name"])[:55]
+            exclusive = node["time"] - sum(child["time"] for child in node["children"])
+            table.append("{:55s} {:>14.2f} {:>14.2f} {:11}".format(label, node["time"], exclusive, node["count"]))
+            for child in sorted(node["children"], key=lambda c: c["time"], reverse=True):
+                addNode(child, depth + 1)
+
+        for rank, data in enumerate(timerData):
+            for threadName, root in data["trees"].items():
+                table.append("rank {} thread {}".format(rank, threadName))
+                for child in sorted(root["children"], key=lambda c: c["time"], reverse=True):
+                    addNode(child, 1)
+
+        return "\n".join(table)
+
+    @staticmethod
+    def writeChromeTrace(fileName, timerData=None):
+        """
+        Write the timer events as a Chrome trace, which can be opened in ``chrome://tracing`` or Perfetto.
+
+        Each MPI rank is shown as a process and each thread as a track. Only the first ``MAX_TRACE_EVENTS`` events
+        of each process are kept.
+
+        Parameters
+        ----------
+        fileName : str
+            Path of the JSON file to write.
+        timerData : list of dict, optional
+            The ``toDict()`` of each MPI rank, in rank order. Defaults to the timers of this process.
+        """
+        timerData = timerData if timerData is not None else [MasterTimer.toDict()]
+        traceEvents = []
+        for rank, data in enumerate(timerData):
+            traceEvents.append({"name": "process_name", "ph": "M", "pid": rank, "args": {"name": f"rank {rank}"}})
+            for threadName, name, startTime, endTime in data["events"]:
+                traceEvents.append(
+                    {
+                        "name": name,
+                        "ph": "X",
+                        "ts": startTime * 1e6,
+                        "dur": (endTime - startTime) * 1e6,
+                        "pid": rank,
+                        "tid": threadName,
+                    }
+                )
+
+        with open(fileName, "w") as f:
+            json.dump({"traceEvents": traceEvents, "displayTimeUnit": "ms"}, f)
+
+    @staticmethod
+    def writeSpeedscope(fileName, timerData=None):
+        """
+        Write the timer trees as a speedscope profile, with one profile per MPI rank and thread.
+
+        The trees are written as stacks weighted by their exclusive time, so they are complete even when the
+        Chrome trace had to drop events.
+
+        Parameters
+        ----------
+        fileName : str
+            Path of the JSON file to write.
+        timerData : list of dict, optional
+            The ``toDict()`` of each MPI rank, in rank order. Defaults to the timers of this process.
+        """
+        timerData = timerData if timerData is not None else [MasterTimer.toDict()]
+        frames = []
+        frameIndices = {}
+        profiles = []
+
+        def addStacks(node, stack, samples, weights):
+            if node["name"] not in frameIndices:
+                frameIndices[node["name"]] = len(frames)
+                frames.append({"name": node["name"]})
+            stack = stack + [frameIndices[node["name"]]]
+            exclusive = node["time"] - sum(child["time"] for child in node["children"])
+            if exclusive > 0.0:
+                samples.append(stack)
+                weights.append(exclusive)
+            for child in node["children"]:
+                addStacks(child, stack, samples, weights)
+
+        for rank, data in enumerate(timerData):
+            for threadName, root in data["trees"].items():
+                samples, weights = [], []
+                for child in root["children"]:
+                    addStacks(child, [], samples, weights)
+                profiles.append(
+                    {
+                        "type": "sampled",
+                        "name": f"rank {rank} thread {threadName}",
+                        "unit": "seconds",
+                        "startValue": 0.0,
+                        "endValue": sum(weights),
+                        "samples": samples,
+                        "weights": weights,
+                    }
+                )
+
+        with open(fileName, "w") as f:
+            json.dump(
+                {
+                    "$schema": "https://www.speedscope.app/file-format-schema.json",
+                    "shared": {"frames": frames},
+                    "profiles": profiles,
+                    "exporter": "armi",
+                },
+                f,
+            )
+
     @staticmethod
     def timeline(baseFileName, inclusionCutoff=0.1, totalTime=False):
         """Produces a timeline graphic of the timers.
@@ -354,8 +579,10 @@ class _Timer:
 
     def __enter__(self):
         self.start()
+        MasterTimer.enterNode(self.name)
 
     def __exit__(self, *args, **kwargs):
+        MasterTimer.exitNode(self.name)
         self.stop()
 
     @property
@@ -435,3 +662,29 @@ class _Timer:
             self._closeTimePair(curTime)
 
         return curTime
+
+
+class _TimerNode:
+    """A node of a timer tree: the time spent in a timer when it was opened under the timers of its parents."""
+
+    __slots__ = ("name", "children", "time", "count")
+
+    def __init__(self, name):
+        self.name = name
+        self.children = {}
+        self.time = 0.0  # inclusive of the children
+        self.count = 0
+
+    def __repr__(self):
+        return "<{} name:'{}' count:{} time:{}>".format(self.__class__.__name__, self.name, self.count, self.time)
+
+    @property
+    def exclusiveTime(self):
+        """Time spent in this node, but not in any of its children."""
+        return self.time - sum(child.time for child in self.children.values())
+
+    def toDict(self):
+        children = [child.toDict() for child in self.children.values()]
+        # the root of a thread is never opened, so it takes the time of its children
+        nodeTime = self.time if self.count else sum(child["time"] for child in children)
+        return {"name": self.name, "time": nodeTime, "count": self.count, "children": children}
@@ -165,6 +165,10 @@ class Flag(metaclass=_FlagMeta):
     def __setstate__(self, state: int):
         self._value = state
 
+    def __deepcopy__(self, memo):
+        """Flags are immutable values, so a deepcopy can safely share this instance."""
+        return self
+
     @classmethod
     def _registerField(cls, name, value):
         """
@@ -0,0 +1,146 @@
+# Copyright 2026 TerraPower, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+A local, on-disk cache of parsed inputs.
+
+Every case start parses its settings and blueprints YAML, and a suite of cases built from nearly
+identical inputs parses the same text over and over. This cache stores the parsed objects in a
+pickle, keyed by a hash of the input text and of the ARMI version, Python version, and registered
+plugins, so that the next load of the same text can skip the YAML parsing.
+
+API usage
+---------
+Retrieving a parsed input::
+
+    bp = inputCache.retrieve("blueprints", text)
+    if bp is None:
+        bp = Blueprints.load(text)
+        inputCache.store("blueprints", text, bp)
+
+Notes
+-----
+The cache is only as good as its key: anything that changes how an input is parsed, other than the
+input text, the ARMI version, and the set of plugins, will not be noticed. Entries that cannot be
+read are deleted and treated as misses. Use :py:func:`clear` to empty the cache.
+"""
+
+import hashlib
+import os
+import pickle
+import shutil
+import sys
+import tempfile
+
+from armi import context, runLog
+from armi.meta import __version__ as version
+
+CACHE_DIR_NAME = "inputCache"
+
+
+def getDefaultCacheDir():
+    """Return the default folder of the input cache, in the ARMI application data folder."""
+    return os.path.join(context.APP_DATA, CACHE_DIR_NAME)
+
+
+def getFingerprint():
+    """
+    Return a string that identifies the code that parses inputs.
+
+    This is the ARMI version, the Python version, and the names of the registered plugins.
+    """
+    from armi import getPluginManager
+
+    pm = getPluginManager()
+    plugins = sorted(name for name, _plugin in pm.list_name_plugin()) if pm is not None else []
+    return "|".join([version, sys.version, ",".join(plugins)])
+
+
+def getKey(kind, text):
+    """Return the key of an input of some kind (e.g. "blueprints") with some text."""
+    keyHash = hashlib.sha256()
+    for part in (kind, getFingerprint(), text):
+        keyHash.update(part.encode("utf-8"))
+        keyHash.update(b"\0")
+    return keyHash.hexdigest()
+
+
+def _getEntryPath(kind, text, cacheDir):
+    return os.path.join(cacheDir or getDefaultCacheDir(), kind, getKey(kind, text) + ".pkl")
+
+
+def retrieve(kind, text, cacheDir=None):
+    """
+    Get the parsed input of some kind with some text from the cache.
+
+    Returns
+    -------
+    object or None
+        The cached object, or None if there is no usable entry for the text.
+    """
+    path = _getEntryPath(kind, text, cacheDir)
+    if not os.path.exists(path):
+        return None
+
+    try:
+        with open(path, "rb") as f:
+            obj = pickle.load(f)
+    except Exception as ee:
+        runLog.warning(f"Could not read the cached {kind} input in {path}, deleting it: {ee}")
+        try:
+            os.remove(path)
+        except OSError as e:
+            runLog.debug(e)
+        return None
+
+    runLog.debug(f"Retrieved cached {kind} input from {path}")
+    return obj
+
+
+def store(kind, text, obj, cacheDir=None):
+    """
+    Store the parsed input of some kind with some text in the cache.
+
+    The entry is written to a temporary file first, and moved into place, so that concurrent cases
+    never see a partly written entry.
+
+    Returns
+    -------
+    bool
+        Whether the object was stored. Objects that cannot be pickled are not.
+    """
+    path = _getEntryPath(kind, text, cacheDir)
+    folder = os.path.dirname(path)
+    tmpPath = None
+    try:
+        os.makedirs(folder, exist_ok=True)
+        with tempfile.NamedTemporaryFile("wb", dir=folder, suffix=".tmp", delete=False) as f:
+            tmpPath = f.name
+            pickle.dump(obj, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmpPath, path)
+    except Exception as ee:
+        runLog.warning(f"Could not cache the {kind} input in {path}: {ee}")
+        if tmpPath is not None and os.path.exists(tmpPath):
+            os.remove(tmpPath)
+        return False
+
+    runLog.debug(f"Cached {kind} input in {path}")
+    return True
+
+
+def clear(cacheDir=None):
+    """Delete all entries of the input cache."""
+    cacheDir = cacheDir or getDefaultCacheDir()
+    if os.path.isdir(cacheDir):
+        shutil.rmtree(cacheDir)
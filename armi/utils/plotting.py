@@ -24,17 +24,23 @@ generating.
 """
 
 import collections
+import functools
 import itertools
 import math
 import os
 import re
+import weakref
 
 import matplotlib.colors as mcolors
 import matplotlib.patches
 import matplotlib.pyplot as plt
 import matplotlib.text as mpl_text
 import numpy as np
-from matplotlib.collections import PatchCollection
+from matplotlib.collections import PatchCollection, PathCollection, PolyCollection
+from matplotlib.font_manager import FontProperties
+from matplotlib.path import Path
+from matplotlib.textpath import text_to_path
+from matplotlib.transforms import Affine2D
 from matplotlib.widgets import Slider
 from mpl_toolkits import axes_grid1
 from ordered_set import OrderedSet
@@ -50,6 +56,10 @@ from armi.utils import hexagon
 
 LUMINANCE_WEIGHTS = np.array([0.3, 0.59, 0.11, 0.0])
 
+# assembly polygon vertices, by core geometry. See _getAssemVertices.
+_ASSEM_VERTICES = collections.OrderedDict()
+_ASSEM_VERTICES_MAX = 8
+
 
 def colorGenerator(skippedColors=10):
     """
@@ -92,6 +102,7 @@ def plotBlockDepthMap(
     shuffleArrows=False,
     titleSize=25,
     depthIndex=0,
+    vectorized=False,
 ):
     """
     Plot a param distribution in xy space with the ability to page through depth.
@@ -109,6 +120,8 @@ def plotBlockDepthMap(
     depthIndex: int
         The the index of the elevation to show block params.
         The index is determined by the index of the blocks in the first fuel assembly.
+    vectorized: bool, optional
+        If True, draw the assemblies and labels as collections. See ``plotFaceMap``.
     """
     fuelAssem = core.getFirstAssembly(typeSpec=Flags.FUEL)
     if not fuelAssem:
@@ -131,8 +144,12 @@ def plotBlockDepthMap(
 
     fig = plt.figure(figsize=(12, 12), dpi=100)
     # Make these now, so they are still referenceable after plotFaceMap.
-    patches = _makeAssemPatches(core)
-    collection = PatchCollection(patches, cmap=cmapName, alpha=1.0)
+    if vectorized:
+        patches = _getAssemVertices(core)
+        collection = PolyCollection(patches, cmap=cmapName, alpha=1.0)
+    else:
+        patches = _makeAssemPatches(core)
+        collection = PatchCollection(patches, cmap=cmapName, alpha=1.0)
     texts = []
 
     plotFaceMap(
@@ -155,6 +172,7 @@ def plotBlockDepthMap(
         shuffleArrows=shuffleArrows,
         titleSize=titleSize,
         referencesToKeep=[patches, collection, texts],
+        vectorized=vectorized,
     )
 
     # make space for the slider
@@ -167,8 +185,13 @@ def plotBlockDepthMap(
         # int, since we are indexing an array.
         i = int(i)
         collection.set_array(data[i, :])
-        for valToPrint, text in zip(data[i, :], texts):
-            text.set_text(labelFmt.format(valToPrint))
+        if vectorized:
+            for labelCollection in texts:
+                labelText = [labelFmt.format(valToPrint) for valToPrint in data[i, :]]
+                _setLabelPaths(labelCollection, labelText, fontSize)
+        else:
+            for valToPrint, text in zip(data[i, :], texts):
+                text.set_text(labelFmt.format(valToPrint))
 
     # Slider doesn't seem to work unless assigned to variable
     _slider = DepthSlider(ax_slider, "Depth(cm)", elevations, update, "green", valInit=depthIndex)
@@ -203,6 +226,7 @@ def plotFaceMap(
     shuffleArrows=False,
     titleSize=25,
     referencesToKeep=None,
+    vectorized=False,
 ):
     """
     Plot a face map of the core.
@@ -283,6 +307,12 @@ def plotFaceMap(
     referencesToKeep : list, optional
         References to previous plots you might want to plot on: patches, collection, texts.
 
+    vectorized : bool, optional
+        If True, draw all of the assemblies as one ``PolyCollection``, with vertices computed
+        together from the grid and cached for the core geometry, and all of the labels as one
+        collection of text outlines. This is much faster than making an artist per assembly and
+        per label, which matters when plotting at every time node.
+
     Examples
     --------
     Plotting a BOL assembly type facemap with a legend::
@@ -295,8 +325,12 @@ def plotFaceMap(
     else:
         fig, ax = plt.subplots(figsize=(12, 12), dpi=100)
         # set patch (shapes such as hexagon) heat map values
-        patches = _makeAssemPatches(core)
-        collection = PatchCollection(patches, cmap=cmapName, alpha=1.0)
+        if vectorized:
+            patches = _getAssemVertices(core)
+            collection = PolyCollection(patches, cmap=cmapName, alpha=1.0)
+        else:
+            patches = _makeAssemPatches(core)
+            collection = PatchCollection(patches, cmap=cmapName, alpha=1.0)
         texts = []
 
     ax.set_title(title, size=titleSize)
@@ -331,11 +365,17 @@ def plotFaceMap(
 
     # Makes text in the center of each shape displaying the values.
     # (The text is either black or white depending on the background color it is written on)
-    _setPlotValText(ax, texts, core, data, labels, labelFmt, fontSize, collection)
+    if vectorized:
+        _setPlotValLabels(ax, texts, patches, data, labels, labelFmt, fontSize, collection)
+    else:
+        _setPlotValText(ax, texts, core, data, labels, labelFmt, fontSize, collection)
 
     # allow a color bar option
     if makeColorBar:
-        collection2 = PatchCollection(patches, cmap=cmapName, alpha=1.0)
+        if vectorized:
+            collection2 = PolyCollection(patches, cmap=cmapName, alpha=1.0)
+        else:
+            collection2 = PatchCollection(patches, cmap=cmapName, alpha=1.0)
         if minScale and maxScale:
             collection2.set_array(np.array([minScale, maxScale]))
         else:
@@ -491,6 +531,120 @@ def _setPlotValText(ax, texts, core, data, labels, labelFmt, fontSize, collectio
         texts.append(text)
 
 
+def _getAssemVertices(core):
+    """
+    Return the vertices of the assembly shaped polygon of each assembly.
+
+    This is the vectorized :py:func:`_makeAssemPatches`. The vertices of all assemblies are
+    computed together from the grid, and are cached by core geometry, so plotting the same core
+    again (e.g. at every time node) reuses them.
+
+    Returns
+    -------
+    np.ndarray
+        The vertices of each assembly, with shape ``(nAssems, nSides, 2)``, in core order.
+    """
+    grid = core.spatialGrid
+    if isinstance(grid, grids.HexGrid):
+        nSides = 6
+    elif isinstance(grid, grids.ThetaRZGrid):
+        raise TypeError("This plot function is not currently supported for ThetaRZGrid grids.")
+    else:
+        nSides = 4
+
+    # the key is cheap to build: the grid, its pitch, and the indices of the assemblies in it
+    pitch = core.getAssemblyPitch()
+    ijk = tuple((loc.i, loc.j, loc.k) for loc in (a.spatialLocator for a in core))
+    key = (id(grid), np.asarray(pitch, dtype=float).tobytes(), ijk)
+    cached = _ASSEM_VERTICES.get(key)
+    # the grid is held weakly, so that the cache does not keep the core alive, and a new grid that
+    # reuses the id of a dead one is a miss
+    if cached is not None and cached[0]() is grid:
+        _ASSEM_VERTICES.move_to_end(key)
+        return cached[1]
+
+    centers = grid.getManyCoordinates(np.array(ijk, dtype=int).reshape(-1, 3))[:, :2]
+    cornersUp = nSides == 6 and grid.cornersUp
+
+    if nSides == 6:
+        # the same vertices as a RegularPolygon with this radius and orientation
+        orientation = 0 if cornersUp else math.pi / 2.0
+        angles = orientation + np.pi / 2.0 + 2.0 * np.pi * np.arange(nSides) / nSides
+        radius = pitch / math.sqrt(3)
+        shape = radius * np.column_stack([np.cos(angles), np.sin(angles)])
+    else:
+        halfPitch = np.asarray(pitch, dtype=float) / 2.0
+        shape = halfPitch * np.array([[-1.0, -1.0], [1.0, -1.0], [1.0, 1.0], [-1.0, 1.0]])
+
+    vertices = centers[:, np.newaxis, :] + shape[np.newaxis, :, :]
+    vertices.flags.writeable = False
+
+    _ASSEM_VERTICES[key] = (weakref.ref(grid), vertices)
+    if len(_ASSEM_VERTICES) > _ASSEM_VERTICES_MAX:
+        _ASSEM_VERTICES.popitem(last=False)
+    return vertices
+
+
+def _setPlotValLabels(ax, texts, vertices, data, labels, labelFmt, fontSize, collection):
+    """
+    Write param values down as one collection of text outlines, and add it to ``texts``.
+
+    This is the batched :py:func:`_setPlotValText`. Instead of a text artist per assembly, the
+    outline of each label is drawn as a path in a single ``PathCollection`` centered on its
+    assembly, so there is one artist to make and draw however large the core is. The outlines are
+    cached by label text, so repeated labels (like assembly types) are only laid out once.
+    """
+    labelText = []
+    for val, label in zip(data, labels):
+        if label is None and labelFmt is not None:
+            labelText.append(labelFmt.format(val))
+        else:
+            # a label of None with a labelFmt of None means no text is wanted
+            labelText.append(label)
+
+    if all(label is None for label in labelText):
+        return
+
+    patchColors = collection.get_cmap()(collection.norm(np.asarray(data, dtype=float)))
+    dark = np.asarray(patchColors).dot(LUMINANCE_WEIGHTS) < 0.5
+    colors = np.where(dark[:, np.newaxis], mcolors.to_rgba("white"), mcolors.to_rgba("black"))
+
+    fig = ax.get_figure()
+    labelCollection = PathCollection(
+        [],
+        offsets=vertices.mean(axis=1),
+        offset_transform=ax.transData,
+        # label paths are in points
+        transform=Affine2D().scale(1.0 / 72.0) + fig.dpi_scale_trans,
+        facecolors=colors,
+        edgecolors="none",
+        linewidths=0,
+        zorder=2,
+    )
+    _setLabelPaths(labelCollection, labelText, fontSize)
+    ax.add_collection(labelCollection, autolim=False)
+    texts.append(labelCollection)
+
+
+def _setLabelPaths(labelCollection, labelText, fontSize):
+    """Set the text of the labels of a collection made by :py:func:`_setPlotValLabels`."""
+    size = FontProperties(size=fontSize).get_size_in_points()
+    labelCollection.set_paths([_getLabelPath(label, size) for label in labelText])
+
+
+@functools.lru_cache(maxsize=4096)
+def _getLabelPath(label, size):
+    """Get the outline of some text, in points, centered on the origin."""
+    if not label:
+        return Path(np.zeros((0, 2)))
+
+    verts, codes = text_to_path.get_text_path(FontProperties(size=size), label)
+    verts = np.asarray(verts, dtype=float) * (size / text_to_path.FONT_SCALE)
+    if len(verts):
+        verts -= (verts.min(axis=0) + verts.max(axis=0)) / 2.0
+    return Path(verts, codes, readonly=True)
+
+
 def _createLegend(legendMap, collection, size=9, shape=Hexagon):
     """Make special legend for the assembly face map plot with assembly counts, and Block Diagrams."""
 
@@ -14,10 +14,14 @@
 
 """Unit tests for code timing."""
 
+import json
+import os
+import threading
 import time
 import unittest
 
 from armi.utils import codeTiming
+from armi.utils.directoryChangers import TemporaryDirectoryChanger
 
 
 class CodeTimingTest(unittest.TestCase):
@@ -204,3 +208,114 @@ class CodeTimingTest(unittest.TestCase):
         self.assertEqual(len(lines), 4)
         self.assertEqual(len(lines[1].strip().split()), 4)
         self.assertEqual(len(lines[2].strip().split()), 4)
+
+    def test_timerTree(self):
+        """Nested timers are attributed to their parents, with inclusive and exclusive times."""
+        master = codeTiming.MasterTimer.getMasterTimer()
+
+        @codeTiming.timed("inner")
+        def inner():
+            time.sleep(0.01)
+
+        with master.getTimer("outer"):
+            time.sleep(0.01)
+            inner()
+            inner()
+        inner()
+
+        root = master.trees[threading.current_thread().name]
+        outer = root.children["outer"]
+        self.assertEqual(outer.count, 1)
+        self.assertEqual(outer.children["inner"].count, 2)
+        self.assertEqual(root.children["inner"].count, 1)
+        self.assertGreaterEqual(outer.time, 0.03)
+        self.assertAlmostEqual(outer.exclusiveTime, outer.time - outer.children["inner"].time)
+        self.assertLess(outer.exclusiveTime, outer.time)
+
+        # the flat view still counts all the calls to inner
+        self.assertEqual(master.timers["inner"].numIterations + 1, 3)
+
+        table = master.treeReport(inclusionCutoff=0.0)
+        self.assertIn("TIMER TREE", table)
+        self.assertIn("  EXCLUSIVE ", table)
+        self.assertIn("    inner", table)
+
+    def test_timerTreeWithException(self):
+        master = codeTiming.MasterTimer.getMasterTimer()
+
+        @codeTiming.timed("failing")
+        def failing():
+            master.enterNode("neverClosed")
+            raise ValueError("oops")
+
+        with self.assertRaises(ValueError):
+            failing()
+
+        # the open child was closed with its parent, so new nodes go back under the root
+        with master.getTimer("after"):
+            pass
+
+        root = master.trees[threading.current_thread().name]
+        self.assertEqual(set(root.children), {"failing", "after"})
+        self.assertEqual(root.children["failing"].children["neverClosed"].count, 1)
+        self.assertFalse(master.timers["failing"].isActive)
+
+    def test_timerTreePerThread(self):
+        master = codeTiming.MasterTimer.getMasterTimer()
+
+        def work():
+            with master.getTimer("threadWork"):
+                time.sleep(0.01)
+
+        thread = threading.Thread(target=work, name="worker")
+        with master.getTimer("mainWork"):
+            thread.start()
+            thread.join()
+
+        self.assertIn("threadWork", master.trees["worker"].children)
+        self.assertNotIn("threadWork", master.trees[threading.current_thread().name].children["mainWork"].children)
+
+    def test_exportTimerTrees(self):
+        master = codeTiming.MasterTimer.getMasterTimer()
+        with master.getTimer("outer"):
+            with master.getTimer("inner"):
+                time.sleep(0.01)
+
+        # pretend there is a second rank, with the same data
+        timerData = [master.toDict(), master.toDict()]
+        with TemporaryDirectoryChanger():
+            master.writeChromeTrace("trace.json", timerData)
+            master.writeSpeedscope("profile.speedscope.json", timerData)
+            self.assertTrue(os.path.exists("trace.json"))
+
+            with open("trace.json") as f:
+                trace = json.load(f)
+            events = [e for e in trace["traceEvents"] if e["ph"] == "X"]
+            self.assertEqual(len(events), 4)
+            self.assertEqual({e["pid"] for e in events}, {0, 1})
+            outer = next(e for e in events if e["name"] == "outer")
+            inner = next(e for e in events if e["name"] == "inner")
+            self.assertLessEqual(outer["ts"], inner["ts"])
+            self.assertGreaterEqual(outer["dur"], inner["dur"])
+
+            with open("profile.speedscope.json") as f:
+                profile = json.load(f)
+            self.assertEqual(len(profile["profiles"]), 2)
+            names = [frame["name"] for frame in profile["shared"]["frames"]]
+            self.assertEqual(names, ["outer", "inner"])
+            samples = profile["profiles"][0]["samples"]
+            self.assertIn([0, 1], samples)
+
+    def test_stopAllClosesTimerTree(self):
+        master = codeTiming.MasterTimer.getMasterTimer()
+        master.enterNode("open")
+        time.sleep(0.01)
+        master.stopAll()
+
+        root = master.trees[threading.current_thread().name]
+        self.assertEqual(root.children["open"].count, 1)
+        self.assertGreater(root.children["open"].time, 0.0)
+
+        # frozen timers do not grow the tree
+        master.enterNode("late")
+        self.assertNotIn("late", root.children)
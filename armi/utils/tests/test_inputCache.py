@@ -0,0 +1,95 @@
+# Copyright 2026 TerraPower, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests of the parsed input cache."""
+
+import os
+import unittest
+from unittest import mock
+
+from armi import settings
+from armi.reactor import blueprints
+from armi.settings import settingsIO
+from armi.tests import TEST_ROOT
+from armi.utils import directoryChangers, inputCache
+
+
+class TestInputCache(unittest.TestCase):
+    def setUp(self):
+        self.td = directoryChangers.TemporaryDirectoryChanger()
+        self.td.__enter__()
+        patcher = mock.patch.object(inputCache, "getDefaultCacheDir", return_value=os.path.abspath("cache"))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        self.td.__exit__(None, None, None)
+
+    def test_storeAndRetrieve(self):
+        self.assertIsNone(inputCache.retrieve("things", "a: 1"))
+        self.assertTrue(inputCache.store("things", "a: 1", {"a": 1}))
+        self.assertEqual(inputCache.retrieve("things", "a: 1"), {"a": 1})
+        self.assertIsNone(inputCache.retrieve("things", "a: 2"))
+        self.assertIsNone(inputCache.retrieve("otherThings", "a: 1"))
+        self.assertNotEqual(inputCache.getKey("things", "a: 1"), inputCache.getKey("things", "a: 2"))
+
+        # unpicklable objects are not stored, and broken entries are deleted
+        self.assertFalse(inputCache.store("things", "a: 3", lambda: 3))
+        self.assertEqual(os.listdir(os.path.join("cache", "things")), [inputCache.getKey("things", "a: 1") + ".pkl"])
+        with open(inputCache._getEntryPath("things", "a: 1", None), "wb") as f:
+            f.write(b"broken")
+        self.assertIsNone(inputCache.retrieve("things", "a: 1"))
+        self.assertEqual(os.listdir(os.path.join("cache", "things")), [])
+
+        inputCache.clear()
+        self.assertFalse(os.path.exists("cache"))
+
+    def test_settings(self):
+        text = "settings:\n  inputCache: true\n  nCycles: 7\n  power: 1.0e+8\n"
+        with open("cached.yaml", "w") as f:
+            f.write(text)
+
+        cs = settings.Settings("cached.yaml")
+        self.assertIsNotNone(inputCache.retrieve("settings", text))
+
+        with mock.patch.object(settingsIO.SettingsReader, "_parseYaml", side_effect=AssertionError):
+            cached = settings.Settings("cached.yaml")
+        for name in ("inputCache", "nCycles", "power"):
+            self.assertEqual(cached[name], cs[name])
+        self.assertEqual(cached.path, cs.path)
+
+        # files that do not turn on the cache are not cached
+        with open("uncached.yaml", "w") as f:
+            f.write("settings:\n  nCycles: 7\n")
+        settings.Settings("uncached.yaml")
+        self.assertEqual(len(os.listdir(os.path.join("cache", "settings"))), 1)
+
+    def test_blueprints(self):
+        cs = settings.Settings(os.path.join(TEST_ROOT, "armiRun.yaml"))
+        cs = cs.modified(newSettings={"inputCache": True})
+        bp = blueprints.loadFromCs(cs)
+        self.assertEqual(len(os.listdir(os.path.join("cache", "blueprints"))), 1)
+
+        with mock.patch.object(blueprints.Blueprints, "load", side_effect=AssertionError):
+            cached = blueprints.loadFromCs(cs)
+            # round trip loads are never cached
+            with self.assertRaises(AssertionError):
+                blueprints.loadFromCs(cs, roundTrip=True)
+
+        self.assertIsNot(cached, bp)
+        self.assertEqual(list(cached.blockDesigns.keys()), list(bp.blockDesigns.keys()))
+        self.assertEqual(list(cached.assemDesigns.keys()), list(bp.assemDesigns.keys()))
+        self.assertEqual(list(cached.gridDesigns.keys()), list(bp.gridDesigns.keys()))
+
+        # the cached blueprints can build a reactor
+        self.assertEqual(cached.constructAssem(cs, name="igniter fuel").getType(), "igniter fuel")
@@ -16,9 +16,12 @@
 
 import os
 import unittest
+from unittest import mock
 
 import matplotlib.pyplot as plt
 import numpy as np
+from matplotlib.collections import PolyCollection
+from numpy.testing import assert_allclose
 
 from armi import settings
 from armi.nuclearDataIO.cccc import isotxs
@@ -53,6 +56,42 @@ class TestPlotting(unittest.TestCase):
             fName = plotting.plotBlockDepthMap(self.r.core, param="percentBu", fName="depthMapPlot.png", depthIndex=2)
             self._checkFileExists(fName)
 
+    def test_plotVectorizedMaps(self):
+        with TemporaryDirectoryChanger():
+            for i, b in enumerate(self.o.r.core.iterBlocks()):
+                b.p.percentBu = i / 100
+            fName = plotting.plotBlockDepthMap(
+                self.r.core, param="percentBu", fName="depthMapPlot.png", depthIndex=2, vectorized=True
+            )
+            self._checkFileExists(fName)
+
+            fName = plotting.plotFaceMap(
+                self.r.core, param="percentBu", fName="faceMap.png", makeColorBar=True, vectorized=True
+            )
+            self._checkFileExists(fName)
+
+    def test_setPlotValLabels(self):
+        fig, ax = plt.subplots()
+        vertices = np.array([[[0.0, 0.0], [1.0, 0.0], [1.0, 1.0], [0.0, 1.0]]] * 3) + np.arange(3)[:, None, None]
+        collection = PolyCollection(vertices, cmap="jet")
+        collection.norm.autoscale([0.0, 2.0])
+        texts = []
+        plotting._setPlotValLabels(ax, texts, vertices, [0.0, 1.0, 2.0], ["A", None, None], None, 8, collection)
+        self.assertEqual(len(texts), 1)
+        labels = texts[0]
+        assert_allclose(labels.get_offsets(), [[0.5, 0.5], [1.5, 1.5], [2.5, 2.5]])
+
+        # only the first label is written, centered on its assembly
+        paths = labels.get_paths()
+        self.assertEqual(len(paths), 3)
+        self.assertGreater(len(paths[0].vertices), 0)
+        assert_allclose(paths[0].vertices.min(axis=0), -paths[0].vertices.max(axis=0))
+        self.assertEqual(len(paths[1].vertices), 0)
+
+        # low values are dark in the jet colormap, so they get white text
+        assert_allclose(labels.get_facecolors()[0], (1.0, 1.0, 1.0, 1.0))
+        plt.close(fig)
+
     def test_plotAssemblyTypes(self):
         with TemporaryDirectoryChanger():
             plotPath = "coreAssemblyTypes1.png"
@@ -189,3 +228,24 @@ class TestPatches(unittest.TestCase):
         # is not important here.
         vertices = patches[0].get_verts()
         self.assertEqual(len(vertices), 5)
+
+    def test_getAssemVertices(self):
+        for inputFileName in ("armiRun.yaml", "smallestTestReactor/armiRunSmallest.yaml", "refTestCartesian.yaml"):
+            _, r = test_reactors.loadTestReactor(inputFileName=inputFileName)
+            patches = plotting._makeAssemPatches(r.core)
+            vertices = plotting._getAssemVertices(r.core)
+            # patch paths are closed, so they repeat the first vertex
+            expected = [patch.get_verts()[:-1] for patch in patches]
+            assert_allclose(vertices, expected, atol=1e-10)
+
+            # the vertices are cached for the same core geometry, without computing the centers again
+            with mock.patch.object(type(r.core.spatialGrid), "getManyCoordinates", side_effect=AssertionError):
+                self.assertIs(plotting._getAssemVertices(r.core), vertices)
+
+        # moving an assembly changes the key
+        a1 = r.core.getFirstAssembly()
+        loc = r.core.spatialGrid[5, 5, 0]
+        a1.moveTo(loc)
+        moved = plotting._getAssemVertices(r.core)
+        self.assertIsNot(moved, vertices)
+        assert_allclose(moved[0].mean(axis=0), loc.getGlobalCoordinates()[:2], atol=1e-10)
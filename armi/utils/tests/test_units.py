@@ -15,6 +15,8 @@
 
 import unittest
 
+import numpy as np
+
 from armi.utils import units
 
 
@@ -49,6 +51,12 @@ class TestUnits(unittest.TestCase):
         with self.assertRaisesRegex(ValueError, "Tc=0 and Tk=200"):
             units.getTk(Tc=0, Tk=200)
 
+    def test_getTkArray(self):
+        np.testing.assert_allclose(units.getTk(Tc=np.array([0, 100])), [273.15, 373.15])
+        temps = units.getTk(Tk=np.array([300, 400]))
+        self.assertEqual(temps.dtype, float)
+        np.testing.assert_allclose(units.getTc(Tk=temps), [26.85, 126.85])
+
     def test_getTf(self):
         # 0 C = 32 F
         self.assertAlmostEqual(units.getTf(Tc=0), 32.0)
@@ -15,6 +15,7 @@
 
 import math
 
+import numpy as np
 import scipy.constants
 
 # Units (misc)
@@ -143,17 +144,17 @@ def getTk(Tc=None, Tk=None):
 
     Returns
     -------
-    T : float
-        temperature in Kelvin
+    T : float or numpy array
+        temperature in Kelvin, as an array of floats if an array was provided
 
     Raises
     ------
     TypeError
-        The temperature was not provided as an int or float.
+        The temperature was not provided as an int, float, or numpy array.
     """
     if not ((Tc is not None) ^ (Tk is not None)):
         raise ValueError(f"Cannot produce T in K from Tc={Tc} and Tk={Tk}. Please supply a single temperature.")
-    return float(Tk) if Tk is not None else Tc + C_TO_K
+    return _asFloat(Tk) if Tk is not None else Tc + C_TO_K
 
 
 def getTc(Tc=None, Tk=None):
@@ -162,17 +163,22 @@ def getTc(Tc=None, Tk=None):
 
     Returns
     -------
-    T : float
-        temperature in Celsius
+    T : float or numpy array
+        temperature in Celsius, as an array of floats if an array was provided
 
     Raises
     ------
     TypeError
-        The temperature was not provided as an int or float.
+        The temperature was not provided as an int, float, or numpy array.
     """
     if not ((Tc is not None) ^ (Tk is not None)):
         raise ValueError(f"Cannot produce T in C from Tc={Tc} and Tk={Tk}. Please supply a single temperature.")
-    return float(Tc) if Tc is not None else Tk - C_TO_K
+    return _asFloat(Tc) if Tc is not None else Tk - C_TO_K
+
+
+def _asFloat(T):
+    """Convert a temperature to a float, or an array of temperatures to an array of floats."""
+    return T.astype(float) if isinstance(T, np.ndarray) else float(T)
 
 
 def getTf(Tc=None, Tk=None):